@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+수락 제어 모듈
+적응형 동시 실행 한도와 우선순위 대기열로 과부하 시 초과 요청을 빠르게 거절(429)하는 기능 제공
+
+- AdaptiveLimit: 지연 시간 기울기 기반 한도 조정 (장기 평균 대비 최근 지연이 늘면 한도 축소, 줄면 확대)
+- AdmissionPool: 한도를 넘는 요청은 최대 max_queue개까지 우선순위 순으로 대기, 가득 차면 가장 낮은 우선순위부터 거절
+- 풀마다 독립적인 한도/대기열 (대화형 검색과 대량 작업이 서로의 한도를 소진하지 않음)
+- 서비스마다 같은 파일을 둠 (서비스별 Docker 빌드 컨텍스트, 수정 시 모든 사본을 함께 변경해야 하며 search-api/tests/test_module_copies.py에서 검사)
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+from typing import Any, Dict, List, Optional
+
+# 우선순위 (작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 1
+PRIORITY_BACKGROUND = 2
+
+PRIORITY_NAMES = {"interactive": PRIORITY_INTERACTIVE, "bulk": PRIORITY_BULK, "background": PRIORITY_BACKGROUND}
+
+def parse_priority(value: Optional[str], default: int = PRIORITY_INTERACTIVE) -> int:
+    """우선순위 헤더 값 (interactive, bulk, background, 알 수 없으면 기본값)"""
+    if not value:
+        return default
+    return PRIORITY_NAMES.get(value.strip().lower(), default)
+
+class AdmissionRejected(Exception):
+    """수락 거절 (대기열 초과 또는 대기 시간 초과)"""
+
+    def __init__(self, pool: str, reason: str, retry_after: float):
+        super().__init__(f"{pool} 요청 거절: {reason}")
+        self.pool = pool
+        self.reason = reason
+        self.retry_after = retry_after
+
+class AdaptiveLimit:
+    """지연 시간 기울기 기반 동시 실행 한도 (gradient 방식)
+
+    gradient = tolerance x 장기 평균 지연 / 최근 지연 (0.5~1.0)
+    새 한도 = 한도 x gradient + sqrt(한도)  (대기열 여유분), smoothing 비율로 반영
+    과부하 신호(drop)가 오면 한도를 backoff 비율로 즉시 축소
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        smoothing: float = 0.2,
+        tolerance: float = 1.5,
+        long_window: int = 100,
+        backoff: float = 0.9
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.smoothing = smoothing
+        self.tolerance = tolerance
+        self.long_alpha = 2.0 / (long_window + 1)
+        self.backoff = backoff
+        self.long_rtt: Optional[float] = None
+        self.last_rtt: Optional[float] = None
+
+    def update(self, rtt: float, in_flight: int, dropped: bool = False):
+        """요청 한 건의 지연 시간(초)으로 한도 갱신"""
+        if dropped:
+            self.limit = max(self.min_limit, self.limit * self.backoff)
+            return
+        if rtt <= 0:
+            return
+        self.last_rtt = rtt
+        if self.long_rtt is None:
+            self.long_rtt = rtt
+            return
+        self.long_rtt += self.long_alpha * (rtt - self.long_rtt)
+        gradient = max(0.5, min(1.0, self.tolerance * self.long_rtt / rtt))
+        new_limit = self.limit * gradient + math.sqrt(self.limit)
+        # 한도의 절반도 쓰지 않는 동안에는 한도를 키우지 않음 (축소는 항상 반영)
+        if new_limit > self.limit and in_flight < self.limit / 2:
+            return
+        self.limit = self.limit * (1 - self.smoothing) + new_limit * self.smoothing
+        self.limit = max(self.min_limit, min(self.max_limit, self.limit))
+
+    def current(self) -> int:
+        """현재 정수 한도"""
+        return max(self.min_limit, int(self.limit))
+
+class AdmissionPool:
+    """적응형 한도 + 우선순위 대기열 기반 수락 제어 (단일 이벤트 루프 내에서 사용)"""
+
+    def __init__(
+        self,
+        name: str,
+        limit: AdaptiveLimit,
+        max_queue: int = 100,
+        max_wait_seconds: float = 1.0
+    ):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self.in_flight = 0
+        # (우선순위, 순번, future) 최소 힙
+        self.queue: List[Any] = []
+        self._sequence = itertools.count()
+        self.stats = {"admitted": 0, "queued": 0, "rejected": 0, "evicted": 0, "timed_out": 0}
+
+    def retry_after(self) -> float:
+        """재시도 권장 시간 (초, 대기열을 한도만큼씩 처리하는 데 걸리는 추정 시간)"""
+        rtt = self.limit.long_rtt or 1.0
+        batches = (len(self.queue) + self.in_flight) / self.limit.current()
+        return max(1.0, math.ceil(batches * rtt))
+
+    def _reject(self, reason: str) -> AdmissionRejected:
+        self.stats["rejected"] += 1
+        return AdmissionRejected(self.name, reason, self.retry_after())
+
+    def _wake(self):
+        """한도 여유만큼 대기 중인 요청을 우선순위 순으로 수락"""
+        while self.queue and self.in_flight < self.limit.current():
+            _, _, future = heapq.heappop(self.queue)
+            if future.done():
+                continue
+            self.in_flight += 1
+            future.set_result(True)
+
+    async def acquire(self, priority: int = PRIORITY_INTERACTIVE, timeout: Optional[float] = None):
+        """실행 슬롯 확보 (즉시 또는 대기 후), 실패 시 AdmissionRejected"""
+        if self.in_flight < self.limit.current() and not self.queue:
+            self.in_flight += 1
+            self.stats["admitted"] += 1
+            return
+
+        if len(self.queue) >= self.max_queue:
+            # 대기열이 가득 차면 가장 낮은 우선순위(가장 늦게 들어온) 요청과 비교해 밀어냄
+            worst = max(self.queue)
+            if worst[0] <= priority:
+                raise self._reject("대기열 초과")
+            self.queue.remove(worst)
+            heapq.heapify(self.queue)
+            self.stats["evicted"] += 1
+            worst[2].set_exception(self._reject("우선순위가 높은 요청에 밀림"))
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._sequence), future)
+        heapq.heappush(self.queue, entry)
+        self.stats["queued"] += 1
+        wait_seconds = self.max_wait_seconds if timeout is None else min(self.max_wait_seconds, timeout)
+        try:
+            await asyncio.wait_for(asyncio.shield(future), max(0.0, wait_seconds))
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # 시간 초과와 동시에 수락된 경우
+                self.stats["admitted"] += 1
+                return
+            if entry in self.queue:
+                self.queue.remove(entry)
+                heapq.heapify(self.queue)
+            self.stats["timed_out"] += 1
+            raise self._reject("대기 시간 초과")
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                self.release(0.0, sample=False)
+            elif entry in self.queue:
+                self.queue.remove(entry)
+                heapq.heapify(self.queue)
+            raise
+        self.stats["admitted"] += 1
+
+    def release(self, rtt: float, dropped: bool = False, sample: bool = True):
+        """슬롯 반환 및 지연 시간 반영"""
+        if sample or dropped:
+            self.limit.update(rtt, self.in_flight, dropped)
+        self.in_flight = max(0, self.in_flight - 1)
+        self._wake()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """풀 상태"""
+        return dict(
+            self.stats,
+            limit=self.limit.current(),
+            in_flight=self.in_flight,
+            queued_now=len(self.queue),
+            max_queue=self.max_queue,
+            long_rtt_ms=round(self.limit.long_rtt * 1000, 1) if self.limit.long_rtt else None
+        )
@@ -7,20 +7,26 @@
 import os
 import json
 import asyncio
+import hashlib
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from datetime import datetime
 
 import boto3
 import numpy as np
 import redis
 import uvicorn
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
 from confluent_kafka import Producer, Consumer, KafkaError
 from loguru import logger
 from asyncio_throttle import Throttler
 
+from admission import AdaptiveLimit, AdmissionPool, AdmissionRejected, parse_priority
+from health_monitor import HealthMonitor
+from pipeline_metrics import PipelineStats, stage_timestamps
+import tracing
+
 # 설정
 KAFKA_BOOTSTRAP_SERVERS = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
@@ -28,6 +34,26 @@ REDIS_ENDPOINT = os.getenv("REDIS_ENDPOINT", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "ragpassword")
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "amazon.titan-embed-text-v1")
+INCREMENTAL_INDEXING = os.getenv("INCREMENTAL_INDEXING", "true").lower() == "true"
+# 청크 해시에서 제외할 메타데이터 필드 (인덱싱 서비스와 같은 값이어야 함)
+CHUNK_HASH_IGNORED_METADATA_FIELDS = frozenset(
+    field.strip()
+    for field in os.getenv(
+        "CHUNK_HASH_IGNORED_METADATA_FIELDS",
+        "uploaded_at,ingested_at,indexed_at,timestamp,upload_id,ingest_id,request_id"
+    ).split(",")
+    if field.strip()
+)
+KAFKA_STATS_INTERVAL_MS = int(os.getenv("KAFKA_STATS_INTERVAL_MS", "5000"))
+HEALTH_CHECK_INTERVAL = int(os.getenv("HEALTH_CHECK_INTERVAL", "30"))
+HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", "5"))
+# /generate 수락 제어 (백그라운드 처리가 끝날 때까지 슬롯 점유, 한도는 청크당 처리 시간에 따라 자동 조정)
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+PRIORITY_HEADER = os.getenv("PRIORITY_HEADER", "X-Request-Priority")
+GENERATE_CONCURRENCY_INITIAL = int(os.getenv("GENERATE_CONCURRENCY_INITIAL", "4"))
+GENERATE_CONCURRENCY_MAX = int(os.getenv("GENERATE_CONCURRENCY_MAX", "16"))
+GENERATE_QUEUE_SIZE = int(os.getenv("GENERATE_QUEUE_SIZE", "50"))
+GENERATE_QUEUE_WAIT_MS = float(os.getenv("GENERATE_QUEUE_WAIT_MS", "1000"))
 SERVICE_NAME = "embedding-generator-service"
 SERVICE_VERSION = "1.0.0"
 
@@ -55,9 +81,28 @@ kafka_producer = Producer({
     'client.id': f'{SERVICE_NAME}-producer'
 })
 
+# 컨슈머 랙, 처리 중 문서, 대기/처리 시간 통계
+pipeline_stats = PipelineStats()
+
 # Bedrock API 스로틀링 (분당 100회 제한)
 bedrock_throttler = Throttler(rate_limit=100, period=60)
 
+# 의존성 상태 (백그라운드 점검 결과를 캐시, 프로브는 캐시만 조회)
+health_monitor = HealthMonitor(HEALTH_CHECK_INTERVAL, HEALTH_CHECK_TIMEOUT)
+
+# /generate 수락 제어 풀 (대기열이 가득 차면 429, 대량 요청은 대화형 요청에 밀림)
+generate_admission = AdmissionPool(
+    "generate",
+    AdaptiveLimit(initial_limit=GENERATE_CONCURRENCY_INITIAL, max_limit=GENERATE_CONCURRENCY_MAX),
+    max_queue=GENERATE_QUEUE_SIZE,
+    max_wait_seconds=GENERATE_QUEUE_WAIT_MS / 1000
+) if ADMISSION_ENABLED else None
+if generate_admission:
+    health_monitor.add_state("admission", generate_admission.snapshot)
+
+# 실행 중인 /generate 작업 (태스크 참조 유지)
+admitted_jobs: Set[asyncio.Task] = set()
+
 # 데이터 모델
 class EmbeddingRequest(BaseModel):
     chunks: List[str]
@@ -78,29 +123,46 @@ class HealthResponse(BaseModel):
     timestamp: str
     bedrock_status: str
     redis_status: str
+    checks: Dict[str, Any] = {}
+
+async def check_redis() -> Dict[str, Any]:
+    """Redis 연결 점검"""
+    await asyncio.to_thread(redis_client.ping)
+    return {}
+
+health_monitor.add_check("redis", check_redis)
+# Bedrock은 점검 호출도 과금되므로 실제 임베딩 생성 결과로만 상태 갱신
+health_monitor.add_passive("bedrock")
+
+# 프로브 엔드포인트 (의존성을 직접 호출하지 않고 캐시된 상태만 반환)
+@app.get("/livez")
+async def liveness_probe(response: Response):
+    """활성 프로브 (이벤트 루프가 응답하고 점검 루프가 멈추지 않았는지)"""
+    if not health_monitor.is_live():
+        response.status_code = 503
+        return {"status": "stalled", "last_check_at": health_monitor.last_run_at}
+    return {"status": "ok"}
+
+@app.get("/readyz")
+async def readiness_probe(response: Response):
+    """준비 프로브 (필수 의존성 상태)"""
+    reasons = health_monitor.not_ready_reasons()
+    if reasons:
+        response.status_code = 503
+    return {
+        "status": "not_ready" if reasons else "ready",
+        "reasons": reasons,
+        "dependencies": {name: health_monitor.status(name) for name in health_monitor.results}
+    }
 
 # 헬스체크 엔드포인트
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
-    """서비스 헬스체크"""
-    # Bedrock 연결 확인
-    bedrock_status = "healthy"
-    try:
-        # 간단한 임베딩 테스트
-        test_response = await generate_embedding("health check")
-        if not test_response:
-            bedrock_status = "unhealthy"
-    except Exception:
-        bedrock_status = "unhealthy"
-    
-    # Redis 연결 확인
-    redis_status = "healthy"
-    try:
-        redis_client.ping()
-    except Exception:
-        redis_status = "unhealthy"
+    """서비스 헬스체크 (캐시된 점검 결과 기준)"""
+    bedrock_status = health_monitor.status("bedrock")
+    redis_status = health_monitor.status("redis")
     
-    overall_status = "healthy" if bedrock_status == "healthy" and redis_status == "healthy" else "degraded"
+    overall_status = "healthy" if bedrock_status in ("healthy", "unknown") and redis_status == "healthy" else "degraded"
     
     return HealthResponse(
         service=SERVICE_NAME,
@@ -108,7 +170,8 @@ async def health_check():
         status=overall_status,
         timestamp=datetime.utcnow().isoformat(),
         bedrock_status=bedrock_status,
-        redis_status=redis_status
+        redis_status=redis_status,
+        checks=health_monitor.snapshot()
     )
 
 # 메트릭 엔드포인트
@@ -131,7 +194,9 @@ async def get_metrics():
             "cache_hit_rate_percent": f"{cache_hit_rate:.2f}",
             "cache_hits": int(cache_hits),
             "cache_misses": int(cache_misses),
-            "bedrock_throttler_remaining": bedrock_throttler.remaining
+            "bedrock_throttler_remaining": bedrock_throttler.remaining,
+            "pipeline": pipeline_stats.snapshot(),
+            "admission": generate_admission.snapshot() if generate_admission else None
         }
     except Exception as e:
         logger.error(f"메트릭 조회 오류: {e}")
@@ -140,12 +205,13 @@ async def get_metrics():
 async def generate_embedding(text: str) -> Optional[List[float]]:
     """단일 텍스트에 대한 임베딩 생성 (캐싱 포함)"""
     # 캐시 키 생성
-    import hashlib
     cache_key = f"embedding:{hashlib.md5(text.encode()).hexdigest()}"
     
     # 캐시에서 확인
     try:
-        cached_embedding = redis_client.get(cache_key)
+        with tracing.start_span("embedding.cache_lookup") as span:
+            cached_embedding = redis_client.get(cache_key)
+            tracing.set_attributes(span, cache_hit=bool(cached_embedding))
         if cached_embedding:
             redis_client.incr("embedding_cache_hits")
             return json.loads(cached_embedding)
@@ -159,19 +225,21 @@ async def generate_embedding(text: str) -> Optional[List[float]]:
         try:
             payload = {"inputText": text[:4000]}  # 토큰 제한
             
-            response = bedrock.invoke_model(
-                modelId=EMBEDDING_MODEL,
-                contentType="application/json",
-                accept="application/json",
-                body=json.dumps(payload).encode("utf-8"),
-            )
-            
-            result = json.loads(response["body"].read())
+            with tracing.start_span("bedrock.invoke_model", kind="client", model=EMBEDDING_MODEL):
+                response = bedrock.invoke_model(
+                    modelId=EMBEDDING_MODEL,
+                    contentType="application/json",
+                    accept="application/json",
+                    body=json.dumps(payload).encode("utf-8"),
+                )
+                result = json.loads(response["body"].read())
             embedding = result.get("embedding") or result.get("vector")
             
             if not embedding:
                 logger.error("임베딩 응답에서 벡터를 찾을 수 없음")
+                health_monitor.record_outcome("bedrock", False, "임베딩 응답에 벡터 없음")
                 return None
+            health_monitor.record_outcome("bedrock", True)
             
             # 차원 검증
             if len(embedding) != 1536:
@@ -191,54 +259,93 @@ async def generate_embedding(text: str) -> Optional[List[float]]:
             
         except Exception as e:
             logger.error(f"Bedrock 임베딩 생성 오류: {e}")
+            health_monitor.record_outcome("bedrock", False, str(e))
             return None
 
-async def generate_embeddings_batch(chunks: List[str], doc_id: str) -> List[Dict[str, Any]]:
-    """배치 임베딩 생성"""
+def chunk_content_hash(chunk_text: str, metadata: Optional[Dict] = None) -> str:
+    """청크 콘텐츠 해시 (인덱싱 서비스 매니페스트와 동일한 규칙, 메타데이터는 제외 필드 외 전부 포함)"""
+    hashed_metadata = {
+        field: value for field, value in (metadata or {}).items() if field not in CHUNK_HASH_IGNORED_METADATA_FIELDS
+    }
+    payload = json.dumps(
+        {"text": chunk_text, "metadata": hashed_metadata},
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def find_changed_chunks(doc_id: str, chunk_hashes: List[str]) -> List[int]:
+    """인덱싱된 매니페스트와 해시가 다른 청크 인덱스 목록"""
+    try:
+        manifest_data = redis_client.get(f"doc_manifest:{doc_id}")
+    except Exception as e:
+        logger.warning(f"청크 매니페스트 조회 실패, 전체 임베딩 생성: {doc_id} - {e}")
+        return list(range(len(chunk_hashes)))
+    
+    indexed_chunks = json.loads(manifest_data)["chunks"] if manifest_data else {}
+    return [
+        i for i, chunk_hash in enumerate(chunk_hashes)
+        if indexed_chunks.get(str(i), {}).get("hash") != chunk_hash
+    ]
+
+async def generate_embeddings_batch(
+    chunks: List[str],
+    doc_id: str,
+    chunk_indices: Optional[List[int]] = None
+) -> List[Dict[str, Any]]:
+    """배치 임베딩 생성 (chunk_indices 지정 시 해당 청크만)"""
     embeddings = []
+    if chunk_indices is None:
+        chunk_indices = list(range(len(chunks)))
     
-    logger.info(f"배치 임베딩 생성 시작: {doc_id}, 청크 수: {len(chunks)}")
+    logger.info(f"배치 임베딩 생성 시작: {doc_id}, 청크 수: {len(chunk_indices)}/{len(chunks)}")
     
-    for i, chunk in enumerate(chunks):
-        try:
-            embedding = await generate_embedding(chunk.strip())
-            
-            if embedding:
-                embeddings.append({
-                    "chunk_index": i,
-                    "chunk_text": chunk,
-                    "embedding": embedding,
-                    "embedding_dimension": len(embedding)
-                })
-                logger.debug(f"임베딩 생성 완료: {doc_id} - 청크 {i+1}/{len(chunks)}")
-            else:
-                logger.error(f"임베딩 생성 실패: {doc_id} - 청크 {i+1}")
+    with tracing.start_span("embedding.batch", doc_id=doc_id, chunks=len(chunk_indices)) as span:
+        for i in chunk_indices:
+            chunk = chunks[i]
+            try:
+                embedding = await generate_embedding(chunk.strip())
                 
-        except Exception as e:
-            logger.error(f"청크 임베딩 처리 오류: {doc_id} - 청크 {i+1} - {e}")
+                if embedding:
+                    embeddings.append({
+                        "chunk_index": i,
+                        "chunk_text": chunk,
+                        "embedding": embedding,
+                        "embedding_dimension": len(embedding)
+                    })
+                    logger.debug(f"임베딩 생성 완료: {doc_id} - 청크 {i+1}/{len(chunks)}")
+                else:
+                    logger.error(f"임베딩 생성 실패: {doc_id} - 청크 {i+1}")
+                    
+            except Exception as e:
+                logger.error(f"청크 임베딩 처리 오류: {doc_id} - 청크 {i+1} - {e}")
+        
+        tracing.set_attributes(span, embedded=len(embeddings))
     
-    logger.info(f"배치 임베딩 완료: {doc_id}, 성공: {len(embeddings)}/{len(chunks)}")
+    logger.info(f"배치 임베딩 완료: {doc_id}, 성공: {len(embeddings)}/{len(chunk_indices)}")
     return embeddings
 
 # 메인 임베딩 생성 엔드포인트
 @app.post("/generate", response_model=EmbeddingResponse)
-async def generate_embeddings_endpoint(
-    request: EmbeddingRequest,
-    background_tasks: BackgroundTasks
-):
-    """텍스트 청크들에 대한 임베딩 생성"""
+async def generate_embeddings_endpoint(request: EmbeddingRequest, http_request: Request):
+    """텍스트 청크들에 대한 임베딩 생성 (처리 중 요청이 한도를 넘으면 대기 후 429)"""
     start_time = datetime.utcnow()
+    job = None
+    
+    if generate_admission:
+        try:
+            await generate_admission.acquire(parse_priority(http_request.headers.get(PRIORITY_HEADER)))
+        except AdmissionRejected as e:
+            logger.warning(f"임베딩 생성 요청 거절: {request.doc_id} - {e}")
+            raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(int(e.retry_after))})
     
     try:
         logger.info(f"임베딩 생성 요청: {request.doc_id}, 청크 수: {len(request.chunks)}")
         
-        # 백그라운드에서 처리
-        background_tasks.add_task(
-            process_embeddings_async,
-            request.chunks,
-            request.doc_id,
-            request.metadata
-        )
+        # 응답 전송과 무관하게 바로 처리 시작 (응답 생성/전송이 실패해도 작업 종료 시 수락 슬롯 반환)
+        job = asyncio.create_task(process_admitted_embeddings(request.chunks, request.doc_id, request.metadata))
+        admitted_jobs.add(job)
+        job.add_done_callback(admitted_jobs.discard)
         
         processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
         
@@ -252,6 +359,9 @@ async def generate_embeddings_endpoint(
         
     except Exception as e:
         logger.error(f"임베딩 생성 오류: {request.doc_id} - {str(e)}")
+        if generate_admission and job is None:
+            # 작업을 시작하지 못함 (슬롯을 반환할 작업이 없음)
+            generate_admission.release(0.0, sample=False)
         processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
         
         return EmbeddingResponse(
@@ -262,71 +372,101 @@ async def generate_embeddings_endpoint(
             message=f"처리 중 오류 발생: {str(e)}"
         )
 
+async def process_admitted_embeddings(chunks: List[str], doc_id: str, metadata: Dict):
+    """수락된 /generate 요청 처리 (청크당 처리 시간으로 동시 실행 한도 조정)"""
+    started = time.monotonic()
+    dropped = True
+    try:
+        await process_embeddings_async(chunks, doc_id, metadata)
+        dropped = False
+    finally:
+        if generate_admission:
+            generate_admission.release((time.monotonic() - started) / max(1, len(chunks)), dropped)
+
 async def process_embeddings_async(
     chunks: List[str],
     doc_id: str,
-    metadata: Dict
+    metadata: Dict,
+    timestamps: Optional[Dict[str, str]] = None
 ):
-    """비동기 임베딩 처리"""
-    try:
-        start_time = time.time()
-        
-        # 배치 임베딩 생성
-        embeddings = await generate_embeddings_batch(chunks, doc_id)
-        
-        processing_time = int((time.time() - start_time) * 1000)
-        
-        if embeddings:
-            # Kafka로 결과 전송
-            kafka_message = {
-                "doc_id": doc_id,
-                "embeddings": embeddings,
-                "embeddings_count": len(embeddings),
-                "total_chunks": len(chunks),
-                "success_rate": len(embeddings) / len(chunks) * 100,
-                "processing_time_ms": processing_time,
-                "metadata": metadata,
-                "generated_at": datetime.utcnow().isoformat(),
-                "service": SERVICE_NAME,
-                "service_version": SERVICE_VERSION,
-                "embedding_model": EMBEDDING_MODEL,
-                "embedding_dimension": 1536
-            }
+    """비동기 임베딩 처리 (timestamps: 이전 단계 이벤트 시각, 다음 단계로 전달)"""
+    with pipeline_stats.track():
+        try:
+            start_time = time.time()
             
-            # embeddings-generated 토픽으로 전송
-            kafka_producer.produce(
-                topic='embeddings-generated',
-                key=doc_id,
-                value=json.dumps(kafka_message, ensure_ascii=False)
+            # 증분 모드: 이미 인덱싱된 것과 해시가 같은 청크는 임베딩 생략
+            chunk_hashes = [chunk_content_hash(chunk, metadata) for chunk in chunks]
+            changed_indices = (
+                find_changed_chunks(doc_id, chunk_hashes) if INCREMENTAL_INDEXING
+                else list(range(len(chunks)))
             )
             
-            kafka_producer.flush()
-            
-            logger.info(f"임베딩 완료 및 Kafka 전송: {doc_id} - {len(embeddings)}개 임베딩")
+            # 배치 임베딩 생성
+            embeddings = await generate_embeddings_batch(chunks, doc_id, changed_indices)
             
-        else:
-            logger.error(f"임베딩 생성 실패: {doc_id}")
+            processing_time = int((time.time() - start_time) * 1000)
             
-            # 에러를 Kafka 에러 토픽으로 전송
-            error_message = {
-                "doc_id": doc_id,
-                "error": "모든 청크의 임베딩 생성 실패",
-                "chunks_count": len(chunks),
-                "error_at": datetime.utcnow().isoformat(),
-                "service": SERVICE_NAME,
-                "service_version": SERVICE_VERSION
-            }
-            
-            kafka_producer.produce(
-                topic='processing-errors',
-                key=doc_id,
-                value=json.dumps(error_message, ensure_ascii=False)
-            )
-            
-            kafka_producer.flush()
-            
-    except Exception as e:
-        logger.error(f"임베딩 비동기 처리 실패: {doc_id} - {str(e)}")
+            if embeddings or not changed_indices:
+                # Kafka로 결과 전송 (변경된 청크가 없어도 제거된 청크 정리를 위해 전송)
+                kafka_message = {
+                    "doc_id": doc_id,
+                    "embeddings": embeddings,
+                    "embeddings_count": len(embeddings),
+                    "total_chunks": len(chunks),
+                    "chunk_hashes": chunk_hashes,
+                    "skipped_chunks": len(chunks) - len(changed_indices),
+                    "success_rate": len(embeddings) / len(changed_indices) * 100 if changed_indices else 100.0,
+                    "processing_time_ms": processing_time,
+                    "metadata": metadata,
+                    **(timestamps or {}),
+                    "generated_at": datetime.utcnow().isoformat(),
+                    "service": SERVICE_NAME,
+                    "service_version": SERVICE_VERSION,
+                    "embedding_model": EMBEDDING_MODEL,
+                    "embedding_dimension": 1536
+                }
+                
+                # embeddings-generated 토픽으로 전송 (트레이스 컨텍스트는 메시지 헤더로 전파)
+                kafka_producer.produce(
+                    topic='embeddings-generated',
+                    key=doc_id,
+                    value=json.dumps(kafka_message, ensure_ascii=False),
+                    headers=tracing.kafka_headers()
+                )
+                
+                kafka_producer.flush()
+                
+                logger.info(
+                    f"임베딩 완료 및 Kafka 전송: {doc_id} - {len(embeddings)}개 임베딩, "
+                    f"{len(chunks) - len(changed_indices)}개 청크 변경 없음"
+                )
+                
+            else:
+                logger.error(f"임베딩 생성 실패: {doc_id}")
+                pipeline_stats.record_failure()
+                
+                # 에러를 Kafka 에러 토픽으로 전송
+                error_message = {
+                    "doc_id": doc_id,
+                    "error": "모든 청크의 임베딩 생성 실패",
+                    "chunks_count": len(chunks),
+                    "error_at": datetime.utcnow().isoformat(),
+                    "service": SERVICE_NAME,
+                    "service_version": SERVICE_VERSION
+                }
+                
+                kafka_producer.produce(
+                    topic='processing-errors',
+                    key=doc_id,
+                    value=json.dumps(error_message, ensure_ascii=False),
+                    headers=tracing.kafka_headers()
+                )
+                
+                kafka_producer.flush()
+                
+        except Exception as e:
+            logger.error(f"임베딩 비동기 처리 실패: {doc_id} - {str(e)}")
+            pipeline_stats.record_failure()
 
 # Kafka 컨슈머 (텍스트 추출 완료 이벤트 수신)
 async def kafka_consumer_task():
@@ -334,7 +474,9 @@ async def kafka_consumer_task():
     consumer = Consumer({
         'bootstrap.servers': KAFKA_BOOTSTRAP_SERVERS,
         'group.id': 'embedding-generator-service-group',
-        'auto.offset.reset': 'latest'
+        'auto.offset.reset': 'latest',
+        'statistics.interval.ms': KAFKA_STATS_INTERVAL_MS,
+        'stats_cb': pipeline_stats.on_kafka_stats
     })
     
     consumer.subscribe(['text-extracted'])
@@ -360,12 +502,19 @@ async def kafka_consumer_task():
                 doc_id = event_data.get('doc_id')
                 chunks = event_data.get('chunks', [])
                 metadata = event_data.get('metadata', {})
+                pipeline_stats.record_queue_wait(msg)
                 
                 logger.info(f"텍스트 추출 완료 이벤트 수신: {doc_id}, 청크 수: {len(chunks)}")
                 
                 if chunks:
-                    # 비동기 임베딩 처리
-                    await process_embeddings_async(chunks, doc_id, metadata)
+                    # 비동기 임베딩 처리 (텍스트 추출 단계의 트레이스에 이어서 기록)
+                    with tracing.start_span(
+                        "kafka.consume text-extracted",
+                        parent=tracing.context_from_kafka(msg.headers()),
+                        kind="consumer",
+                        doc_id=doc_id
+                    ):
+                        await process_embeddings_async(chunks, doc_id, metadata, stage_timestamps(event_data))
                 else:
                     logger.warning(f"청크가 없음: {doc_id}")
                     
@@ -380,6 +529,7 @@ async def kafka_consumer_task():
 async def startup_event():
     """애플리케이션 시작 시 실행"""
     logger.info(f"{SERVICE_NAME} v{SERVICE_VERSION} 시작")
+    tracing.init_tracing(SERVICE_NAME, SERVICE_VERSION)
     
     # Redis 연결 테스트
     try:
@@ -388,6 +538,8 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Redis 연결 실패: {e}")
     
+    asyncio.create_task(health_monitor.loop())
+    
     # Kafka 컨슈머를 백그라운드 태스크로 실행
     asyncio.create_task(kafka_consumer_task())
 
@@ -396,6 +548,7 @@ async def shutdown_event():
     """애플리케이션 종료 시 실행"""
     logger.info(f"{SERVICE_NAME} 종료")
     kafka_producer.flush()
+    tracing.shutdown_tracing()
     try:
         redis_client.close()
     except Exception:
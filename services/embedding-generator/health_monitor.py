@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+헬스 모니터 모듈
+의존성 상태를 백그라운드에서 주기적으로 점검해 캐시하고 프로브(/livez, /readyz)는 캐시된 상태만 반환하는 기능 제공
+
+- 능동 점검(add_check): interval_seconds마다 동시 실행, 점검마다 timeout_seconds 제한
+- 수동 점검(record_outcome): 비용이 드는 의존성(Bedrock 등)은 실제 호출 결과로만 상태 갱신
+- 부가 상태(add_state): 서킷 브레이커 등 프로세스 내 상태를 스냅샷에 포함
+- 준비 상태: required=True인 의존성이 모두 healthy/degraded이고 추가 조건(add_gate)을 모두 만족할 때
+- 서비스마다 같은 파일을 둠 (서비스별 Docker 빌드 컨텍스트, 수정 시 모든 사본을 함께 변경해야 하며 search-api/tests/test_module_copies.py에서 검사)
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+class HealthMonitor:
+    """의존성 상태 캐시 및 주기 점검기"""
+
+    def __init__(self, interval_seconds: float = 30.0, timeout_seconds: float = 5.0):
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.checks: Dict[str, Callable[[], Awaitable[Optional[Dict[str, Any]]]]] = {}
+        self.required: Dict[str, bool] = {}
+        self.states: Dict[str, Callable[[], Any]] = {}
+        self.gates: Dict[str, Callable[[], bool]] = {}
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.last_run_at: Optional[float] = None
+
+    def add_check(self, name: str, check: Callable[[], Awaitable[Optional[Dict[str, Any]]]], required: bool = True):
+        """능동 점검 등록 (check는 상세 정보 dict를 반환하고 실패 시 예외, dict의 "status"로 degraded 표시 가능)"""
+        self.checks[name] = check
+        self.required[name] = required
+        self.results[name] = {"status": "unknown", "checked_at": None}
+
+    def add_passive(self, name: str, required: bool = False):
+        """수동 점검 의존성 등록 (record_outcome으로만 갱신)"""
+        self.required[name] = required
+        self.results[name] = {"status": "unknown", "checked_at": None}
+
+    def add_state(self, name: str, provider: Callable[[], Any]):
+        """스냅샷에 포함할 부가 상태 등록"""
+        self.states[name] = provider
+
+    def add_gate(self, name: str, gate: Callable[[], bool]):
+        """준비 상태 추가 조건 등록 (예: 캐시 예열 완료)"""
+        self.gates[name] = gate
+
+    def record_outcome(self, name: str, ok: bool, error: Optional[str] = None):
+        """실제 호출 결과로 의존성 상태 갱신"""
+        self.results[name] = {
+            "status": "healthy" if ok else "unhealthy",
+            "checked_at": time.time(),
+            "source": "traffic",
+            "error": error
+        }
+
+    async def run_check(self, name: str):
+        """점검 한 건 실행 (결과를 캐시에 기록)"""
+        started = time.perf_counter()
+        try:
+            details = await asyncio.wait_for(self.checks[name](), self.timeout_seconds) or {}
+            result = {"status": details.pop("status", "healthy"), **details}
+        except asyncio.TimeoutError:
+            result = {"status": "unhealthy", "error": f"{self.timeout_seconds}s 내 응답 없음"}
+        except Exception as e:
+            result = {"status": "unhealthy", "error": str(e)}
+        previous = self.results.get(name, {}).get("status")
+        if previous not in (None, "unknown", result["status"]):
+            logger.warning(f"의존성 상태 변경: {name} {previous} -> {result['status']}")
+        result.update(checked_at=time.time(), latency_ms=round((time.perf_counter() - started) * 1000, 1))
+        self.results[name] = result
+
+    async def run_checks(self):
+        """등록된 능동 점검 전체를 동시 실행"""
+        await asyncio.gather(*[self.run_check(name) for name in self.checks])
+        self.last_run_at = time.time()
+
+    async def loop(self):
+        """interval_seconds마다 점검 (첫 점검은 즉시)"""
+        while True:
+            try:
+                await self.run_checks()
+            except Exception as e:
+                logger.warning(f"헬스 점검 오류: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def status(self, name: str) -> str:
+        """의존성의 마지막 상태 (healthy, degraded, unhealthy, unknown)"""
+        return self.results.get(name, {}).get("status", "unknown")
+
+    def is_live(self) -> bool:
+        """점검 루프가 멈추지 않았는지 (이벤트 루프가 막히면 점검이 밀림)"""
+        if self.last_run_at is None:
+            return True
+        return time.time() - self.last_run_at < self.interval_seconds * 3 + self.timeout_seconds
+
+    def not_ready_reasons(self) -> Dict[str, str]:
+        """준비되지 않은 이유 (필수 의존성 상태 및 추가 조건)"""
+        reasons = {
+            name: self.status(name)
+            for name, required in self.required.items()
+            if required and self.status(name) not in ("healthy", "degraded")
+        }
+        for name, gate in self.gates.items():
+            if not gate():
+                reasons[name] = "pending"
+        return reasons
+
+    def snapshot(self) -> Dict[str, Any]:
+        """캐시된 의존성 상태와 부가 상태"""
+        snapshot: Dict[str, Any] = {
+            "dependencies": {name: dict(result, required=self.required[name]) for name, result in self.results.items()},
+            "last_run_at": self.last_run_at,
+            "interval_seconds": self.interval_seconds
+        }
+        for name, provider in self.states.items():
+            try:
+                snapshot[name] = provider()
+            except Exception as e:
+                snapshot[name] = {"error": str(e)}
+        return snapshot
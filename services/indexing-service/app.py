@@ -8,17 +8,57 @@ import os
 import json
 import asyncio
 import time
+import uuid
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 import redis
 import uvicorn
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
 from pydantic import BaseModel
 from confluent_kafka import Producer, Consumer, KafkaError
 from opensearchpy import OpenSearch, RequestsHttpConnection
 from loguru import logger
 
+from chunk_manifest import (
+    DEFAULT_HASH_IGNORED_METADATA_FIELDS,
+    manifest_key,
+    chunk_document_id,
+    chunk_content_hash,
+    diff_chunks
+)
+from index_aliases import (
+    write_alias_name,
+    physical_index_name,
+    next_index_version,
+    resolve_alias,
+    is_concrete_index,
+    build_initial_aliases,
+    build_write_alias_actions,
+    build_swap_actions,
+    build_reindex_script,
+    summarize_bulk_by_scroll_task
+)
+from partitioning import (
+    validate_strategy,
+    partition_index_pattern,
+    partition_index_name,
+    partition_key_for,
+    build_partition_template
+)
+from pipeline_metrics import PipelineStats, latency_summary, stage_latencies, stage_timestamps
+import tracing
+from vector_encoding import (
+    BYTE_SCALE,
+    build_index_body,
+    build_training_index_body,
+    build_pq_train_body,
+    encode_vector,
+    estimate_vector_memory_bytes,
+    normalize_vector,
+    validate_encoding
+)
+
 # 설정
 KAFKA_BOOTSTRAP_SERVERS = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
 OPENSEARCH_ENDPOINT = os.getenv("OPENSEARCH_ENDPOINT", "localhost:9200")
@@ -26,6 +66,38 @@ OPENSEARCH_INDEX = os.getenv("OPENSEARCH_INDEX", "enterprise-rag")
 REDIS_ENDPOINT = os.getenv("REDIS_ENDPOINT", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "ragpassword")
+VECTOR_ENCODING = validate_encoding(os.getenv("VECTOR_ENCODING", "float32"))
+KNN_SPACE_TYPE = os.getenv("KNN_SPACE_TYPE", "l2")
+PQ_MODEL_ID = os.getenv("PQ_MODEL_ID", f"{OPENSEARCH_INDEX}-pq")
+PQ_TRAINING_SAMPLE_SIZE = int(os.getenv("PQ_TRAINING_SAMPLE_SIZE", "10000"))
+PQ_TRAIN_TIMEOUT = float(os.getenv("PQ_TRAIN_TIMEOUT", "1800"))  # 모델 학습 대기 최대 시간 (초)
+ALIAS_REFRESH_SECONDS = int(os.getenv("ALIAS_REFRESH_SECONDS", "5"))
+REINDEX_REQUESTS_PER_SECOND = float(os.getenv("REINDEX_REQUESTS_PER_SECOND", "-1"))  # -1: 제한 없음
+REINDEX_POLL_SECONDS = int(os.getenv("REINDEX_POLL_SECONDS", "5"))
+PARTITION_STRATEGY = validate_strategy(os.getenv("PARTITION_STRATEGY", "none"))
+PARTITION_FIELD = os.getenv("PARTITION_FIELD", "tenant")
+PARTITION_TIME_FIELD = os.getenv("PARTITION_TIME_FIELD", "created_at")
+PARTITION_TIME_GRANULARITY = os.getenv("PARTITION_TIME_GRANULARITY", "month")
+PARTITION_SHARDS = int(os.getenv("PARTITION_SHARDS", "1"))
+INCREMENTAL_INDEXING = os.getenv("INCREMENTAL_INDEXING", "true").lower() == "true"
+# 청크 해시에서 제외할 메타데이터 필드 (임베딩 생성 서비스와 같은 값이어야 함)
+CHUNK_HASH_IGNORED_METADATA_FIELDS = frozenset(
+    field.strip()
+    for field in os.getenv(
+        "CHUNK_HASH_IGNORED_METADATA_FIELDS", ",".join(DEFAULT_HASH_IGNORED_METADATA_FIELDS)
+    ).split(",")
+    if field.strip()
+)
+PURGE_REQUESTS_PER_SECOND = float(os.getenv("PURGE_REQUESTS_PER_SECOND", "500"))
+PURGE_SCROLL_SIZE = int(os.getenv("PURGE_SCROLL_SIZE", "500"))
+PURGE_MAX_TRACKED_DOCS = int(os.getenv("PURGE_MAX_TRACKED_DOCS", "10000"))
+KAFKA_STATS_INTERVAL_MS = int(os.getenv("KAFKA_STATS_INTERVAL_MS", "5000"))
+PIPELINE_LATENCY_SAMPLES = int(os.getenv("PIPELINE_LATENCY_SAMPLES", "1000"))
+
+# 인덱스 세대 카운터 (검색 API가 결과 캐시 유효성 판단에 사용)
+INDEX_GENERATION_KEY = "index_generation"
+# 문서별 수집 -> 검색 가능 단계 지연 시간 (최근 PIPELINE_LATENCY_SAMPLES건, 레플리카 공유)
+PIPELINE_LATENCY_KEY = "pipeline_latency"
 SERVICE_NAME = "indexing-service"
 SERVICE_VERSION = "1.0.0"
 
@@ -63,11 +135,15 @@ kafka_producer = Producer({
     'client.id': f'{SERVICE_NAME}-producer'
 })
 
+# 컨슈머 랙, 처리 중 문서, 대기/처리 시간 통계
+pipeline_stats = PipelineStats()
+
 # 데이터 모델
 class IndexingRequest(BaseModel):
     doc_id: str
     embeddings: List[Dict[str, Any]]
     metadata: Optional[Dict] = {}
+    chunk_hashes: Optional[List[str]] = None  # 문서 전체 청크 해시 (증분 인덱싱용)
 
 class IndexingResponse(BaseModel):
     doc_id: str
@@ -143,8 +219,8 @@ async def get_metrics():
             if opensearch_client.indices.exists(index=OPENSEARCH_INDEX):
                 stats = opensearch_client.indices.stats(index=OPENSEARCH_INDEX)
                 index_stats = {
-                    "document_count": stats['indices'][OPENSEARCH_INDEX]['total']['docs']['count'],
-                    "index_size_bytes": stats['indices'][OPENSEARCH_INDEX]['total']['store']['size_in_bytes']
+                    "document_count": stats['_all']['total']['docs']['count'],
+                    "index_size_bytes": stats['_all']['total']['store']['size_in_bytes']
                 }
         except Exception as e:
             logger.warning(f"인덱스 통계 조회 실패: {e}")
@@ -153,59 +229,136 @@ async def get_metrics():
             "total_documents_indexed": int(total_indexed),
             "total_chunks_indexed": int(total_chunks),
             "indexing_errors": int(indexing_errors),
-            "opensearch_index_stats": index_stats
+            "opensearch_index_stats": index_stats,
+            "pipeline": pipeline_stats.snapshot()
         }
     except Exception as e:
         logger.error(f"메트릭 조회 오류: {e}")
         return {"error": "메트릭 조회 실패"}
 
-async def ensure_index_exists():
-    """OpenSearch 인덱스가 존재하는지 확인하고 없으면 생성"""
+@app.get("/metrics/pipeline")
+async def get_pipeline_metrics():
+    """수집 -> 검색 가능 지연 시간 백분위수 (이벤트 타임스탬프 기준)와 이 레플리카의 컨슈머 랙"""
+    try:
+        records = [json.loads(record) for record in redis_client.lrange(PIPELINE_LATENCY_KEY, 0, -1)]
+    except Exception as e:
+        logger.error(f"파이프라인 지연 시간 조회 오류: {e}")
+        raise HTTPException(status_code=500, detail="파이프라인 지연 시간 조회 실패")
+    
+    return {
+        "samples": len(records),
+        "latency_ms": latency_summary([record["latencies"] for record in records]),
+        "latest": records[0] if records else None,
+        "indexing_service": pipeline_stats.snapshot()
+    }
+
+# 인덱스별 벡터 인코딩 캐시 (매핑 _meta 기준)
+index_vector_encodings: Dict[str, str] = {}
+
+def get_index_vector_encoding(index: str) -> str:
+    """물리 인덱스 매핑(_meta)에 기록된 벡터 인코딩 조회"""
+    if index in index_vector_encodings:
+        return index_vector_encodings[index]
+    
+    encoding = "float32"  # _meta가 없는 기존 인덱스는 float32 매핑
+    try:
+        mapping = opensearch_client.indices.get_mapping(index=index)
+        for index_mapping in mapping.values():
+            meta = index_mapping.get("mappings", {}).get("_meta", {})
+            encoding = meta.get("vector_encoding", "float32")
+            break
+        index_vector_encodings[index] = encoding
+    except Exception as e:
+        logger.warning(f"인덱스 인코딩 조회 실패: {index} - {e}")
+        encoding = VECTOR_ENCODING
+    
+    return encoding
+
+# 별칭 조회 캐시 (bulk 요청마다 별칭을 조회하지 않도록 짧게 유지)
+alias_cache = {"write_indices": [], "checked_at": 0.0}
+
+def resolve_read_indices() -> List[str]:
+    """읽기 별칭이 가리키는 물리 인덱스 (별칭 도입 이전이면 레거시 인덱스)"""
+    return resolve_alias(opensearch_client, OPENSEARCH_INDEX) or [OPENSEARCH_INDEX]
+
+def resolve_write_indices(force: bool = False) -> List[str]:
+    """문서를 기록할 물리 인덱스 목록 (첫 번째가 쓰기 별칭 대상)
+    
+    재인덱싱 중에는 쓰기 별칭과 읽기 별칭이 서로 다른 인덱스를 가리키므로
+    기존 읽기 인덱스에도 함께 기록해 교체 전까지 검색 결과를 최신으로 유지
+    """
+    now = time.time()
+    if not force and alias_cache["write_indices"] and now - alias_cache["checked_at"] < ALIAS_REFRESH_SECONDS:
+        return alias_cache["write_indices"]
+    
+    read_indices = resolve_read_indices()
+    write_indices = resolve_alias(opensearch_client, write_alias_name(OPENSEARCH_INDEX)) or read_indices
+    
+    alias_cache["write_indices"] = list(dict.fromkeys(write_indices + read_indices))
+    alias_cache["checked_at"] = now
+    return alias_cache["write_indices"]
+
+def create_physical_index(vector_encoding: str, aliases: Optional[Dict[str, Any]] = None) -> str:
+    """다음 버전의 물리 인덱스 생성"""
+    encoding = validate_encoding(vector_encoding)
+    index_name = physical_index_name(
+        OPENSEARCH_INDEX,
+        next_index_version(opensearch_client, OPENSEARCH_INDEX)
+    )
+    
+    # 인덱스 매핑 정의 (1536차원 벡터용)
+    index_body = build_index_body(
+        encoding,
+        space_type=KNN_SPACE_TYPE,
+        model_id=PQ_MODEL_ID if encoding == "pq" else None
+    )
+    if aliases:
+        index_body["aliases"] = aliases
+    
+    opensearch_client.indices.create(index=index_name, body=index_body)
+    index_vector_encodings[index_name] = encoding
+    
+    logger.info(f"물리 인덱스 생성 완료: {index_name} (벡터 인코딩: {encoding})")
+    return index_name
+
+def resolve_document_indices(metadata: Dict) -> List[str]:
+    """문서를 기록할 물리 인덱스 목록 (파티셔닝 사용 시 문서의 파티션 인덱스)"""
+    partition_key = partition_key_for(
+        PARTITION_STRATEGY,
+        metadata,
+        PARTITION_FIELD,
+        PARTITION_TIME_FIELD,
+        PARTITION_TIME_GRANULARITY
+    )
+    if partition_key is None:
+        return resolve_write_indices()
+    
+    return [partition_index_name(OPENSEARCH_INDEX, partition_key)]
+
+def ensure_partition_template():
+    """파티션 인덱스 템플릿 등록/갱신"""
+    index_body = build_index_body(
+        VECTOR_ENCODING,
+        space_type=KNN_SPACE_TYPE,
+        model_id=PQ_MODEL_ID if VECTOR_ENCODING == "pq" else None
+    )
+    opensearch_client.indices.put_index_template(
+        name=f"{OPENSEARCH_INDEX}-partitions",
+        body=build_partition_template(OPENSEARCH_INDEX, index_body, PARTITION_SHARDS)
+    )
+    logger.info(f"파티션 인덱스 템플릿 등록: {partition_index_pattern(OPENSEARCH_INDEX)} ({PARTITION_STRATEGY})")
+
+async def ensure_index_exists(vector_encoding: Optional[str] = None):
+    """읽기 별칭(또는 레거시 인덱스)이 존재하는지 확인하고 없으면 생성"""
     try:
         if not opensearch_client.indices.exists(index=OPENSEARCH_INDEX):
             logger.info(f"인덱스 생성 중: {OPENSEARCH_INDEX}")
             
-            # 인덱스 매핑 정의 (1536차원 벡터용)
-            index_mapping = {
-                "mappings": {
-                    "properties": {
-                        "doc_id": {
-                            "type": "keyword"
-                        },
-                        "chunk_index": {
-                            "type": "integer"
-                        },
-                        "chunk_text": {
-                            "type": "text",
-                            "analyzer": "standard"
-                        },
-                        "embedding": {
-                            "type": "knn_vector",
-                            "dimension": 1536
-                        },
-                        "metadata": {
-                            "type": "object"
-                        },
-                        "indexed_at": {
-                            "type": "date"
-                        }
-                    }
-                },
-                "settings": {
-                    "index": {
-                        "number_of_shards": 1,
-                        "number_of_replicas": 0,
-                        "knn": True
-                    }
-                }
-            }
-            
-            opensearch_client.indices.create(
-                index=OPENSEARCH_INDEX,
-                body=index_mapping
+            create_physical_index(
+                vector_encoding or VECTOR_ENCODING,
+                aliases=build_initial_aliases(OPENSEARCH_INDEX)
             )
-            
-            logger.info(f"인덱스 생성 완료: {OPENSEARCH_INDEX}")
+            alias_cache["checked_at"] = 0.0
         else:
             logger.info(f"인덱스 이미 존재: {OPENSEARCH_INDEX}")
             
@@ -213,16 +366,25 @@ async def ensure_index_exists():
         logger.error(f"인덱스 생성 실패: {e}")
         raise
 
-async def index_embeddings(doc_id: str, embeddings: List[Dict[str, Any]], metadata: Dict) -> int:
-    """임베딩들을 OpenSearch에 인덱싱"""
-    indexed_count = 0
+async def index_embeddings(
+    doc_id: str,
+    embeddings: List[Dict[str, Any]],
+    metadata: Dict,
+    delete_actions: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """임베딩들을 OpenSearch에 인덱싱 (제거할 청크가 있으면 같은 bulk 요청으로 삭제)"""
+    result = {"indexed_chunks": [], "deleted_chunks": 0, "primary_index": None}
     
     try:
         # 인덱스 존재 확인
         await ensure_index_exists()
         
-        # 배치로 인덱싱
-        bulk_body = []
+        # 배치로 인덱싱 (물리 인덱스별 매핑과 동일한 인코딩 사용)
+        target_indices = resolve_document_indices(metadata)
+        primary_index = target_indices[0]
+        result["primary_index"] = primary_index
+        bulk_body = list(delete_actions or [])
+        chunk_indices_by_id = {}
         
         for embedding_data in embeddings:
             chunk_index = embedding_data.get("chunk_index", 0)
@@ -234,58 +396,203 @@ async def index_embeddings(doc_id: str, embeddings: List[Dict[str, Any]], metada
                 continue
             
             # 문서 ID 생성 (문서ID + 청크 인덱스)
-            document_id = f"{doc_id}_chunk_{chunk_index}"
+            document_id = chunk_document_id(doc_id, chunk_index)
+            chunk_indices_by_id[document_id] = chunk_index
             
-            # 인덱스 액션
-            bulk_body.append({
-                "index": {
-                    "_index": OPENSEARCH_INDEX,
-                    "_id": document_id
-                }
-            })
-            
-            # 문서 데이터
-            bulk_body.append({
-                "doc_id": doc_id,
-                "chunk_index": chunk_index,
-                "chunk_text": chunk_text,
-                "embedding": embedding_vector,
-                "metadata": metadata,
-                "indexed_at": datetime.utcnow().isoformat()
-            })
+            for target_index in target_indices:
+                # 인덱스 액션
+                bulk_body.append({
+                    "index": {
+                        "_index": target_index,
+                        "_id": document_id
+                    }
+                })
+                
+                # 문서 데이터
+                bulk_body.append({
+                    "doc_id": doc_id,
+                    "chunk_index": chunk_index,
+                    "chunk_text": chunk_text,
+                    "embedding": encode_vector(embedding_vector, get_index_vector_encoding(target_index)),
+                    "metadata": metadata,
+                    "indexed_at": datetime.utcnow().isoformat()
+                })
         
         if bulk_body:
             # 벌크 인덱싱 실행
-            response = opensearch_client.bulk(
-                body=bulk_body,
-                refresh=True  # 즉시 검색 가능하도록
-            )
+            with tracing.start_span("opensearch.bulk", kind="client", doc_id=doc_id, actions=len(bulk_body) // 2):
+                response = opensearch_client.bulk(
+                    body=bulk_body,
+                    refresh=True  # 즉시 검색 가능하도록
+                )
             
-            # 결과 확인
-            if response.get("errors"):
-                error_count = 0
-                for item in response.get("items", []):
-                    if "index" in item and item["index"].get("status", 200) >= 400:
-                        error_count += 1
+            # 결과 확인 (쓰기 별칭 대상 인덱스 기준으로 성공 여부 집계)
+            for item in response.get("items", []):
+                if "index" in item:
+                    status = item["index"].get("status", 200)
+                    if status >= 400:
                         logger.error(f"인덱싱 오류: {item['index'].get('error')}")
-                
-                indexed_count = len(embeddings) - error_count
+                    elif item["index"].get("_index") == primary_index:
+                        result["indexed_chunks"].append(chunk_indices_by_id[item["index"]["_id"]])
+                elif "delete" in item:
+                    status = item["delete"].get("status", 200)
+                    if status < 300:
+                        result["deleted_chunks"] += 1
+                    elif status != 404:
+                        logger.error(f"청크 삭제 오류: {item['delete'].get('error')}")
+            
+            if result["indexed_chunks"] or result["deleted_chunks"]:
+                bump_index_generation(f"bulk {doc_id}")
+            
+            indexed_count = len(result["indexed_chunks"])
+            if indexed_count < len(embeddings):
                 logger.warning(f"부분 인덱싱 완료: {indexed_count}/{len(embeddings)}")
             else:
-                indexed_count = len(embeddings)
                 logger.info(f"모든 임베딩 인덱싱 완료: {indexed_count}개")
         
         # 통계 업데이트
-        if indexed_count > 0:
+        if result["indexed_chunks"]:
             redis_client.incr("total_documents_indexed")
-            redis_client.incrby("total_chunks_indexed", indexed_count)
+            redis_client.incrby("total_chunks_indexed", len(result["indexed_chunks"]))
         
-        return indexed_count
+        return result
         
     except Exception as e:
         logger.error(f"인덱싱 실패: {doc_id} - {e}")
         redis_client.incr("indexing_errors")
-        return 0
+        return result
+
+def bump_index_generation(reason: str):
+    """인덱스 내용 변경 시 세대 증가 (이전 세대의 검색 결과 캐시는 더 이상 사용되지 않음)"""
+    try:
+        generation = redis_client.incr(INDEX_GENERATION_KEY)
+        logger.debug(f"인덱스 세대 증가: {generation} ({reason})")
+    except Exception as e:
+        logger.warning(f"인덱스 세대 증가 실패: {e}")
+
+def record_pipeline_latency(doc_id: str, timestamps: Dict[str, str]):
+    """문서의 단계별 지연 시간 기록 (최근 PIPELINE_LATENCY_SAMPLES건 유지)"""
+    latencies = stage_latencies(timestamps)
+    if not latencies:
+        return
+    try:
+        pipeline = redis_client.pipeline()
+        pipeline.lpush(PIPELINE_LATENCY_KEY, json.dumps({"doc_id": doc_id, "latencies": latencies, **timestamps}))
+        pipeline.ltrim(PIPELINE_LATENCY_KEY, 0, PIPELINE_LATENCY_SAMPLES - 1)
+        pipeline.execute()
+    except Exception as e:
+        logger.warning(f"파이프라인 지연 시간 기록 실패: {e}")
+
+def load_manifest(doc_id: str) -> Dict[str, Any]:
+    """문서의 청크 매니페스트 조회"""
+    manifest_data = redis_client.get(manifest_key(doc_id))
+    return json.loads(manifest_data) if manifest_data else {"chunks": {}}
+
+def save_manifest(doc_id: str, manifest: Dict[str, Any]):
+    """문서의 청크 매니페스트 저장"""
+    manifest["updated_at"] = datetime.utcnow().isoformat()
+    redis_client.set(manifest_key(doc_id), json.dumps(manifest))
+
+def chunk_locations(entry: Dict[str, str]) -> List[str]:
+    """매니페스트 항목의 청크가 저장된 물리 인덱스"""
+    if PARTITION_STRATEGY == "none":
+        # 별칭 교체 후에는 기록된 인덱스가 사라졌을 수 있으므로 현재 쓰기 대상 기준
+        return resolve_write_indices()
+    return [entry["index"]]
+
+async def index_document_incremental(
+    doc_id: str,
+    embeddings: List[Dict[str, Any]],
+    metadata: Dict,
+    chunk_hashes: List[str]
+) -> Dict[str, Any]:
+    """청크 해시 비교로 변경된 청크만 인덱싱하고 새 버전에 없는 청크는 삭제"""
+    manifest = load_manifest(doc_id)
+    manifest_chunks = manifest["chunks"]
+    
+    await ensure_index_exists()
+    primary_index = resolve_document_indices(metadata)[0]
+    to_index, skipped, removed = diff_chunks(
+        manifest_chunks,
+        chunk_hashes,
+        embeddings,
+        primary_index if PARTITION_STRATEGY != "none" else None
+    )
+    
+    delete_actions = []
+    for chunk_index, entry in removed.items():
+        for index in chunk_locations(entry):
+            delete_actions.append({"delete": {"_index": index, "_id": chunk_document_id(doc_id, chunk_index)}})
+    
+    if PARTITION_STRATEGY != "none":
+        # 다른 파티션으로 옮겨지는 청크는 이전 파티션에서 삭제
+        for embedding_data in to_index:
+            previous = manifest_chunks.get(str(embedding_data.get("chunk_index", 0)))
+            if previous and previous.get("index") != primary_index:
+                delete_actions.append({"delete": {
+                    "_index": previous["index"],
+                    "_id": chunk_document_id(doc_id, embedding_data.get("chunk_index", 0))
+                }})
+    
+    if not to_index and not delete_actions:
+        logger.info(f"변경된 청크 없음: {doc_id} ({skipped}개 건너뜀)")
+        return {"indexed_chunks": [], "deleted_chunks": 0, "skipped_chunks": skipped, "primary_index": primary_index}
+    
+    result = await index_embeddings(doc_id, to_index, metadata, delete_actions)
+    result["skipped_chunks"] = skipped
+    
+    # 매니페스트 갱신 (실패한 청크는 다음 업데이트에서 재시도되도록 기록하지 않음)
+    for chunk_index in result["indexed_chunks"]:
+        manifest_chunks[str(chunk_index)] = {"hash": chunk_hashes[chunk_index], "index": result["primary_index"]}
+    for chunk_index in removed:
+        manifest_chunks.pop(str(chunk_index), None)
+    save_manifest(doc_id, manifest)
+    
+    logger.info(
+        f"증분 인덱싱: {doc_id} - 인덱싱 {len(result['indexed_chunks'])}, "
+        f"삭제 {len(removed)}, 건너뜀 {skipped}"
+    )
+    return result
+
+async def index_document_full(doc_id: str, embeddings: List[Dict[str, Any]], metadata: Dict) -> Dict[str, Any]:
+    """전체 청크 인덱싱 (인덱싱된 청크는 매니페스트에 기록해 이후 증분 업데이트에 사용)"""
+    result = await index_embeddings(doc_id, embeddings, metadata)
+    
+    if result["indexed_chunks"]:
+        # 이전 버전이 더 길었던 경우 남은 청크 삭제 (매니페스트가 없어도 삭제되도록 doc_id 기준)
+        chunk_count = max(e.get("chunk_index", 0) for e in embeddings) + 1
+        try:
+            response = opensearch_client.delete_by_query(
+                index=resolve_all_indices(),
+                body={"query": {"bool": {"filter": [
+                    {"term": {"doc_id": doc_id}},
+                    {"range": {"chunk_index": {"gte": chunk_count}}}
+                ]}}},
+                conflicts="proceed",
+                refresh=True
+            )
+            result["deleted_chunks"] += response.get("deleted", 0)
+            if response.get("deleted", 0):
+                bump_index_generation(f"trim {doc_id}")
+        except Exception as e:
+            logger.warning(f"남은 청크 삭제 실패: {doc_id} - {e}")
+        
+        try:
+            manifest = load_manifest(doc_id)
+            for chunk_index in [key for key in manifest["chunks"] if int(key) >= chunk_count]:
+                del manifest["chunks"][chunk_index]
+            texts = {e.get("chunk_index", 0): e.get("chunk_text", "") for e in embeddings}
+            for chunk_index in result["indexed_chunks"]:
+                manifest["chunks"][str(chunk_index)] = {
+                    "hash": chunk_content_hash(texts[chunk_index], metadata, CHUNK_HASH_IGNORED_METADATA_FIELDS),
+                    "index": result["primary_index"]
+                }
+            save_manifest(doc_id, manifest)
+        except Exception as e:
+            logger.warning(f"청크 매니페스트 저장 실패: {doc_id} - {e}")
+    
+    result["skipped_chunks"] = 0
+    return result
 
 # 메인 인덱싱 엔드포인트
 @app.post("/index", response_model=IndexingResponse)
@@ -304,7 +611,8 @@ async def index_document(
             process_indexing_async,
             request.doc_id,
             request.embeddings,
-            request.metadata
+            request.metadata,
+            request.chunk_hashes
         )
         
         processing_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
@@ -332,67 +640,87 @@ async def index_document(
 async def process_indexing_async(
     doc_id: str,
     embeddings: List[Dict[str, Any]],
-    metadata: Dict
+    metadata: Dict,
+    chunk_hashes: Optional[List[str]] = None,
+    timestamps: Optional[Dict[str, str]] = None
 ):
-    """비동기 인덱싱 처리"""
-    try:
-        start_time = time.time()
-        
-        # 임베딩 인덱싱
-        indexed_count = await index_embeddings(doc_id, embeddings, metadata)
-        
-        processing_time = int((time.time() - start_time) * 1000)
-        
-        if indexed_count > 0:
-            # 성공 메시지를 Kafka로 전송
-            success_message = {
-                "doc_id": doc_id,
-                "status": "indexed",
-                "indexed_chunks": indexed_count,
-                "total_chunks": len(embeddings),
-                "success_rate": indexed_count / len(embeddings) * 100,
-                "processing_time_ms": processing_time,
-                "metadata": metadata,
-                "indexed_at": datetime.utcnow().isoformat(),
-                "service": SERVICE_NAME,
-                "service_version": SERVICE_VERSION,
-                "opensearch_index": OPENSEARCH_INDEX
-            }
-            
-            # index-ready 토픽으로 전송
-            kafka_producer.produce(
-                topic='index-ready',
-                key=doc_id,
-                value=json.dumps(success_message, ensure_ascii=False)
-            )
-            
-            kafka_producer.flush()
-            
-            logger.info(f"인덱싱 완료 및 Kafka 전송: {doc_id} - {indexed_count}개 청크")
-            
-        else:
-            logger.error(f"인덱싱 실패: {doc_id}")
+    """비동기 인덱싱 처리 (timestamps: 이전 단계 이벤트 시각)"""
+    with pipeline_stats.track():
+        try:
+            start_time = time.time()
             
-            # 에러를 Kafka 에러 토픽으로 전송
-            error_message = {
-                "doc_id": doc_id,
-                "error": "모든 청크의 인덱싱 실패",
-                "embeddings_count": len(embeddings),
-                "error_at": datetime.utcnow().isoformat(),
-                "service": SERVICE_NAME,
-                "service_version": SERVICE_VERSION
-            }
+            # 임베딩 인덱싱 (청크 해시가 있으면 변경된 청크만 처리)
+            if INCREMENTAL_INDEXING and chunk_hashes is not None:
+                result = await index_document_incremental(doc_id, embeddings, metadata, chunk_hashes)
+            else:
+                result = await index_document_full(doc_id, embeddings, metadata)
+            indexed_count = len(result["indexed_chunks"])
             
-            kafka_producer.produce(
-                topic='processing-errors',
-                key=doc_id,
-                value=json.dumps(error_message, ensure_ascii=False)
-            )
+            processing_time = int((time.time() - start_time) * 1000)
             
-            kafka_producer.flush()
+            failed_count = len(embeddings) - result["skipped_chunks"] - indexed_count
             
-    except Exception as e:
-        logger.error(f"인덱싱 비동기 처리 실패: {doc_id} - {str(e)}")
+            # 재업로드 시 변경된 청크가 없거나 삭제만 있는 경우도 성공으로 처리
+            if indexed_count > 0 or failed_count == 0:
+                # refresh=True로 기록했으므로 indexed_at이 검색 가능 시각
+                timestamps = dict(timestamps or {}, indexed_at=datetime.utcnow().isoformat())
+                record_pipeline_latency(doc_id, timestamps)
+                
+                # 성공 메시지를 Kafka로 전송
+                success_message = {
+                    "doc_id": doc_id,
+                    "status": "indexed",
+                    "indexed_chunks": indexed_count,
+                    "skipped_chunks": result["skipped_chunks"],
+                    "deleted_chunks": result["deleted_chunks"],
+                    "total_chunks": len(chunk_hashes) if chunk_hashes is not None else len(embeddings),
+                    "success_rate": indexed_count / len(embeddings) * 100 if embeddings else 100.0,
+                    "processing_time_ms": processing_time,
+                    "metadata": metadata,
+                    **timestamps,
+                    "service": SERVICE_NAME,
+                    "service_version": SERVICE_VERSION,
+                    "opensearch_index": result["primary_index"] or OPENSEARCH_INDEX
+                }
+                
+                # index-ready 토픽으로 전송 (트레이스 컨텍스트는 메시지 헤더로 전파)
+                kafka_producer.produce(
+                    topic='index-ready',
+                    key=doc_id,
+                    value=json.dumps(success_message, ensure_ascii=False),
+                    headers=tracing.kafka_headers()
+                )
+                
+                kafka_producer.flush()
+                
+                logger.info(f"인덱싱 완료 및 Kafka 전송: {doc_id} - {indexed_count}개 청크")
+                
+            else:
+                logger.error(f"인덱싱 실패: {doc_id}")
+                pipeline_stats.record_failure()
+                
+                # 에러를 Kafka 에러 토픽으로 전송
+                error_message = {
+                    "doc_id": doc_id,
+                    "error": "모든 청크의 인덱싱 실패",
+                    "embeddings_count": len(embeddings),
+                    "error_at": datetime.utcnow().isoformat(),
+                    "service": SERVICE_NAME,
+                    "service_version": SERVICE_VERSION
+                }
+                
+                kafka_producer.produce(
+                    topic='processing-errors',
+                    key=doc_id,
+                    value=json.dumps(error_message, ensure_ascii=False),
+                    headers=tracing.kafka_headers()
+                )
+                
+                kafka_producer.flush()
+                
+        except Exception as e:
+            logger.error(f"인덱싱 비동기 처리 실패: {doc_id} - {str(e)}")
+            pipeline_stats.record_failure()
 
 # Kafka 컨슈머 (임베딩 생성 완료 이벤트 수신)
 async def kafka_consumer_task():
@@ -400,12 +728,14 @@ async def kafka_consumer_task():
     consumer = Consumer({
         'bootstrap.servers': KAFKA_BOOTSTRAP_SERVERS,
         'group.id': 'indexing-service-group',
-        'auto.offset.reset': 'latest'
+        'auto.offset.reset': 'latest',
+        'statistics.interval.ms': KAFKA_STATS_INTERVAL_MS,
+        'stats_cb': pipeline_stats.on_kafka_stats
     })
     
-    consumer.subscribe(['embeddings-generated'])
+    consumer.subscribe(['embeddings-generated', 'doc-deleted'])
     
-    logger.info("Kafka 컨슈머 시작: embeddings-generated 토픽 수신 대기")
+    logger.info("Kafka 컨슈머 시작: embeddings-generated, doc-deleted 토픽 수신 대기")
     
     try:
         while True:
@@ -424,41 +754,633 @@ async def kafka_consumer_task():
             try:
                 event_data = json.loads(msg.value().decode('utf-8'))
                 doc_id = event_data.get('doc_id')
-                embeddings = event_data.get('embeddings', [])
-                metadata = event_data.get('metadata', {})
+                pipeline_stats.record_queue_wait(msg)
                 
-                logger.info(f"임베딩 생성 완료 이벤트 수신: {doc_id}, 임베딩 수: {len(embeddings)}")
-                
-                if embeddings:
-                    # 비동기 인덱싱 처리
-                    await process_indexing_async(doc_id, embeddings, metadata)
-                else:
-                    logger.warning(f"임베딩이 없음: {doc_id}")
+                # 이전 단계(임베딩 생성, 삭제 요청)의 트레이스에 이어서 기록
+                with tracing.start_span(
+                    f"kafka.consume {msg.topic()}",
+                    parent=tracing.context_from_kafka(msg.headers()),
+                    kind="consumer",
+                    doc_id=doc_id
+                ):
+                    if msg.topic() == 'doc-deleted':
+                        logger.info(f"문서 삭제 이벤트 수신: {doc_id}")
+                        await delete_document(doc_id)
+                        continue
+                    
+                    embeddings = event_data.get('embeddings', [])
+                    metadata = event_data.get('metadata', {})
+                    chunk_hashes = event_data.get('chunk_hashes')
+                    
+                    logger.info(f"임베딩 생성 완료 이벤트 수신: {doc_id}, 임베딩 수: {len(embeddings)}")
                     
+                    if embeddings or chunk_hashes is not None:
+                        # 비동기 인덱싱 처리 (증분 업데이트는 변경된 청크가 없어도 삭제 처리 필요)
+                        await process_indexing_async(
+                            doc_id, embeddings, metadata, chunk_hashes, stage_timestamps(event_data)
+                        )
+                    else:
+                        logger.warning(f"임베딩이 없음: {doc_id}")
+                        
             except Exception as e:
                 logger.error(f"Kafka 메시지 처리 오류: {str(e)}")
                 
     finally:
         consumer.close()
 
+# 문서 삭제 / 대량 삭제
+class PurgeRequest(BaseModel):
+    metadata: Optional[Dict[str, Any]] = None  # 메타데이터 필드 -> 값 (목록이면 OR)
+    doc_ids: Optional[List[str]] = None
+    indexed_before: Optional[str] = None
+    indexed_after: Optional[str] = None
+    requests_per_second: Optional[float] = None  # 초당 삭제 문서 수 제한 (기본: PURGE_REQUESTS_PER_SECOND)
+    dry_run: bool = False
+
+def build_purge_query(request: PurgeRequest) -> Dict[str, Any]:
+    """대량 삭제 조건을 bool 필터 쿼리로 변환"""
+    filters = []
+    
+    for field, value in (request.metadata or {}).items():
+        values = value if isinstance(value, list) else [value]
+        # 동적 매핑된 문자열 필드는 정확 일치를 위해 keyword 서브필드 사용
+        field_name = f"metadata.{field}.keyword" if all(isinstance(v, str) for v in values) else f"metadata.{field}"
+        filters.append({"terms": {field_name: values}})
+    
+    if request.doc_ids:
+        filters.append({"terms": {"doc_id": request.doc_ids}})
+    
+    if request.indexed_before or request.indexed_after:
+        date_range = {}
+        if request.indexed_after:
+            date_range["gte"] = request.indexed_after
+        if request.indexed_before:
+            date_range["lt"] = request.indexed_before
+        filters.append({"range": {"indexed_at": date_range}})
+    
+    if not filters:
+        raise ValueError("삭제 조건이 없습니다 (전체 삭제는 /admin/reindex 사용)")
+    
+    return {"bool": {"filter": filters}}
+
+def resolve_all_indices() -> List[str]:
+    """삭제 대상 물리 인덱스 (읽기 별칭 + 재인덱싱 중인 쓰기 대상 + 파티션)"""
+    return list(dict.fromkeys(resolve_read_indices() + resolve_write_indices(force=True)))
+
+def invalidate_search_cache(doc_ids: List[str]) -> int:
+    """삭제된 문서를 포함하는 검색 결과 캐시 무효화
+    
+    검색 API가 결과를 캐싱할 때 search_result_docs:{doc_id} 집합에 캐시 키를 기록함
+    """
+    invalidated = 0
+    for offset in range(0, len(doc_ids), 500):
+        batch = doc_ids[offset:offset + 500]
+        pipeline = redis_client.pipeline()
+        for doc_id in batch:
+            pipeline.smembers(f"search_result_docs:{doc_id}")
+        cache_keys = set().union(*pipeline.execute())
+        
+        pipeline = redis_client.pipeline()
+        for cache_key in cache_keys:
+            pipeline.delete(cache_key)
+        for doc_id in batch:
+            pipeline.delete(f"search_result_docs:{doc_id}")
+        pipeline.execute()
+        invalidated += len(cache_keys)
+    
+    return invalidated
+
+def collect_purged_doc_ids(query: Dict[str, Any], limit: int) -> Optional[List[str]]:
+    """삭제 조건에 해당하는 doc_id 수집 (limit 초과 시 None)
+    
+    청크 매니페스트는 페이지 단위로 바로 삭제해 재업로드 시 증분 인덱싱이 건너뛰지 않도록 함
+    """
+    doc_ids = []
+    tracked = True
+    after_key = None
+    
+    while True:
+        composite = {"size": 1000, "sources": [{"doc_id": {"terms": {"field": "doc_id"}}}]}
+        if after_key:
+            composite["after"] = after_key
+        
+        response = opensearch_client.search(
+            index=resolve_all_indices(),
+            body={"size": 0, "query": query, "aggs": {"docs": {"composite": composite}}}
+        )
+        buckets = response["aggregations"]["docs"]["buckets"]
+        page = [bucket["key"]["doc_id"] for bucket in buckets]
+        
+        if page:
+            redis_client.delete(*[manifest_key(doc_id) for doc_id in page])
+        
+        if tracked:
+            doc_ids.extend(page)
+            if len(doc_ids) > limit:
+                tracked = False
+                doc_ids = []
+        
+        after_key = response["aggregations"]["docs"].get("after_key")
+        if not buckets or not after_key:
+            return doc_ids if tracked else None
+
+def flush_search_cache() -> int:
+    """전체 검색 결과 캐시 무효화 (SCAN 기반으로 Redis를 블로킹하지 않음)"""
+    deleted = 0
+    for pattern in ("search_result:*", "search_result_docs:*"):
+        batch = []
+        for key in redis_client.scan_iter(match=pattern, count=1000):
+            batch.append(key)
+            if len(batch) >= 1000:
+                deleted += redis_client.delete(*batch)
+                batch = []
+        if batch:
+            deleted += redis_client.delete(*batch)
+    return deleted
+
+async def delete_document(doc_id: str) -> Dict[str, Any]:
+    """문서의 모든 청크 삭제 및 관련 캐시 무효화"""
+    response = opensearch_client.delete_by_query(
+        index=resolve_all_indices(),
+        body={"query": {"term": {"doc_id": doc_id}}},
+        conflicts="proceed",
+        refresh=True
+    )
+    
+    redis_client.delete(manifest_key(doc_id))
+    deleted = response.get("deleted", 0)
+    if deleted:
+        bump_index_generation(f"delete {doc_id}")
+    invalidated = invalidate_search_cache([doc_id])
+    
+    logger.info(f"문서 삭제 완료: {doc_id} - 청크 {deleted}개, 캐시 {invalidated}개 무효화")
+    return {"doc_id": doc_id, "deleted_chunks": deleted, "invalidated_cache_entries": invalidated}
+
+@app.delete("/documents/{doc_id}")
+async def delete_document_endpoint(doc_id: str):
+    """문서 삭제"""
+    try:
+        return await delete_document(doc_id)
+    except Exception as e:
+        logger.error(f"문서 삭제 실패: {doc_id} - {e}")
+        raise HTTPException(status_code=500, detail=f"문서 삭제 실패: {str(e)}")
+
+def save_purge_job(job: Dict[str, Any]):
+    """대량 삭제 작업 상태 저장"""
+    try:
+        redis_client.setex(f"purge_job:{job['task_id']}", 7 * 86400, json.dumps(job))
+    except Exception as e:
+        logger.warning(f"대량 삭제 작업 상태 저장 실패: {e}")
+
+async def run_purge_job(job: Dict[str, Any], doc_ids: Optional[List[str]]):
+    """대량 삭제 진행 상황 추적 후 완료 시 캐시 무효화"""
+    started_at = time.time()
+    
+    try:
+        while True:
+            await asyncio.sleep(REINDEX_POLL_SECONDS)
+            task_status = opensearch_client.tasks.get(task_id=job["task_id"])
+            job.update(summarize_bulk_by_scroll_task(task_status, started_at, time.time()))
+            save_purge_job(job)
+            
+            if job["completed"]:
+                break
+        
+        # 삭제가 끝난 뒤 무효화해야 삭제 중인 문서가 다시 캐싱되지 않음
+        if job.get("deleted_docs"):
+            bump_index_generation(f"purge {job['task_id']}")
+        if doc_ids is not None:
+            job["invalidated_cache_entries"] = invalidate_search_cache(doc_ids)
+        else:
+            job["invalidated_cache_entries"] = flush_search_cache()
+        
+        job["status"] = "failed" if job["failures"] else "completed"
+        job["duration_seconds"] = round(time.time() - started_at, 2)
+        
+    except Exception as e:
+        logger.error(f"대량 삭제 추적 실패: {job['task_id']} - {e}")
+        job["status"] = "failed"
+        job["error"] = str(e)
+    
+    save_purge_job(job)
+    logger.info(f"대량 삭제 종료: {job['task_id']} - {job['status']}")
+
+@app.post("/admin/purge")
+async def purge_documents(request: PurgeRequest):
+    """메타데이터 조건으로 대량 삭제 (스로틀링된 delete_by_query, 슬라이스 병렬 처리)"""
+    try:
+        query = build_purge_query(request)
+        
+        if request.dry_run:
+            count = opensearch_client.count(index=resolve_all_indices(), body={"query": query})["count"]
+            return {"dry_run": True, "matched_chunks": count}
+        
+        # 캐시 무효화 대상 문서 수집 (너무 많으면 전체 캐시 무효화)
+        doc_ids = collect_purged_doc_ids(query, PURGE_MAX_TRACKED_DOCS)
+        
+        # 검색 트래픽을 방해하지 않도록 초당 처리량 제한
+        requests_per_second = request.requests_per_second or PURGE_REQUESTS_PER_SECOND
+        task = opensearch_client.delete_by_query(
+            index=resolve_all_indices(),
+            body={"query": query},
+            conflicts="proceed",
+            slices="auto",
+            scroll_size=PURGE_SCROLL_SIZE,
+            requests_per_second=requests_per_second,
+            wait_for_completion=False
+        )
+        
+        job = {
+            "task_id": task["task"],
+            "status": "running",
+            "requests_per_second": requests_per_second,
+            "tracked_doc_ids": len(doc_ids) if doc_ids is not None else None,
+            "created_at": datetime.utcnow().isoformat()
+        }
+        save_purge_job(job)
+        asyncio.create_task(run_purge_job(job, doc_ids))
+        
+        logger.info(f"대량 삭제 시작: {job['task_id']} ({requests_per_second} docs/s)")
+        return job
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"대량 삭제 시작 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"대량 삭제 시작 실패: {str(e)}")
+
+@app.get("/admin/purge/{task_id}")
+async def get_purge_job(task_id: str):
+    """대량 삭제 진행 상황 조회"""
+    job_data = redis_client.get(f"purge_job:{task_id}")
+    if not job_data:
+        raise HTTPException(status_code=404, detail=f"대량 삭제 작업을 찾을 수 없습니다: {task_id}")
+    return json.loads(job_data)
+
+@app.post("/admin/purge/{task_id}/rethrottle")
+async def rethrottle_purge(
+    task_id: str,
+    requests_per_second: float = Query(..., description="초당 삭제 문서 수 (-1: 제한 없음)")
+):
+    """진행 중인 대량 삭제의 처리량 조정"""
+    try:
+        opensearch_client.delete_by_query_rethrottle(task_id=task_id, requests_per_second=requests_per_second)
+        return {"task_id": task_id, "requests_per_second": requests_per_second}
+    except Exception as e:
+        logger.error(f"대량 삭제 처리량 조정 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"처리량 조정 실패: {str(e)}")
+
+# 재인덱싱 작업 상태 (Redis에도 기록해 다른 레플리카에서 조회 가능)
+reindex_jobs: Dict[str, Dict[str, Any]] = {}
+
+class ReindexRequest(BaseModel):
+    vector_encoding: Optional[str] = None
+    mode: str = "reindex"  # reindex: _reindex API로 복사, ingest: 원본 재수집 후 수동 교체
+    delete_old_index: bool = False
+
+def save_reindex_job(job: Dict[str, Any]):
+    """재인덱싱 작업 상태 저장"""
+    reindex_jobs[job["job_id"]] = job
+    try:
+        redis_client.setex(f"reindex_job:{job['job_id']}", 7 * 86400, json.dumps(job))
+    except Exception as e:
+        logger.warning(f"재인덱싱 작업 상태 저장 실패: {e}")
+
+def load_reindex_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """재인덱싱 작업 상태 조회"""
+    try:
+        job_data = redis_client.get(f"reindex_job:{job_id}")
+        if job_data:
+            return json.loads(job_data)
+    except Exception as e:
+        logger.warning(f"재인덱싱 작업 상태 조회 실패: {e}")
+    return reindex_jobs.get(job_id)
+
+def restore_write_alias(job: Dict[str, Any]):
+    """실패한 작업의 쓰기 별칭을 기존 인덱스로 되돌림"""
+    write_alias = write_alias_name(OPENSEARCH_INDEX)
+    actions = [{"remove": {"index": job["target_index"], "alias": write_alias}}]
+    if not job.get("legacy_index"):
+        actions.append({"add": {"index": job["source_indices"][0], "alias": write_alias, "is_write_index": True}})
+    opensearch_client.indices.update_aliases(body={"actions": actions})
+    alias_cache["checked_at"] = 0.0
+
+def swap_read_alias(job: Dict[str, Any]):
+    """읽기 별칭을 새 인덱스로 원자적으로 교체"""
+    actions = build_swap_actions(
+        OPENSEARCH_INDEX,
+        job["target_index"],
+        job["source_indices"],
+        legacy_index=job.get("legacy_index", False)
+    )
+    opensearch_client.indices.update_aliases(body={"actions": actions})
+    alias_cache["checked_at"] = 0.0
+    bump_index_generation(f"swap {job['target_index']}")
+    
+    if job.get("delete_old_index") and not job.get("legacy_index"):
+        for index in job["source_indices"]:
+            opensearch_client.indices.delete(index=index, ignore_unavailable=True)
+            logger.info(f"기존 인덱스 삭제: {index}")
+    
+    job["status"] = "completed"
+    job["swapped_at"] = datetime.utcnow().isoformat()
+    logger.info(f"읽기 별칭 교체 완료: {OPENSEARCH_INDEX} -> {job['target_index']}")
+
+async def run_reindex_job(job: Dict[str, Any]):
+    """새 버전 인덱스 생성 -> 쓰기 별칭 이동 -> 데이터 복사 -> 읽기 별칭 교체"""
+    started_at = time.time()
+    
+    try:
+        await ensure_index_exists()
+        source_indices = resolve_read_indices()
+        job["source_indices"] = source_indices
+        job["legacy_index"] = is_concrete_index(opensearch_client, OPENSEARCH_INDEX)
+        job["target_index"] = create_physical_index(job["vector_encoding"])
+        
+        # 쓰기 별칭 이동 (이후 신규 문서는 새 인덱스와 기존 인덱스에 함께 기록됨)
+        opensearch_client.indices.update_aliases(body={
+            "actions": build_write_alias_actions(
+                OPENSEARCH_INDEX,
+                job["target_index"],
+                resolve_alias(opensearch_client, write_alias_name(OPENSEARCH_INDEX))
+            )
+        })
+        alias_cache["checked_at"] = 0.0
+        
+        if job["mode"] == "ingest":
+            # 원본에서 재수집하는 경우: 재수집 완료 후 /admin/reindex/{job_id}/swap 호출
+            job["status"] = "awaiting_ingestion"
+            save_reindex_job(job)
+            return
+        
+        reindex_body = {
+            "source": {"index": source_indices},
+            # 이중 기록된 최신 문서를 덮어쓰지 않도록 create + 충돌 무시
+            "dest": {"index": job["target_index"], "op_type": "create"},
+            "conflicts": "proceed"
+        }
+        script = build_reindex_script(
+            get_index_vector_encoding(source_indices[0]),
+            job["vector_encoding"],
+            BYTE_SCALE
+        )
+        if script:
+            reindex_body["script"] = script
+        
+        task = opensearch_client.reindex(
+            body=reindex_body,
+            wait_for_completion=False,
+            slices="auto",
+            requests_per_second=REINDEX_REQUESTS_PER_SECOND,
+            refresh=True
+        )
+        job["task_id"] = task["task"]
+        job["status"] = "running"
+        save_reindex_job(job)
+        
+        logger.info(f"재인덱싱 시작: {source_indices} -> {job['target_index']} (task: {job['task_id']})")
+        
+        # 진행률/처리량 갱신
+        while True:
+            await asyncio.sleep(REINDEX_POLL_SECONDS)
+            task_status = opensearch_client.tasks.get(task_id=job["task_id"])
+            job.update(summarize_bulk_by_scroll_task(task_status, started_at, time.time()))
+            save_reindex_job(job)
+            
+            if job["completed"]:
+                break
+        
+        if job["failures"]:
+            raise RuntimeError(f"재인덱싱 실패 문서 {len(job['failures'])}건")
+        
+        swap_read_alias(job)
+        job["duration_seconds"] = round(time.time() - started_at, 2)
+        save_reindex_job(job)
+        
+    except Exception as e:
+        logger.error(f"재인덱싱 작업 실패: {job['job_id']} - {e}")
+        job["status"] = "failed"
+        job["error"] = str(e)
+        if job.get("target_index"):
+            try:
+                restore_write_alias(job)
+            except Exception as restore_error:
+                logger.error(f"쓰기 별칭 복구 실패: {restore_error}")
+        save_reindex_job(job)
+        
+    finally:
+        if job["status"] != "awaiting_ingestion":
+            redis_client.delete("reindex_active_job")
+
+async def start_reindex_job(request: ReindexRequest) -> Dict[str, Any]:
+    """재인덱싱 작업 시작 (동시에 하나만 실행)"""
+    if request.mode not in ("reindex", "ingest"):
+        raise ValueError(f"지원하지 않는 재인덱싱 모드: {request.mode}")
+    if PARTITION_STRATEGY != "none":
+        raise ValueError("파티셔닝 사용 중에는 인덱스 템플릿 변경이 새 파티션부터 적용됩니다")
+    
+    job_id = f"reindex-{int(time.time())}-{uuid.uuid4().hex[:6]}"
+    if not redis_client.set("reindex_active_job", job_id, nx=True, ex=86400):
+        raise ValueError(f"이미 진행 중인 재인덱싱 작업이 있습니다: {redis_client.get('reindex_active_job')}")
+    
+    job = {
+        "job_id": job_id,
+        "mode": request.mode,
+        "vector_encoding": validate_encoding(request.vector_encoding or VECTOR_ENCODING),
+        "delete_old_index": request.delete_old_index,
+        "status": "pending",
+        "created_at": datetime.utcnow().isoformat()
+    }
+    save_reindex_job(job)
+    
+    asyncio.create_task(run_reindex_job(job))
+    return job
+
 # 인덱스 관리 엔드포인트
+@app.post("/admin/reindex")
+async def reindex(request: ReindexRequest):
+    """무중단 재인덱싱 시작 (새 버전 인덱스로 복사 후 별칭 교체)"""
+    try:
+        return await start_reindex_job(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"재인덱싱 시작 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"재인덱싱 시작 실패: {str(e)}")
+
+@app.get("/admin/reindex/{job_id}")
+async def get_reindex_job(job_id: str):
+    """재인덱싱 진행 상황 조회"""
+    job = load_reindex_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"재인덱싱 작업을 찾을 수 없습니다: {job_id}")
+    
+    if job["status"] == "awaiting_ingestion":
+        # 원본 재수집 모드: 기존 인덱스 대비 새 인덱스 문서 수로 진행률 계산
+        try:
+            source_count = opensearch_client.count(index=job["source_indices"])["count"]
+            target_count = opensearch_client.count(index=job["target_index"])["count"]
+            job["total_docs"] = source_count
+            job["processed_docs"] = target_count
+            job["progress_percent"] = round(target_count / source_count * 100, 2) if source_count else 100.0
+        except Exception as e:
+            logger.warning(f"재수집 진행률 조회 실패: {e}")
+    
+    return job
+
+@app.post("/admin/reindex/{job_id}/swap")
+async def swap_reindex_job(job_id: str):
+    """원본 재수집 완료 후 읽기 별칭 교체"""
+    job = load_reindex_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"재인덱싱 작업을 찾을 수 없습니다: {job_id}")
+    if job["status"] != "awaiting_ingestion":
+        raise HTTPException(status_code=409, detail=f"교체할 수 없는 상태입니다: {job['status']}")
+    
+    try:
+        opensearch_client.indices.refresh(index=job["target_index"])
+        swap_read_alias(job)
+        save_reindex_job(job)
+        redis_client.delete("reindex_active_job")
+        return job
+    except Exception as e:
+        logger.error(f"별칭 교체 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"별칭 교체 실패: {str(e)}")
+
 @app.post("/admin/recreate-index")
-async def recreate_index():
-    """인덱스 재생성 (관리자용)"""
+async def recreate_index(
+    vector_encoding: Optional[str] = Query(None, description="벡터 인코딩 (float32, fp16, byte, pq)")
+):
+    """인덱스 재생성 (관리자용) - 기존 데이터를 새 매핑으로 복사한 뒤 별칭 교체"""
+    return await reindex(ReindexRequest(vector_encoding=vector_encoding))
+
+@app.get("/admin/partitions")
+async def get_partitions():
+    """파티션 인덱스 목록 및 문서 수 조회"""
     try:
-        # 기존 인덱스 삭제
-        if opensearch_client.indices.exists(index=OPENSEARCH_INDEX):
-            opensearch_client.indices.delete(index=OPENSEARCH_INDEX)
-            logger.info(f"기존 인덱스 삭제: {OPENSEARCH_INDEX}")
+        partitions = opensearch_client.cat.indices(
+            index=partition_index_pattern(OPENSEARCH_INDEX),
+            format="json",
+            h="index,docs.count,store.size"
+        ) if PARTITION_STRATEGY != "none" else []
         
-        # 새 인덱스 생성
-        await ensure_index_exists()
+        return {
+            "strategy": PARTITION_STRATEGY,
+            "field": PARTITION_FIELD if PARTITION_STRATEGY == "field" else None,
+            "time_granularity": PARTITION_TIME_GRANULARITY if PARTITION_STRATEGY == "time" else None,
+            "partitions": sorted(partitions, key=lambda p: p["index"])
+        }
+    except Exception as e:
+        logger.error(f"파티션 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"파티션 조회 실패: {str(e)}")
+
+@app.get("/admin/aliases")
+async def get_aliases():
+    """읽기/쓰기 별칭이 가리키는 물리 인덱스 조회"""
+    try:
+        return {
+            "read_alias": OPENSEARCH_INDEX,
+            "read_indices": resolve_alias(opensearch_client, OPENSEARCH_INDEX),
+            "write_alias": write_alias_name(OPENSEARCH_INDEX),
+            "write_indices": resolve_alias(opensearch_client, write_alias_name(OPENSEARCH_INDEX)),
+            "legacy_index": is_concrete_index(opensearch_client, OPENSEARCH_INDEX)
+        }
+    except Exception as e:
+        logger.error(f"별칭 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"별칭 조회 실패: {str(e)}")
+
+async def train_pq_model(sample_size: int) -> Dict[str, Any]:
+    """기존 임베딩 샘플로 IVF-PQ 모델 학습"""
+    source_encoding = get_index_vector_encoding(resolve_read_indices()[0])
+    if source_encoding in ("byte", "pq"):
+        raise ValueError(f"{source_encoding} 인덱스의 벡터로는 PQ 모델을 학습할 수 없습니다")
+    
+    # 1. 기존 인덱스에서 무작위 샘플 추출
+    response = opensearch_client.search(
+        index=OPENSEARCH_INDEX,
+        body={
+            "size": sample_size,
+            "query": {
+                "function_score": {
+                    "query": {"match_all": {}},
+                    "random_score": {}
+                }
+            },
+            "_source": ["embedding"]
+        }
+    )
+    # 인덱싱 경로와 같이 단위 벡터로 학습 (정규화 이전 인덱스의 샘플 포함)
+    samples = [
+        normalize_vector(hit["_source"]["embedding"])
+        for hit in response.get("hits", {}).get("hits", [])
+        if hit.get("_source", {}).get("embedding")
+    ]
+    
+    if not samples:
+        raise ValueError("학습에 사용할 임베딩이 없습니다")
+    
+    # 2. 학습용 인덱스 생성 및 샘플 적재
+    training_index = f"{OPENSEARCH_INDEX}-pq-training"
+    if opensearch_client.indices.exists(index=training_index):
+        opensearch_client.indices.delete(index=training_index)
+    opensearch_client.indices.create(index=training_index, body=build_training_index_body())
+    
+    try:
+        bulk_body = []
+        for vector in samples:
+            bulk_body.append({"index": {"_index": training_index}})
+            bulk_body.append({"embedding": vector})
+        opensearch_client.bulk(body=bulk_body, refresh=True)
+        
+        logger.info(f"PQ 학습 샘플 적재 완료: {len(samples)}개")
         
-        return {"message": f"인덱스 재생성 완료: {OPENSEARCH_INDEX}"}
+        # 3. 모델 학습 요청 (기존 모델이 있으면 삭제)
+        model_path = f"/_plugins/_knn/models/{PQ_MODEL_ID}"
+        try:
+            opensearch_client.transport.perform_request("DELETE", model_path)
+        except Exception:
+            pass
+        
+        opensearch_client.transport.perform_request(
+            "POST",
+            f"{model_path}/_train",
+            body=build_pq_train_body(training_index, space_type=KNN_SPACE_TYPE)
+        )
         
+        # 4. 학습 완료 대기 (PQ_TRAIN_TIMEOUT 초과 시 중단)
+        deadline = time.monotonic() + PQ_TRAIN_TIMEOUT
+        state = "training"
+        while state == "training":
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"PQ 모델 학습 시간 초과 ({PQ_TRAIN_TIMEOUT:.0f}초, 모델 상태: {state})")
+            await asyncio.sleep(2)
+            model = opensearch_client.transport.perform_request("GET", model_path)
+            state = model.get("state", "failed")
+    finally:
+        # 학습 성공/실패/시간 초과와 관계없이 학습용 인덱스 정리
+        try:
+            opensearch_client.indices.delete(index=training_index)
+        except Exception as e:
+            logger.warning(f"PQ 학습용 인덱스 삭제 실패: {training_index} ({e})")
+    
+    if state != "created":
+        raise RuntimeError(f"PQ 모델 학습 실패: {model.get('error', state)}")
+    
+    logger.info(f"PQ 모델 학습 완료: {PQ_MODEL_ID}")
+    return {"model_id": PQ_MODEL_ID, "state": state, "training_samples": len(samples)}
+
+@app.post("/admin/train-pq")
+async def train_pq(
+    sample_size: int = Query(PQ_TRAINING_SAMPLE_SIZE, description="학습 샘플 수", ge=256, le=10000)
+):
+    """IVF-PQ 모델 학습 (pq 인코딩 인덱스 생성 전 필요)"""
+    try:
+        return await train_pq_model(sample_size)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"인덱스 재생성 실패: {e}")
-        raise HTTPException(status_code=500, detail=f"인덱스 재생성 실패: {str(e)}")
+        logger.error(f"PQ 모델 학습 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"PQ 모델 학습 실패: {str(e)}")
 
 @app.get("/admin/index-info")
 async def get_index_info():
@@ -471,12 +1393,21 @@ async def get_index_info():
         mapping = opensearch_client.indices.get_mapping(index=OPENSEARCH_INDEX)
         settings = opensearch_client.indices.get_settings(index=OPENSEARCH_INDEX)
         stats = opensearch_client.indices.stats(index=OPENSEARCH_INDEX)
+        index_stats = stats['_all']['total']
+        read_indices = resolve_read_indices()
+        vector_encoding = get_index_vector_encoding(read_indices[0])
         
         return {
             "exists": True,
+            "read_indices": read_indices,
             "mapping": mapping,
             "settings": settings,
-            "stats": stats['indices'][OPENSEARCH_INDEX]['total']
+            "stats": index_stats,
+            "vector_encoding": vector_encoding,
+            "estimated_vector_memory_bytes": estimate_vector_memory_bytes(
+                vector_encoding,
+                index_stats['docs']['count']
+            )
         }
         
     except Exception as e:
@@ -488,6 +1419,7 @@ async def get_index_info():
 async def startup_event():
     """애플리케이션 시작 시 실행"""
     logger.info(f"{SERVICE_NAME} v{SERVICE_VERSION} 시작")
+    tracing.init_tracing(SERVICE_NAME, SERVICE_VERSION)
     
     # OpenSearch 연결 테스트
     try:
@@ -506,6 +1438,8 @@ async def startup_event():
     # 인덱스 생성 확인
     try:
         await ensure_index_exists()
+        if PARTITION_STRATEGY != "none":
+            ensure_partition_template()
     except Exception as e:
         logger.error(f"인덱스 초기화 실패: {e}")
     
@@ -517,6 +1451,7 @@ async def shutdown_event():
     """애플리케이션 종료 시 실행"""
     logger.info(f"{SERVICE_NAME} 종료")
     kafka_producer.flush()
+    tracing.shutdown_tracing()
     try:
         redis_client.close()
     except Exception:
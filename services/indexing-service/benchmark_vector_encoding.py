@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+벡터 인코딩 벤치마크
+float32(기존 매핑) 대비 fp16 / byte / IVF-PQ 인코딩의 recall@k와 k-NN 메모리 사용량 비교
+
+정확 검색(brute force) 기준으로 양자화에 의한 손실만 측정하며,
+HNSW/IVF 그래프 탐색 손실은 포함하지 않음.
+인덱싱 경로와 같이 모든 인코딩에 단위 벡터 정규화를 적용한 float32 결과를 정답으로 사용
+
+사용 예:
+    python benchmark_vector_encoding.py --vectors 5000 --queries 100 --k 10
+    python benchmark_vector_encoding.py --opensearch localhost:9200 --index enterprise-rag
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from vector_encoding import (
+    VECTOR_DIMENSION,
+    PQ_M,
+    PQ_CODE_SIZE,
+    encode_vector,
+    estimate_vector_memory_bytes,
+    normalize_vector
+)
+
+def load_synthetic_vectors(count: int, dimension: int, seed: int) -> np.ndarray:
+    """클러스터 구조를 가진 합성 임베딩 생성"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(0, 1, size=(64, dimension)).astype(np.float32)
+    assignments = rng.integers(0, len(centers), size=count)
+    noise = rng.normal(0, 0.6, size=(count, dimension)).astype(np.float32)
+    return (centers[assignments] + noise) * 0.05
+
+def load_opensearch_vectors(endpoint: str, index: str, count: int) -> np.ndarray:
+    """OpenSearch 인덱스에서 무작위 임베딩 샘플 조회"""
+    from opensearchpy import OpenSearch
+
+    client = OpenSearch(hosts=[endpoint], timeout=60)
+    response = client.search(
+        index=index,
+        body={
+            "size": count,
+            "query": {
+                "function_score": {
+                    "query": {"match_all": {}},
+                    "random_score": {}
+                }
+            },
+            "_source": ["embedding"]
+        }
+    )
+    vectors = [hit["_source"]["embedding"] for hit in response["hits"]["hits"]]
+    return np.asarray(vectors, dtype=np.float32)
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """L2 거리 기준 정확 top-k"""
+    corpus = corpus.astype(np.float32)
+    queries = queries.astype(np.float32)
+    distances = (
+        (queries ** 2).sum(axis=1, keepdims=True)
+        - 2 * queries @ corpus.T
+        + (corpus ** 2).sum(axis=1)
+    )
+    return np.argsort(distances, axis=1)[:, :k]
+
+def recall_at_k(truth: np.ndarray, found: np.ndarray) -> float:
+    """정답 top-k 대비 recall"""
+    hits = sum(len(set(t) & set(f)) for t, f in zip(truth, found))
+    return hits / truth.size
+
+def train_pq(corpus: np.ndarray, pq_m: int, code_size: int, iterations: int, seed: int):
+    """서브벡터별 k-means로 PQ 코드북 학습 후 코퍼스 인코딩"""
+    rng = np.random.default_rng(seed)
+    num_centroids = 2 ** code_size
+    sub_dim = corpus.shape[1] // pq_m
+    codebooks = np.zeros((pq_m, num_centroids, sub_dim), dtype=np.float32)
+    codes = np.zeros((len(corpus), pq_m), dtype=np.int32)
+
+    for m in range(pq_m):
+        sub = corpus[:, m * sub_dim:(m + 1) * sub_dim]
+        centroids = sub[rng.choice(len(sub), size=min(num_centroids, len(sub)), replace=False)]
+        for _ in range(iterations):
+            distances = (centroids ** 2).sum(axis=1) - 2 * sub @ centroids.T
+            assignment = distances.argmin(axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sub)
+            counts = np.bincount(assignment, minlength=len(centroids))
+            filled = counts > 0
+            centroids[filled] = sums[filled] / counts[filled, None]
+        codebooks[m, :len(centroids)] = centroids
+        codes[:, m] = assignment
+
+    return codebooks, codes
+
+def pq_top_k(codebooks: np.ndarray, codes: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """비대칭 거리 계산(ADC)으로 PQ top-k"""
+    pq_m, _, sub_dim = codebooks.shape
+    results = []
+    for query in queries:
+        table = np.stack([
+            ((codebooks[m] - query[m * sub_dim:(m + 1) * sub_dim]) ** 2).sum(axis=1)
+            for m in range(pq_m)
+        ])
+        distances = table[np.arange(pq_m), codes].sum(axis=1)
+        results.append(np.argsort(distances)[:k])
+    return np.asarray(results)
+
+def main():
+    """메인 벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="벡터 인코딩 recall@k / 메모리 벤치마크")
+    parser.add_argument("--vectors", type=int, default=5000, help="코퍼스 벡터 수")
+    parser.add_argument("--queries", type=int, default=100, help="질의 벡터 수")
+    parser.add_argument("--k", type=int, default=10, help="recall@k의 k")
+    parser.add_argument("--pq-iterations", type=int, default=8, help="PQ k-means 반복 횟수")
+    parser.add_argument("--scale-to", type=int, default=1_000_000, help="메모리 추정 대상 벡터 수")
+    parser.add_argument("--opensearch", help="샘플을 가져올 OpenSearch 엔드포인트")
+    parser.add_argument("--index", default="enterprise-rag", help="샘플을 가져올 인덱스")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    total = args.vectors + args.queries
+    if args.opensearch:
+        vectors = load_opensearch_vectors(args.opensearch, args.index, total)
+    else:
+        vectors = load_synthetic_vectors(total, VECTOR_DIMENSION, args.seed)
+
+    if len(vectors) <= args.queries:
+        print("❌ 벤치마크에 필요한 벡터가 부족합니다")
+        return False
+
+    # 인덱싱/검색 경로와 동일한 정규화 (인코딩 간 차이는 양자화 손실만 남음)
+    vectors = np.asarray([normalize_vector(v.tolist()) for v in vectors], dtype=np.float32)
+    queries, corpus = vectors[:args.queries], vectors[args.queries:]
+    truth = exact_top_k(corpus, queries, args.k)
+
+    print("=" * 70)
+    print(f"📊 벡터 인코딩 벤치마크 (코퍼스 {len(corpus)}개, 질의 {len(queries)}개, k={args.k})")
+    print("=" * 70)
+
+    results = []
+
+    # float32 (기존 매핑)
+    results.append(("float32", 1.0, 0.0))
+
+    # fp16: faiss SQfp16과 동일하게 반정밀도로 저장
+    started = time.time()
+    fp16_found = exact_top_k(corpus.astype(np.float16), queries, args.k)
+    results.append(("fp16", recall_at_k(truth, fp16_found), time.time() - started))
+
+    # byte: 인덱싱/검색 경로와 동일한 encode_vector 사용
+    started = time.time()
+    byte_corpus = np.asarray([encode_vector(v.tolist(), "byte") for v in corpus], dtype=np.float32)
+    byte_queries = np.asarray([encode_vector(v.tolist(), "byte") for v in queries], dtype=np.float32)
+    byte_found = exact_top_k(byte_corpus, byte_queries, args.k)
+    results.append(("byte", recall_at_k(truth, byte_found), time.time() - started))
+
+    # IVF-PQ: 코드북 학습 후 ADC 검색
+    started = time.time()
+    codebooks, codes = train_pq(corpus, PQ_M, PQ_CODE_SIZE, args.pq_iterations, args.seed)
+    pq_found = pq_top_k(codebooks, codes, queries, args.k)
+    results.append(("pq", recall_at_k(truth, pq_found), time.time() - started))
+
+    baseline_memory = estimate_vector_memory_bytes("float32", args.scale_to)
+    print(f"{'인코딩':<10}{'recall@' + str(args.k):>12}{'메모리(' + str(args.scale_to) + '개)':>24}{'절감률':>10}{'소요(s)':>10}")
+    print("-" * 70)
+    for encoding, recall, elapsed in results:
+        memory = estimate_vector_memory_bytes(encoding, args.scale_to)
+        saving = (1 - memory / baseline_memory) * 100
+        print(f"{encoding:<10}{recall:>12.4f}{memory / 1024 ** 3:>20.2f} GiB{saving:>9.1f}%{elapsed:>10.2f}")
+
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
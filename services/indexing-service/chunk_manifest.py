@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+청크 매니페스트 모듈
+문서별로 인덱싱된 청크의 콘텐츠 해시를 기록하고 증분 인덱싱 diff를 계산하는 기능 제공
+
+매니페스트 (Redis: doc_manifest:{doc_id})
+    {"chunks": {"0": {"hash": "...", "index": "enterprise-rag-v1"}, ...}, "updated_at": "..."}
+"""
+
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional, Any, Tuple
+
+# 해시에서 제외할 메타데이터 필드 기본값 (업로드마다 바뀌어 청크 내용과 무관한 필드)
+DEFAULT_HASH_IGNORED_METADATA_FIELDS = (
+    "uploaded_at", "ingested_at", "indexed_at", "timestamp", "upload_id", "ingest_id", "request_id"
+)
+
+def manifest_key(doc_id: str) -> str:
+    """문서 매니페스트 Redis 키"""
+    return f"doc_manifest:{doc_id}"
+
+def chunk_document_id(doc_id: str, chunk_index: int) -> str:
+    """청크의 OpenSearch 문서 ID"""
+    return f"{doc_id}_chunk_{chunk_index}"
+
+def chunk_content_hash(
+    chunk_text: str,
+    metadata: Optional[Dict] = None,
+    ignored_fields: Iterable[str] = DEFAULT_HASH_IGNORED_METADATA_FIELDS
+) -> str:
+    """청크 콘텐츠 해시 (임베딩 생성 서비스와 동일한 규칙)
+
+    메타데이터는 ignored_fields를 제외한 모든 필드를 포함
+    (청크 문서에 기록되는 메타데이터가 바뀌면 다시 인덱싱되고,
+    업로드 시각/업로드 ID 등 업로드마다 바뀌는 필드로 모든 청크가 변경 처리되지는 않도록)
+    """
+    hashed_metadata = {
+        field: value for field, value in (metadata or {}).items() if field not in ignored_fields
+    }
+    payload = json.dumps(
+        {"text": chunk_text, "metadata": hashed_metadata},
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def diff_chunks(
+    manifest_chunks: Dict[str, Dict[str, str]],
+    chunk_hashes: List[str],
+    embeddings: List[Dict[str, Any]],
+    target_index: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], int, Dict[int, Dict[str, str]]]:
+    """인덱싱할 청크 / 변경 없는 청크 수 / 제거된 청크 계산
+
+    target_index가 주어지면 (파티셔닝) 다른 인덱스에 기록된 청크도 변경된 것으로 취급
+
+    Returns:
+        (인덱싱할 임베딩 목록, 건너뛴 청크 수, 제거할 청크 {chunk_index: 매니페스트 항목})
+    """
+    to_index = []
+    skipped = 0
+
+    for embedding_data in embeddings:
+        chunk_index = embedding_data.get("chunk_index", 0)
+        previous = manifest_chunks.get(str(chunk_index))
+        if (
+            previous
+            and chunk_index < len(chunk_hashes)
+            and previous.get("hash") == chunk_hashes[chunk_index]
+            and (target_index is None or previous.get("index") == target_index)
+        ):
+            skipped += 1
+            continue
+        to_index.append(embedding_data)
+
+    # 새 버전에 없는 청크 (문서가 짧아진 경우)
+    removed = {
+        int(chunk_index): entry
+        for chunk_index, entry in manifest_chunks.items()
+        if int(chunk_index) >= len(chunk_hashes)
+    }
+
+    return to_index, skipped, removed
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+인덱스 별칭(alias) 관리 모듈
+버전별 물리 인덱스와 읽기/쓰기 별칭, 블루/그린 교체에 필요한 기능 제공
+
+- 읽기 별칭: OPENSEARCH_INDEX (검색 API가 사용하는 이름 그대로)
+- 쓰기 별칭: {OPENSEARCH_INDEX}-write
+- 물리 인덱스: {OPENSEARCH_INDEX}-v{버전}
+"""
+
+import re
+from typing import Dict, List, Optional, Any
+
+from opensearchpy.exceptions import NotFoundError
+
+def write_alias_name(base: str) -> str:
+    """쓰기 별칭 이름"""
+    return f"{base}-write"
+
+def physical_index_name(base: str, version: int) -> str:
+    """버전별 물리 인덱스 이름"""
+    return f"{base}-v{version}"
+
+def parse_index_version(index: str, base: str) -> Optional[int]:
+    """물리 인덱스 이름에서 버전 추출"""
+    match = re.fullmatch(rf"{re.escape(base)}-v(\d+)", index)
+    return int(match.group(1)) if match else None
+
+def next_index_version(client, base: str) -> int:
+    """다음 물리 인덱스 버전 계산"""
+    try:
+        existing = client.indices.get(index=f"{base}-v*")
+    except NotFoundError:
+        existing = {}
+
+    versions = [
+        version for version in (parse_index_version(name, base) for name in existing)
+        if version is not None
+    ]
+    return max(versions, default=0) + 1
+
+def resolve_alias(client, alias: str) -> List[str]:
+    """별칭이 가리키는 물리 인덱스 목록 (별칭이 없으면 빈 목록)"""
+    try:
+        return sorted(client.indices.get_alias(name=alias).keys())
+    except NotFoundError:
+        return []
+
+def is_concrete_index(client, name: str) -> bool:
+    """별칭이 아닌 실제 인덱스인지 확인 (별칭 도입 이전의 레거시 인덱스)"""
+    return client.indices.exists(index=name) and not client.indices.exists_alias(name=name)
+
+def build_initial_aliases(base: str) -> Dict[str, Any]:
+    """첫 물리 인덱스 생성 시 함께 등록할 별칭"""
+    return {
+        base: {},
+        write_alias_name(base): {"is_write_index": True}
+    }
+
+def build_write_alias_actions(base: str, new_index: str, old_write_indices: List[str]) -> List[Dict[str, Any]]:
+    """쓰기 별칭을 새 인덱스로 이동하는 _aliases 액션"""
+    alias = write_alias_name(base)
+    actions = [
+        {"remove": {"index": index, "alias": alias}}
+        for index in old_write_indices if index != new_index
+    ]
+    actions.append({"add": {"index": new_index, "alias": alias, "is_write_index": True}})
+    return actions
+
+def build_swap_actions(
+    base: str,
+    new_index: str,
+    old_read_indices: List[str],
+    legacy_index: bool = False
+) -> List[Dict[str, Any]]:
+    """읽기 별칭을 새 인덱스로 원자적으로 교체하는 _aliases 액션"""
+    actions = []
+
+    if legacy_index:
+        # 별칭과 같은 이름의 레거시 인덱스는 같은 요청에서 제거해야 별칭 등록 가능
+        actions.append({"remove_index": {"index": base}})
+    else:
+        actions.extend(
+            {"remove": {"index": index, "alias": base}}
+            for index in old_read_indices if index != new_index
+        )
+
+    actions.append({"add": {"index": new_index, "alias": base}})
+    return actions
+
+def build_reindex_script(source_encoding: str, dest_encoding: str, byte_scale: float) -> Optional[Dict[str, Any]]:
+    """_reindex 시 벡터 변환 painless 스크립트 (정규화 이전 인덱스도 단위 벡터로 변환)"""
+    if source_encoding == "byte" and dest_encoding == "byte":
+        return None
+
+    if source_encoding == "byte":
+        # byte -> float: 단위 벡터로 복원
+        source = (
+            "def out = new ArrayList();"
+            "for (def x : ctx._source.embedding) { out.add(x / params.scale); }"
+            "ctx._source.embedding = out;"
+        )
+    else:
+        # float -> float/byte: 정규화 후 byte는 정수 양자화 (vector_encoding.encode_vector와 동일)
+        source = (
+            "def v = ctx._source.embedding; double norm = 0;"
+            "for (def x : v) { norm += x * x; }"
+            "norm = norm > 0 ? Math.sqrt(norm) : 1;"
+            "def out = new ArrayList();"
+            "for (def x : v) {"
+            " if (params.quantize) { long q = Math.round(x / norm * params.scale);"
+            " out.add(Math.max(-128, Math.min(127, q))); }"
+            " else { out.add(x / norm); } }"
+            "ctx._source.embedding = out;"
+        )
+
+    return {
+        "lang": "painless",
+        "source": source,
+        "params": {"scale": byte_scale, "quantize": dest_encoding == "byte"}
+    }
+
+def summarize_bulk_by_scroll_task(task: Dict[str, Any], started_at: float, now: float) -> Dict[str, Any]:
+    """_reindex / _delete_by_query 작업(_tasks 응답)의 진행률/처리량 계산"""
+    status = task.get("task", {}).get("status", {})
+    total = status.get("total", 0)
+    processed = (
+        status.get("created", 0)
+        + status.get("updated", 0)
+        + status.get("deleted", 0)
+        + status.get("version_conflicts", 0)
+    )
+    elapsed = max(now - started_at, 1e-6)
+
+    return {
+        "total_docs": total,
+        "processed_docs": processed,
+        "created_docs": status.get("created", 0),
+        "deleted_docs": status.get("deleted", 0),
+        "version_conflicts": status.get("version_conflicts", 0),
+        "progress_percent": round(processed / total * 100, 2) if total else 0.0,
+        "throughput_docs_per_sec": round(processed / elapsed, 2),
+        "completed": bool(task.get("completed")),
+        "failures": task.get("response", {}).get("failures", []) if task.get("completed") else []
+    }
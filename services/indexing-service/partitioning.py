@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+인덱스 파티셔닝 모듈
+테넌트/메타데이터 필드 또는 시간 기준으로 문서를 파티션 인덱스에 배치하는 기능 제공
+
+- 파티션 인덱스: {OPENSEARCH_INDEX}-p-{파티션 키}
+- 인덱스 템플릿이 매핑/설정과 읽기 별칭을 부여하므로 첫 기록 시 자동 생성됨
+"""
+
+import re
+from datetime import datetime
+from typing import Dict, Optional, Any
+
+SUPPORTED_STRATEGIES = ("none", "field", "time")
+DEFAULT_PARTITION_KEY = "default"
+
+# 시간 파티션 단위별 키 형식
+_TIME_FORMATS = {
+    "month": "%Y-%m",
+    "day": "%Y-%m-%d",
+}
+
+def validate_strategy(strategy: str) -> str:
+    """파티셔닝 전략 이름 검증"""
+    strategy = (strategy or "none").lower()
+    if strategy not in SUPPORTED_STRATEGIES:
+        raise ValueError(
+            f"지원하지 않는 파티셔닝 전략: {strategy} (지원: {', '.join(SUPPORTED_STRATEGIES)})"
+        )
+    return strategy
+
+def sanitize_partition_key(key: Any) -> str:
+    """인덱스 이름에 사용할 수 있는 파티션 키로 변환 (검색 API와 동일한 규칙)"""
+    sanitized = re.sub(r"[^a-z0-9_-]+", "-", str(key).strip().lower()).strip("-_")
+    return sanitized[:64] or DEFAULT_PARTITION_KEY
+
+def partition_index_pattern(base: str) -> str:
+    """파티션 인덱스 패턴"""
+    return f"{base}-p-*"
+
+def partition_index_name(base: str, key: Any) -> str:
+    """파티션 키에 해당하는 인덱스 이름"""
+    return f"{base}-p-{sanitize_partition_key(key)}"
+
+def partition_key_for(
+    strategy: str,
+    metadata: Dict[str, Any],
+    field: str,
+    time_field: Optional[str] = None,
+    granularity: str = "month",
+    now: Optional[datetime] = None
+) -> Optional[str]:
+    """문서 메타데이터로부터 파티션 키 계산 (파티셔닝을 사용하지 않으면 None)"""
+    if strategy == "field":
+        value = (metadata or {}).get(field)
+        return sanitize_partition_key(value) if value not in (None, "") else DEFAULT_PARTITION_KEY
+
+    if strategy == "time":
+        timestamp = now or datetime.utcnow()
+        value = (metadata or {}).get(time_field) if time_field else None
+        if value:
+            try:
+                timestamp = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+            except ValueError:
+                pass
+        return timestamp.strftime(_TIME_FORMATS.get(granularity, _TIME_FORMATS["month"]))
+
+    return None
+
+def build_partition_template(base: str, index_body: Dict[str, Any], number_of_shards: int = 1) -> Dict[str, Any]:
+    """파티션 인덱스용 composable 인덱스 템플릿"""
+    settings = {
+        "index": dict(index_body["settings"]["index"], number_of_shards=number_of_shards)
+    }
+
+    return {
+        "index_patterns": [partition_index_pattern(base)],
+        "priority": 100,
+        "template": {
+            "settings": settings,
+            "mappings": index_body["mappings"],
+            # 모든 파티션이 읽기 별칭에 포함되어 라우팅 없는 검색도 전체 코퍼스를 조회
+            "aliases": {base: {}}
+        },
+        "_meta": {"managed_by": "indexing-service"}
+    }
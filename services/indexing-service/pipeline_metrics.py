@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+파이프라인 메트릭 모듈
+Kafka 컨슈머 랙, 처리 중 문서 수, 큐 대기/처리 시간 분포와 단계별 이벤트 타임스탬프 계산 기능 제공
+
+- 컨슈머 랙은 librdkafka 통계 콜백(statistics.interval.ms)으로 수집 (브로커 추가 조회 없음)
+- 대기/처리 시간은 최근 window건만 유지 (프로세스 단위)
+- 서비스마다 같은 파일을 둠 (서비스별 Docker 빌드 컨텍스트, 수정 시 모든 사본을 함께 변경해야 하며 search-api/tests/test_module_copies.py에서 검사)
+"""
+
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# 이벤트에 실려 전달되는 단계별 타임스탬프 (파이프라인 순서)
+STAGE_TIMESTAMPS = ("ingested_at", "extracted_at", "generated_at", "indexed_at")
+
+def percentiles(values: Iterable[float], points=(50, 90, 95, 99)) -> Dict[str, Any]:
+    """백분위수 요약 (nearest-rank)"""
+    ordered = sorted(values)
+    if not ordered:
+        return {"count": 0}
+    summary: Dict[str, Any] = {"count": len(ordered)}
+    for point in points:
+        rank = max(0, min(len(ordered) - 1, int(round(point / 100 * len(ordered))) - 1))
+        summary[f"p{point}"] = round(ordered[rank], 1)
+    summary["max"] = round(ordered[-1], 1)
+    return summary
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """ISO 형식 타임스탬프 파싱 (UTC naive 기준, 형식 오류 시 None)"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = datetime.utcfromtimestamp(parsed.timestamp())
+    return parsed
+
+def message_timestamp(msg) -> Optional[str]:
+    """Kafka 메시지 타임스탬프(생성/기록 시각)를 ISO 형식으로 변환"""
+    try:
+        timestamp_type, timestamp_ms = msg.timestamp()
+    except Exception:
+        return None
+    if timestamp_ms is None or timestamp_ms <= 0:
+        return None
+    return datetime.utcfromtimestamp(timestamp_ms / 1000).isoformat()
+
+def stage_timestamps(event: Dict[str, Any]) -> Dict[str, str]:
+    """이벤트에서 단계별 타임스탬프만 추출"""
+    return {key: event[key] for key in STAGE_TIMESTAMPS if event.get(key)}
+
+def stage_latencies(timestamps: Dict[str, str]) -> Dict[str, float]:
+    """인접 단계 간 및 전체(ingested -> indexed) 지연 시간(ms)"""
+    parsed = [(key, parse_timestamp(timestamps.get(key))) for key in STAGE_TIMESTAMPS]
+    parsed = [(key, value) for key, value in parsed if value is not None]
+    latencies = {}
+    for (prev_key, prev_value), (key, value) in zip(parsed, parsed[1:]):
+        latencies[f"{prev_key[:-3]}_to_{key[:-3]}_ms"] = (value - prev_value).total_seconds() * 1000
+    if len(parsed) > 1:
+        latencies["end_to_end_ms"] = (parsed[-1][1] - parsed[0][1]).total_seconds() * 1000
+    return latencies
+
+class PipelineStats:
+    """서비스별 컨슈머 랙, 처리 중 문서, 대기/처리 시간 통계"""
+
+    def __init__(self, window: int = 1000):
+        self.consumer_lag: Dict[str, Dict[str, int]] = {}
+        self.lag_updated_at: Optional[float] = None
+        self.in_flight = 0
+        self.handled = 0
+        self.failed = 0
+        self.queue_wait_ms: deque = deque(maxlen=window)
+        self.processing_ms: deque = deque(maxlen=window)
+
+    def on_kafka_stats(self, stats_json: str):
+        """librdkafka 통계 콜백 (파티션별 consumer_lag 갱신)"""
+        try:
+            stats = json.loads(stats_json)
+        except ValueError:
+            return
+        consumer_lag = {}
+        for topic, topic_stats in stats.get("topics", {}).items():
+            partitions = {}
+            for partition, partition_stats in topic_stats.get("partitions", {}).items():
+                # -1: 내부 파티션, 미할당 파티션은 consumer_lag가 -1
+                lag = partition_stats.get("consumer_lag", -1)
+                if partition != "-1" and lag >= 0:
+                    partitions[partition] = lag
+            if partitions:
+                consumer_lag[topic] = partitions
+        self.consumer_lag = consumer_lag
+        self.lag_updated_at = time.time()
+
+    def record_queue_wait(self, msg):
+        """메시지 생성 시각부터 컨슈머 수신까지 대기 시간 기록"""
+        try:
+            timestamp_type, timestamp_ms = msg.timestamp()
+        except Exception:
+            return
+        if timestamp_ms and timestamp_ms > 0:
+            self.queue_wait_ms.append(max(0.0, time.time() * 1000 - timestamp_ms))
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """문서 한 건 처리 구간 (처리 중 문서 수와 처리 시간 기록)"""
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self.handled += 1
+            self.processing_ms.append((time.perf_counter() - started) * 1000)
+
+    def record_failure(self):
+        """처리 실패 기록 (처리 함수가 예외를 직접 처리하는 경우)"""
+        self.failed += 1
+
+    def total_lag(self) -> int:
+        """할당된 전체 파티션 랙 합계"""
+        return sum(sum(partitions.values()) for partitions in self.consumer_lag.values())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """파이프라인 통계"""
+        return {
+            "consumer_lag": self.consumer_lag,
+            "consumer_lag_total": self.total_lag(),
+            "consumer_lag_age_seconds": round(time.time() - self.lag_updated_at, 1) if self.lag_updated_at else None,
+            "in_flight_documents": self.in_flight,
+            "handled_documents": self.handled,
+            "failed_documents": self.failed,
+            "queue_wait_ms": percentiles(self.queue_wait_ms),
+            "processing_ms": percentiles(self.processing_ms)
+        }
+
+def latency_summary(records: List[Dict[str, float]]) -> Dict[str, Any]:
+    """문서별 단계 지연 시간 목록의 단계별 백분위수"""
+    keys = sorted({key for record in records for key in record})
+    return {key: percentiles(record[key] for record in records if key in record) for key in keys}
@@ -0,0 +1,105 @@
+"""증분 인덱싱 테스트 (청크 해시 규칙과 메타데이터 변경 시 재인덱싱)"""
+
+import asyncio
+import json
+
+import pytest
+
+import app
+from chunk_manifest import chunk_content_hash, manifest_key
+
+INDEX = "enterprise-rag-v1"
+
+class FakeRedis:
+    """증분 인덱싱 경로에서 쓰는 Redis 명령만 구현한 메모리 저장소"""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+    def incr(self, key):
+        return self.incrby(key, 1)
+
+    def incrby(self, key, amount):
+        self.values[key] = int(self.values.get(key, 0)) + amount
+        return self.values[key]
+
+class FakeOpenSearch:
+    """bulk 요청을 기록하고 모든 액션을 성공으로 응답"""
+
+    def __init__(self):
+        self.documents = {}
+        self.bulk_calls = 0
+
+    def bulk(self, body, **kwargs):
+        self.bulk_calls += 1
+        items = []
+        for action, source in zip(body[::2], body[1::2]):
+            meta = action["index"]
+            self.documents[meta["_id"]] = source
+            items.append({"index": {"_index": meta["_index"], "_id": meta["_id"], "status": 200}})
+        return {"items": items}
+
+@pytest.fixture
+def stores(monkeypatch):
+    redis_client = FakeRedis()
+    opensearch_client = FakeOpenSearch()
+
+    async def ensure_index_exists(vector_encoding=None):
+        return None
+
+    monkeypatch.setattr(app, "redis_client", redis_client)
+    monkeypatch.setattr(app, "opensearch_client", opensearch_client)
+    monkeypatch.setattr(app, "ensure_index_exists", ensure_index_exists)
+    monkeypatch.setattr(app, "resolve_document_indices", lambda metadata: [INDEX])
+    monkeypatch.setattr(app, "get_index_vector_encoding", lambda index: "float")
+    return redis_client, opensearch_client
+
+def embeddings(texts):
+    return [
+        {"chunk_index": chunk_index, "chunk_text": text, "embedding": [0.1] * 1536}
+        for chunk_index, text in enumerate(texts)
+    ]
+
+def index(texts, metadata):
+    hashes = [chunk_content_hash(text, metadata) for text in texts]
+    return asyncio.run(app.index_document_incremental("doc-1", embeddings(texts), metadata, hashes))
+
+def test_volatile_metadata_does_not_change_hash():
+    first = chunk_content_hash("본문", {"title": "규정", "uploaded_at": "2024-01-01", "upload_id": "a"})
+    second = chunk_content_hash("본문", {"title": "규정", "uploaded_at": "2024-02-01", "upload_id": "b"})
+    assert first == second
+
+def test_unlisted_metadata_field_changes_hash():
+    first = chunk_content_hash("본문", {"title": "규정", "department": "HR"})
+    second = chunk_content_hash("본문", {"title": "규정", "department": "Legal"})
+    assert first != second
+
+def test_unchanged_chunks_are_skipped(stores):
+    _, opensearch_client = stores
+    texts = ["첫 번째 청크", "두 번째 청크"]
+    index(texts, {"title": "규정", "uploaded_at": "2024-01-01"})
+
+    result = index(texts, {"title": "규정", "uploaded_at": "2024-02-01"})
+    assert result["skipped_chunks"] == 2
+    assert opensearch_client.bulk_calls == 1
+
+def test_metadata_change_reindexes_chunks_with_new_metadata(stores):
+    redis_client, opensearch_client = stores
+    texts = ["첫 번째 청크", "두 번째 청크"]
+    index(texts, {"title": "규정", "department": "HR"})
+
+    result = index(texts, {"title": "규정", "department": "Legal"})
+    assert sorted(result["indexed_chunks"]) == [0, 1]
+    assert result["skipped_chunks"] == 0
+    for chunk_index in range(len(texts)):
+        document = opensearch_client.documents[f"doc-1_chunk_{chunk_index}"]
+        assert document["metadata"]["department"] == "Legal"
+
+    manifest = json.loads(redis_client.get(manifest_key("doc-1")))
+    assert manifest["chunks"]["0"]["hash"] == chunk_content_hash(texts[0], {"title": "규정", "department": "Legal"})
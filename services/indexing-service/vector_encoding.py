@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+벡터 인코딩 모듈
+OpenSearch knn_vector 매핑 생성과 벡터 압축(fp16 / byte / IVF-PQ) 인코딩 기능 제공
+
+모든 인코딩은 벡터를 단위 벡터로 정규화해 저장 (인코딩을 바꿔도 순위가 같고,
+l2/innerproduct 공간에서도 점수를 코사인 유사도로 변환할 수 있음)
+"""
+
+import math
+from typing import Dict, List, Optional, Any
+
+VECTOR_DIMENSION = 1536
+
+# 지원하는 벡터 인코딩
+# - float32: faiss HNSW (4바이트/차원, 이전 버전 인덱스는 nmslib)
+# - fp16: faiss HNSW + SQfp16 스칼라 양자화 (2바이트/차원, OpenSearch 2.13+)
+# - byte: lucene HNSW + byte 벡터 (1바이트/차원, OpenSearch 2.9+)
+# - pq: faiss IVF-PQ (학습된 모델 필요, 벡터당 pq_m * code_size / 8 바이트)
+SUPPORTED_ENCODINGS = ("float32", "fp16", "byte", "pq")
+DEFAULT_SPACE_TYPE = "l2"
+
+# HNSW 기본 파라미터 (OpenSearch 기본값과 동일)
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 100
+
+# byte 양자화 스케일 (단위 벡터 성분 [-1, 1] -> [-127, 127])
+BYTE_SCALE = 127.0
+
+# IVF-PQ 기본 파라미터 (1536 = 96 * 16, 서브벡터당 16차원)
+PQ_NLIST = 128
+PQ_NPROBES = 8
+PQ_M = 96
+PQ_CODE_SIZE = 8
+
+# 인코딩별 k-NN 엔진 (모두 knn 쿼리의 효율적 필터링(filter) 지원, OpenSearch 2.9+)
+KNN_ENGINES = {
+    "float32": "faiss",
+    "fp16": "faiss",
+    "byte": "lucene",
+    "pq": "faiss",
+}
+
+# 인코딩별 차원당 바이트 수
+_BYTES_PER_DIMENSION = {
+    "float32": 4,
+    "fp16": 2,
+    "byte": 1,
+}
+
+def validate_encoding(encoding: str) -> str:
+    """인코딩 이름 검증"""
+    encoding = (encoding or "float32").lower()
+    if encoding not in SUPPORTED_ENCODINGS:
+        raise ValueError(
+            f"지원하지 않는 벡터 인코딩: {encoding} (지원: {', '.join(SUPPORTED_ENCODINGS)})"
+        )
+    return encoding
+
+def build_knn_vector_field(
+    encoding: str,
+    space_type: str = DEFAULT_SPACE_TYPE,
+    model_id: Optional[str] = None,
+    dimension: int = VECTOR_DIMENSION
+) -> Dict[str, Any]:
+    """인코딩에 맞는 knn_vector 필드 매핑 생성"""
+    encoding = validate_encoding(encoding)
+
+    if encoding == "pq":
+        # IVF-PQ는 학습된 모델이 차원/메서드 정보를 가지고 있음
+        if not model_id:
+            raise ValueError("pq 인코딩에는 학습된 model_id가 필요합니다")
+        return {
+            "type": "knn_vector",
+            "model_id": model_id
+        }
+
+    hnsw_parameters = {
+        "m": HNSW_M,
+        "ef_construction": HNSW_EF_CONSTRUCTION
+    }
+
+    engine = KNN_ENGINES[encoding]
+    if encoding == "fp16":
+        hnsw_parameters["encoder"] = {
+            "name": "sq",
+            "parameters": {"type": "fp16"}
+        }
+
+    field = {
+        "type": "knn_vector",
+        "dimension": dimension,
+        "method": {
+            "name": "hnsw",
+            "engine": engine,
+            "space_type": space_type,
+            "parameters": hnsw_parameters
+        }
+    }
+
+    if encoding == "byte":
+        field["data_type"] = "byte"
+
+    return field
+
+def build_index_body(
+    encoding: str,
+    space_type: str = DEFAULT_SPACE_TYPE,
+    model_id: Optional[str] = None,
+    number_of_shards: int = 1,
+    number_of_replicas: int = 0
+) -> Dict[str, Any]:
+    """청크 인덱스 생성 요청 본문 (매핑 + 설정)"""
+    encoding = validate_encoding(encoding)
+
+    return {
+        "mappings": {
+            # 인덱싱/검색 경로가 동일한 인코딩을 사용하도록 매핑에 기록
+            "_meta": {
+                "vector_encoding": encoding,
+                "knn_engine": KNN_ENGINES[encoding],
+                "space_type": space_type,
+                "byte_scale": BYTE_SCALE,
+                "normalized": True
+            },
+            "properties": {
+                "doc_id": {
+                    "type": "keyword"
+                },
+                "chunk_index": {
+                    "type": "integer"
+                },
+                "chunk_text": {
+                    "type": "text",
+                    "analyzer": "standard"
+                },
+                "embedding": build_knn_vector_field(encoding, space_type, model_id),
+                "metadata": {
+                    "type": "object"
+                },
+                "indexed_at": {
+                    "type": "date"
+                }
+            }
+        },
+        "settings": {
+            "index": {
+                "number_of_shards": number_of_shards,
+                "number_of_replicas": number_of_replicas,
+                "knn": True
+            }
+        }
+    }
+
+def build_training_index_body(dimension: int = VECTOR_DIMENSION) -> Dict[str, Any]:
+    """PQ 학습용 인덱스 본문 (float 벡터만 저장)"""
+    return {
+        "mappings": {
+            "properties": {
+                "embedding": {
+                    "type": "knn_vector",
+                    "dimension": dimension
+                }
+            }
+        },
+        "settings": {
+            "index": {
+                "number_of_shards": 1,
+                "number_of_replicas": 0,
+                "knn": True
+            }
+        }
+    }
+
+def build_pq_train_body(
+    training_index: str,
+    space_type: str = DEFAULT_SPACE_TYPE,
+    dimension: int = VECTOR_DIMENSION,
+    nlist: int = PQ_NLIST,
+    nprobes: int = PQ_NPROBES,
+    pq_m: int = PQ_M,
+    code_size: int = PQ_CODE_SIZE
+) -> Dict[str, Any]:
+    """_plugins/_knn/models/{model_id}/_train 요청 본문"""
+    if dimension % pq_m != 0:
+        raise ValueError(f"pq_m({pq_m})은 벡터 차원({dimension})의 약수여야 합니다")
+
+    return {
+        "training_index": training_index,
+        "training_field": "embedding",
+        "dimension": dimension,
+        "description": f"IVF{nlist},PQ{pq_m}x{code_size} ({space_type})",
+        "method": {
+            "name": "ivf",
+            "engine": "faiss",
+            "space_type": space_type,
+            "parameters": {
+                "nlist": nlist,
+                "nprobes": nprobes,
+                "encoder": {
+                    "name": "pq",
+                    "parameters": {
+                        "m": pq_m,
+                        "code_size": code_size
+                    }
+                }
+            }
+        }
+    }
+
+def normalize_vector(vector: List[float]) -> List[float]:
+    """단위 벡터로 정규화 (영벡터는 그대로)"""
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+def encode_vector(vector: List[float], encoding: str) -> List[Any]:
+    """인덱스 인코딩에 맞게 벡터 변환 (인덱싱/검색 공통)"""
+    unit = normalize_vector(vector)
+    if encoding != "byte":
+        # float32/fp16/pq는 OpenSearch 내부에서 양자화하므로 float 그대로 전송
+        return unit
+
+    # byte: 단위 벡터 성분을 [-128, 127] 정수로 양자화
+    return [max(-128, min(127, int(round(value * BYTE_SCALE)))) for value in unit]
+
+def estimate_vector_memory_bytes(
+    encoding: str,
+    num_vectors: int,
+    dimension: int = VECTOR_DIMENSION,
+    m: int = HNSW_M,
+    nlist: int = PQ_NLIST,
+    pq_m: int = PQ_M,
+    code_size: int = PQ_CODE_SIZE
+) -> int:
+    """k-NN 네이티브 메모리 추정치 (OpenSearch k-NN 문서의 산정식 기준)"""
+    encoding = validate_encoding(encoding)
+
+    if encoding == "pq":
+        # IVF-PQ: 1.1 * ((code_size / 8) * pq_m + 24) * N + 코드북/센트로이드
+        per_vector = (code_size / 8) * pq_m + 24
+        codebook = 4 * (2 ** code_size) * dimension + 4 * nlist * dimension
+        return int(1.1 * (per_vector * num_vectors) + codebook)
+
+    # HNSW: 1.1 * (bytes_per_dimension * d + 8 * M) * N
+    per_vector = _BYTES_PER_DIMENSION[encoding] * dimension + 8 * m
+    return int(1.1 * per_vector * num_vectors)
@@ -5,20 +5,60 @@
 """
 
 import os
+import asyncio
 import json
 import hashlib
+import math
 import time
-from typing import Dict, List, Optional, Any
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 
 import boto3
 import redis
+from botocore.config import Config
 import uvicorn
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
-from opensearchpy import OpenSearch, RequestsHttpConnection
 from loguru import logger
+from opensearchpy.exceptions import NotFoundError, RequestError
+
+import deadline
+import metrics
+import tracing
+from admission import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    AdaptiveLimit,
+    AdmissionPool,
+    AdmissionRejected,
+    parse_priority
+)
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from deadline import DeadlineExceeded
+from health_monitor import HealthMonitor
+from hybrid import (
+    DEFAULT_RRF_K,
+    build_keyword_query,
+    looks_like_keyword_query,
+    reciprocal_rank_fusion,
+    validate_search_mode,
+    weighted_score_fusion
+)
+from opensearch_pool import PoolStats, create_async_client
+from partition_routing import resolve_search_indices
+from popular import WINDOWS as POPULAR_WINDOWS, PopularQueries
+from rerank import RerankBatcher, create_reranker
+from score_normalization import cosine_to_raw_score, raw_score_to_cosine
+from semantic_cache import SemanticCache
+from singleflight import RedisLease, SingleFlight
+from streaming import MEDIA_TYPES, SUPPORTED_STREAM_FORMATS, format_event, stream_results
+from suggestions import SuggestionIndex
+from search_filters import build_filter_clauses, build_filtered_knn_query
+from warmup import CacheWarmer
 
 # 설정
 OPENSEARCH_ENDPOINT = os.getenv("OPENSEARCH_ENDPOINT", "localhost:9200")
@@ -28,6 +68,93 @@ REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "ragpassword")
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "amazon.titan-embed-text-v1")
+INDEX_META_REFRESH_SECONDS = int(os.getenv("INDEX_META_REFRESH_SECONDS", "60"))
+PARTITION_STRATEGY = os.getenv("PARTITION_STRATEGY", "none").lower()
+# 시간 파티션 기준 필드 (인덱싱 서비스와 같은 값, 비어 있으면 인덱싱 시각 기준이므로 indexed_at 범위로 파티션 축소)
+PARTITION_TIME_FIELD = os.getenv("PARTITION_TIME_FIELD", "created_at")
+PARTITION_TIME_GRANULARITY = os.getenv("PARTITION_TIME_GRANULARITY", "month")
+PARTITION_ROUTING_MAX_INDICES = int(os.getenv("PARTITION_ROUTING_MAX_INDICES", "64"))
+OPENSEARCH_POOL_MAXSIZE = int(os.getenv("OPENSEARCH_POOL_MAXSIZE", "100"))
+OPENSEARCH_TIMEOUT = float(os.getenv("OPENSEARCH_TIMEOUT", "30"))
+OPENSEARCH_MAX_RETRIES = int(os.getenv("OPENSEARCH_MAX_RETRIES", "1"))
+OPENSEARCH_RETRY_ON_TIMEOUT = os.getenv("OPENSEARCH_RETRY_ON_TIMEOUT", "false").lower() == "true"
+SEARCH_REQUEST_TIMEOUT = float(os.getenv("SEARCH_REQUEST_TIMEOUT", "10"))
+# 검색 요청 기한 (DEADLINE_HEADER의 밀리초 예산, 없으면 SEARCH_DEADLINE_MS)
+DEADLINE_HEADER = os.getenv("DEADLINE_HEADER", "X-Request-Timeout-Ms")
+SEARCH_DEADLINE_MS = float(os.getenv("SEARCH_DEADLINE_MS", "3000"))
+SEARCH_DEADLINE_MAX_MS = float(os.getenv("SEARCH_DEADLINE_MAX_MS", "30000"))
+# 요청 기한 때문에 부분/빈 결과가 된 응답 (병합된 다른 요청과 공유하지 않음)
+DEADLINE_DEGRADED = ("partial", "deadline_exceeded")
+# 수락 제어 (대화형 검색과 배치 검색은 별도 풀, 한도는 지연 시간에 따라 자동 조정)
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+PRIORITY_HEADER = os.getenv("PRIORITY_HEADER", "X-Request-Priority")
+SEARCH_CONCURRENCY_INITIAL = int(os.getenv("SEARCH_CONCURRENCY_INITIAL", "50"))
+SEARCH_CONCURRENCY_MAX = int(os.getenv("SEARCH_CONCURRENCY_MAX", "200"))
+SEARCH_QUEUE_SIZE = int(os.getenv("SEARCH_QUEUE_SIZE", "100"))
+SEARCH_QUEUE_WAIT_MS = float(os.getenv("SEARCH_QUEUE_WAIT_MS", "500"))
+BATCH_CONCURRENCY_INITIAL = int(os.getenv("BATCH_CONCURRENCY_INITIAL", "4"))
+BATCH_CONCURRENCY_MAX = int(os.getenv("BATCH_CONCURRENCY_MAX", "16"))
+BATCH_QUEUE_SIZE = int(os.getenv("BATCH_QUEUE_SIZE", "20"))
+BATCH_QUEUE_WAIT_MS = float(os.getenv("BATCH_QUEUE_WAIT_MS", "2000"))
+BEDROCK_MAX_CONNECTIONS = int(os.getenv("BEDROCK_MAX_CONNECTIONS", "50"))
+BEDROCK_READ_TIMEOUT = float(os.getenv("BEDROCK_READ_TIMEOUT", "10"))
+BEDROCK_MAX_ATTEMPTS = int(os.getenv("BEDROCK_MAX_ATTEMPTS", "2"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "1"))
+# 서킷 브레이커 (의존성별 최근 CIRCUIT_WINDOW_SECONDS 동안의 실패율 기준)
+CIRCUIT_FAILURE_RATE = float(os.getenv("CIRCUIT_FAILURE_RATE", "0.5"))
+CIRCUIT_MINIMUM_CALLS = int(os.getenv("CIRCUIT_MINIMUM_CALLS", "10"))
+CIRCUIT_WINDOW_SECONDS = int(os.getenv("CIRCUIT_WINDOW_SECONDS", "30"))
+CIRCUIT_OPEN_SECONDS = float(os.getenv("CIRCUIT_OPEN_SECONDS", "15"))
+CIRCUIT_HALF_OPEN_CALLS = int(os.getenv("CIRCUIT_HALF_OPEN_CALLS", "3"))
+CIRCUIT_SLOW_CALL_SECONDS = float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "5"))
+DEFAULT_SEARCH_MODE = os.getenv("DEFAULT_SEARCH_MODE", "vector").lower()
+HYBRID_RRF_K = int(os.getenv("HYBRID_RRF_K", str(DEFAULT_RRF_K)))
+KEYWORD_SHORTCUT_ENABLED = os.getenv("KEYWORD_SHORTCUT_ENABLED", "true").lower() == "true"
+KNN_INITIAL_OVERFETCH = float(os.getenv("KNN_INITIAL_OVERFETCH", "1.0"))
+KNN_MAX_CANDIDATES = int(os.getenv("KNN_MAX_CANDIDATES", "200"))
+RERANK_ENABLED = os.getenv("RERANK_ENABLED", "false").lower() == "true"
+RERANKER = os.getenv("RERANKER", "bm25").lower()
+RERANK_MODEL_PATH = os.getenv("RERANK_MODEL_PATH")
+RERANK_TOKENIZER_PATH = os.getenv("RERANK_TOKENIZER_PATH")
+RERANK_CANDIDATES = int(os.getenv("RERANK_CANDIDATES", "20"))
+RERANK_BUDGET_MS = float(os.getenv("RERANK_BUDGET_MS", "50"))
+RERANK_MAX_BATCH_PAIRS = int(os.getenv("RERANK_MAX_BATCH_PAIRS", "256"))
+RERANK_MAX_WAIT_MS = float(os.getenv("RERANK_MAX_WAIT_MS", "5"))
+SEARCH_BATCH_MAX_QUERIES = int(os.getenv("SEARCH_BATCH_MAX_QUERIES", "1000"))
+SEARCH_BATCH_EMBED_CONCURRENCY = int(os.getenv("SEARCH_BATCH_EMBED_CONCURRENCY", "16"))
+MSEARCH_CHUNK_SIZE = int(os.getenv("MSEARCH_CHUNK_SIZE", "100"))
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "2048"))
+SEMANTIC_CACHE_TTL_SECONDS = int(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "1800"))
+SEARCH_CACHE_TTL_SECONDS = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", "86400"))
+SEARCH_COALESCE_ENABLED = os.getenv("SEARCH_COALESCE_ENABLED", "true").lower() == "true"
+SEARCH_COALESCE_DISTRIBUTED = os.getenv("SEARCH_COALESCE_DISTRIBUTED", "false").lower() == "true"
+SEARCH_COALESCE_LOCK_MS = int(os.getenv("SEARCH_COALESCE_LOCK_MS", "5000"))
+SEARCH_COALESCE_WAIT_MS = int(os.getenv("SEARCH_COALESCE_WAIT_MS", "3000"))
+PROMETHEUS_ENABLED = os.getenv("PROMETHEUS_ENABLED", "true").lower() == "true"
+SUGGEST_ENABLED = os.getenv("SUGGEST_ENABLED", "true").lower() == "true"
+SUGGEST_MAX_PER_PREFIX = int(os.getenv("SUGGEST_MAX_PER_PREFIX", "50"))
+SUGGEST_MAX_PREFIX_LENGTH = int(os.getenv("SUGGEST_MAX_PREFIX_LENGTH", "20"))
+SUGGEST_HALF_LIFE_HOURS = float(os.getenv("SUGGEST_HALF_LIFE_HOURS", "168"))
+SUGGEST_TTL_DAYS = int(os.getenv("SUGGEST_TTL_DAYS", "30"))
+SUGGEST_FLUSH_SECONDS = float(os.getenv("SUGGEST_FLUSH_SECONDS", "5"))
+POPULAR_ENABLED = os.getenv("POPULAR_ENABLED", "true").lower() == "true"
+POPULAR_SKETCH_CAPACITY = int(os.getenv("POPULAR_SKETCH_CAPACITY", "1000"))
+POPULAR_BUCKET_SIZE = int(os.getenv("POPULAR_BUCKET_SIZE", "500"))
+POPULAR_MERGE_SECONDS = float(os.getenv("POPULAR_MERGE_SECONDS", "30"))
+PREWARM_ENABLED = os.getenv("PREWARM_ENABLED", "true").lower() == "true"
+PREWARM_TOP_K = int(os.getenv("PREWARM_TOP_K", "20"))
+PREWARM_INTERVAL_SECONDS = float(os.getenv("PREWARM_INTERVAL_SECONDS", "300"))
+PREWARM_RATE_PER_SECOND = float(os.getenv("PREWARM_RATE_PER_SECOND", "5"))
+PREWARM_STARTUP_TOP_K = int(os.getenv("PREWARM_STARTUP_TOP_K", "50"))
+PREWARM_STARTUP_TIMEOUT_SECONDS = float(os.getenv("PREWARM_STARTUP_TIMEOUT_SECONDS", "30"))
+PREWARM_GENERATION_POLL_SECONDS = float(os.getenv("PREWARM_GENERATION_POLL_SECONDS", "5"))
+HEALTH_CHECK_INTERVAL = int(os.getenv("HEALTH_CHECK_INTERVAL", "30"))
+HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", "5"))
+
+# 인덱스 세대 카운터 (인덱싱 서비스가 벌크 기록/삭제/별칭 교체 시 증가)
+INDEX_GENERATION_KEY = "index_generation"
 SERVICE_NAME = "search-api-service"
 SERVICE_VERSION = "1.0.0"
 
@@ -47,36 +174,233 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# OpenSearch 클라이언트
-opensearch_client = OpenSearch(
-    hosts=[OPENSEARCH_ENDPOINT],
-    http_compress=True,
-    connection_class=RequestsHttpConnection,
-    use_ssl=False,
-    verify_certs=False,
-    ssl_show_warn=False,
-    timeout=30,
-    max_retries=3,
-    retry_on_timeout=True
+# 요청별 트레이싱 스팬 (클라이언트가 traceparent 헤더를 보내면 해당 트레이스에 이어서 기록)
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    with tracing.start_span(
+        f"{request.method} {request.url.path}",
+        parent=tracing.context_from_headers(request.headers),
+        kind="server"
+    ) as span:
+        response = await call_next(request)
+        tracing.set_attributes(span, status_code=response.status_code)
+        return response
+
+def create_admission_pool(name: str, initial: int, maximum: int, queue_size: int, wait_ms: float) -> AdmissionPool:
+    """수락 제어 풀 생성 (상태 게이지 등록)"""
+    pool = AdmissionPool(
+        name,
+        AdaptiveLimit(initial_limit=initial, max_limit=maximum),
+        max_queue=queue_size,
+        max_wait_seconds=wait_ms / 1000
+    )
+    metrics.ADMISSION_LIMIT.labels(name).set_function(pool.limit.current)
+    metrics.ADMISSION_IN_FLIGHT.labels(name).set_function(lambda: pool.in_flight)
+    metrics.ADMISSION_QUEUED.labels(name).set_function(lambda: len(pool.queue))
+    return pool
+
+# 수락 제어 풀 (배치 검색이 대화형 검색의 동시 실행 한도를 소진하지 않도록 분리)
+search_admission = create_admission_pool(
+    "search", SEARCH_CONCURRENCY_INITIAL, SEARCH_CONCURRENCY_MAX, SEARCH_QUEUE_SIZE, SEARCH_QUEUE_WAIT_MS
+) if ADMISSION_ENABLED else None
+batch_admission = create_admission_pool(
+    "batch", BATCH_CONCURRENCY_INITIAL, BATCH_CONCURRENCY_MAX, BATCH_QUEUE_SIZE, BATCH_QUEUE_WAIT_MS
+) if ADMISSION_ENABLED else None
+
+def admission_rejected_response(error: AdmissionRejected) -> JSONResponse:
+    """수락 거절 응답 (429, Retry-After)"""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(error)},
+        headers={"Retry-After": str(int(error.retry_after))}
+    )
+
+# 검색 요청 수락 제어 (요청 기한 안에서만 대기, 스트리밍 검색은 엔드포인트에서 처리)
+@app.middleware("http")
+async def admit_requests(request: Request, call_next):
+    path = request.url.path
+    if path == "/search" and search_admission:
+        pool, endpoint, default_priority = search_admission, "search", PRIORITY_INTERACTIVE
+    elif path == "/search/batch" and batch_admission:
+        pool, endpoint, default_priority = batch_admission, "batch", PRIORITY_BULK
+    else:
+        return await call_next(request)
+    
+    priority = parse_priority(request.headers.get(PRIORITY_HEADER), default_priority)
+    try:
+        await pool.acquire(priority, deadline.remaining())
+    except AdmissionRejected as e:
+        metrics.record_request(endpoint, "rejected", 0.0)
+        return admission_rejected_response(e)
+    
+    started = time.monotonic()
+    dropped = True
+    try:
+        response = await call_next(request)
+        # 5xx(장애 대체 불가, 백엔드 503 등)는 과부하 신호로 한도 축소
+        dropped = response.status_code >= 500
+        return response
+    finally:
+        pool.release(time.monotonic() - started, dropped)
+
+# 검색 요청 기한 (스트리밍 검색은 단계별 결과를 바로 보내므로 제외)
+@app.middleware("http")
+async def request_deadline(request: Request, call_next):
+    path = request.url.path
+    if not path.startswith("/search") or path == "/search/stream":
+        return await call_next(request)
+    budget_ms = deadline.parse_budget_ms(
+        request.headers.get(DEADLINE_HEADER), SEARCH_DEADLINE_MS, SEARCH_DEADLINE_MAX_MS
+    )
+    token = deadline.start(budget_ms / 1000)
+    try:
+        return await call_next(request)
+    finally:
+        deadline.reset(token)
+
+# OpenSearch 비동기 클라이언트 (keep-alive 연결 풀 공유)
+opensearch_pool_stats = PoolStats(OPENSEARCH_POOL_MAXSIZE)
+opensearch_client = create_async_client(
+    OPENSEARCH_ENDPOINT,
+    maxsize=OPENSEARCH_POOL_MAXSIZE,
+    timeout=OPENSEARCH_TIMEOUT,
+    pool_stats=opensearch_pool_stats,
+    max_retries=OPENSEARCH_MAX_RETRIES,
+    retry_on_timeout=OPENSEARCH_RETRY_ON_TIMEOUT
+)
+metrics.register_gauge(
+    "search_opensearch_pool_in_flight", "OpenSearch 진행 중 요청 수",
+    lambda: opensearch_pool_stats.in_flight
+)
+metrics.register_gauge(
+    "search_opensearch_pool_utilization", "OpenSearch 연결 풀 사용률 (0~1)",
+    lambda: opensearch_pool_stats.in_flight / opensearch_pool_stats.maxsize
+)
+
+# AWS Bedrock 클라이언트 (임베딩 생성용, 스레드 풀에서 동시 호출)
+bedrock = boto3.client(
+    'bedrock-runtime',
+    region_name=AWS_REGION,
+    config=Config(
+        max_pool_connections=BEDROCK_MAX_CONNECTIONS,
+        read_timeout=BEDROCK_READ_TIMEOUT,
+        retries={"max_attempts": BEDROCK_MAX_ATTEMPTS, "mode": "standard"}
+    )
 )
 
-# AWS Bedrock 클라이언트 (임베딩 생성용)
-bedrock = boto3.client('bedrock-runtime', region_name=AWS_REGION)
+# 재순위화 배치 처리기 (초기화 실패 시 재순위화 없이 동작)
+try:
+    rerank_batcher = RerankBatcher(
+        create_reranker(RERANKER, RERANK_MODEL_PATH, RERANK_TOKENIZER_PATH),
+        max_pairs=RERANK_MAX_BATCH_PAIRS,
+        max_wait_seconds=RERANK_MAX_WAIT_MS / 1000
+    )
+except Exception as e:
+    logger.error(f"재순위화기 초기화 실패 ({RERANKER}): {e}")
+    rerank_batcher = None
+
+# 시맨틱 질의 캐시 (워커 프로세스 단위 인메모리)
+semantic_cache = SemanticCache(
+    max_entries=SEMANTIC_CACHE_MAX_ENTRIES,
+    threshold=SEMANTIC_CACHE_THRESHOLD,
+    ttl_seconds=SEMANTIC_CACHE_TTL_SECONDS
+) if SEMANTIC_CACHE_ENABLED else None
 
 # Redis 클라이언트 (검색 결과 캐싱용)
 redis_client = redis.Redis(
     host=REDIS_ENDPOINT,
     port=REDIS_PORT,
     password=REDIS_PASSWORD,
-    decode_responses=True
+    decode_responses=True,
+    socket_timeout=REDIS_SOCKET_TIMEOUT,
+    socket_connect_timeout=REDIS_SOCKET_TIMEOUT
 )
 
+# 동일 질의 동시 요청 병합 (프로세스 내 + 선택적으로 레플리카 간 Redis 잠금)
+search_flight = SingleFlight() if SEARCH_COALESCE_ENABLED else None
+search_lease = RedisLease(redis_client, ttl_ms=SEARCH_COALESCE_LOCK_MS, prefix="search_lock:") if (
+    SEARCH_COALESCE_ENABLED and SEARCH_COALESCE_DISTRIBUTED
+) else None
+
+# 검색어 자동완성 인덱스 (결과가 있었던 검색어를 접두사별 sorted set에 주기적으로 반영)
+suggestion_index = SuggestionIndex(
+    redis_client,
+    max_per_prefix=SUGGEST_MAX_PER_PREFIX,
+    max_prefix_length=SUGGEST_MAX_PREFIX_LENGTH,
+    half_life_seconds=SUGGEST_HALF_LIFE_HOURS * 3600,
+    ttl_seconds=SUGGEST_TTL_DAYS * 86400
+) if SUGGEST_ENABLED else None
+
+# 인기 검색어 (파드 스케치를 주기적으로 Redis 시간 버킷에 병합, 캐시 예열 대상 선정에 사용)
+popular_queries = PopularQueries(
+    redis_client,
+    capacity=POPULAR_SKETCH_CAPACITY,
+    bucket_size=POPULAR_BUCKET_SIZE
+) if POPULAR_ENABLED else None
+
+# 의존성 상태 (백그라운드 점검 결과를 캐시, 프로브는 캐시만 조회)
+health_monitor = HealthMonitor(HEALTH_CHECK_INTERVAL, HEALTH_CHECK_TIMEOUT)
+
+def create_breaker(name: str, slow_call_seconds: Optional[float] = None, is_failure=None) -> CircuitBreaker:
+    """공통 설정의 서킷 브레이커 생성 (상태 게이지 등록)"""
+    breaker = CircuitBreaker(
+        name,
+        failure_rate_threshold=CIRCUIT_FAILURE_RATE,
+        minimum_calls=CIRCUIT_MINIMUM_CALLS,
+        window_seconds=CIRCUIT_WINDOW_SECONDS,
+        open_seconds=CIRCUIT_OPEN_SECONDS,
+        half_open_max_calls=CIRCUIT_HALF_OPEN_CALLS,
+        slow_call_seconds=slow_call_seconds,
+        is_failure=is_failure
+    )
+    metrics.CIRCUIT_BREAKER_STATE.labels(name).set_function(breaker.state_value)
+    return breaker
+
+# 의존성별 서킷 브레이커
+# - Bedrock: 열리면 이전 세대 캐시 결과 또는 키워드 검색으로 대체
+# - OpenSearch: 열리면 이전 세대 캐시 결과 또는 503 (잘못된 질의/없는 인덱스는 실패로 보지 않음)
+# - Redis: 열리면 캐시 없이 검색 (조회/저장 생략)
+# (요청 기한 초과로 취소된 호출은 의존성 실패로 보지 않음)
+bedrock_breaker = create_breaker(
+    "bedrock",
+    CIRCUIT_SLOW_CALL_SECONDS,
+    is_failure=lambda error: not isinstance(error, DeadlineExceeded)
+)
+opensearch_breaker = create_breaker(
+    "opensearch",
+    CIRCUIT_SLOW_CALL_SECONDS,
+    is_failure=lambda error: not isinstance(error, (RequestError, NotFoundError, DeadlineExceeded))
+)
+redis_breaker = create_breaker("redis")
+circuit_breakers = {breaker.name: breaker for breaker in (bedrock_breaker, opensearch_breaker, redis_breaker)}
+health_monitor.add_state(
+    "circuit_breakers",
+    lambda: {name: breaker.snapshot() for name, breaker in circuit_breakers.items()}
+)
+
+# 캐시 예열 요청 여부 (예열 검색은 인기 검색어/자동완성 집계에서 제외)
+prewarming: ContextVar[bool] = ContextVar("prewarming", default=False)
+
 # 데이터 모델
+class SearchFilters(BaseModel):
+    doc_ids: Optional[List[str]] = None
+    metadata: Optional[Dict[str, Any]] = None  # 메타데이터 필드 -> 값 (목록이면 OR)
+    indexed_after: Optional[str] = None  # ISO 8601 (이상)
+    indexed_before: Optional[str] = None  # ISO 8601 (미만)
+
 class SearchRequest(BaseModel):
     query: str
     top_k: Optional[int] = 5
-    min_score: Optional[float] = 0.5
+    min_score: Optional[float] = 0.5  # 최소 코사인 유사도 (인덱스 공간 유형과 무관)
     include_metadata: Optional[bool] = True
+    partitions: Optional[List[str]] = None  # 검색할 파티션 키 (테넌트 값 또는 기간, 예: "hr", "2024-05")
+    mode: Optional[str] = None  # vector | hybrid | keyword (미지정 시 DEFAULT_SEARCH_MODE)
+    fusion: Optional[str] = "rrf"  # hybrid 병합 방식: rrf | weighted
+    vector_weight: Optional[float] = 1.0
+    keyword_weight: Optional[float] = 1.0
+    filters: Optional[SearchFilters] = None  # k-NN 탐색 중 적용되는 사전 필터
+    rerank: Optional[bool] = None  # 미지정 시 RERANK_ENABLED
+    rerank_candidates: Optional[int] = None  # 재순위화할 상위 후보 수 (미지정 시 RERANK_CANDIDATES)
 
 class SearchResult(BaseModel):
     doc_id: str
@@ -84,6 +408,7 @@ class SearchResult(BaseModel):
     chunk_text: str
     score: float
     metadata: Optional[Dict] = {}
+    rerank_score: Optional[float] = None
 
 class SearchResponse(BaseModel):
     query: str
@@ -91,6 +416,37 @@ class SearchResponse(BaseModel):
     total_results: int
     processing_time_ms: int
     cached: bool
+    search_mode: Optional[str] = "vector"  # 실제 수행된 검색 방식 (키워드 단축 시 keyword)
+    reranked: Optional[bool] = False
+    cache_tier: Optional[str] = None  # 캐시 적중 시 exact | semantic
+    coalesced: Optional[bool] = False  # 동시에 들어온 같은 질의의 결과를 공유했는지 여부
+    degraded: Optional[str] = None  # 대체 응답: stale_cache | lexical_fallback | partial | deadline_exceeded
+
+class StreamSearchRequest(SearchRequest):
+    format: Optional[str] = "ndjson"  # ndjson | sse
+    max_chars: Optional[int] = None  # chunk_text 최대 길이 (미지정 시 전체)
+    highlight: Optional[bool] = False  # 질의 단어 하이라이트 스니펫 포함
+
+class BatchSearchRequest(BaseModel):
+    queries: List[str]
+    top_k: Optional[int] = 5
+    min_score: Optional[float] = 0.5
+    include_metadata: Optional[bool] = True
+    partitions: Optional[List[str]] = None
+    filters: Optional[SearchFilters] = None
+
+class BatchQueryResult(BaseModel):
+    query: str
+    results: List[SearchResult]
+    total_results: int
+    error: Optional[str] = None
+
+class BatchSearchResponse(BaseModel):
+    results: List[BatchQueryResult]
+    total_queries: int
+    unique_queries: int
+    embedding_cache_hits: int
+    processing_time_ms: int
 
 class HealthResponse(BaseModel):
     service: str
@@ -102,54 +458,75 @@ class HealthResponse(BaseModel):
     bedrock_status: str
     index_exists: bool
     index_doc_count: int
+    cache_warmup: str = "disabled"  # warming, ready, disabled
+    checks: Dict[str, Any] = {}
+
+async def check_opensearch() -> Dict[str, Any]:
+    """OpenSearch 클러스터 상태 및 인덱스 문서 수 점검"""
+    cluster_health = await opensearch_client.cluster.health(request_timeout=HEALTH_CHECK_TIMEOUT)
+    details = {
+        "status": "healthy" if cluster_health['status'] in ['green', 'yellow'] else "degraded",
+        "cluster_status": cluster_health['status'],
+        "index_exists": False,
+        "index_doc_count": 0
+    }
+    if await opensearch_client.indices.exists(index=OPENSEARCH_INDEX):
+        details["index_exists"] = True
+        stats = await opensearch_client.indices.stats(index=OPENSEARCH_INDEX, request_timeout=HEALTH_CHECK_TIMEOUT)
+        details["index_doc_count"] = stats['_all']['total']['docs']['count']
+    return details
+
+async def check_redis() -> Dict[str, Any]:
+    """Redis 연결 점검"""
+    await asyncio.to_thread(redis_client.ping)
+    return {}
+
+health_monitor.add_check("opensearch", check_opensearch)
+health_monitor.add_check("redis", check_redis, required=False)
+# Bedrock은 점검 호출도 과금되므로 실제 임베딩 생성 결과로만 상태 갱신
+health_monitor.add_passive("bedrock")
+
+# 프로브 엔드포인트 (의존성을 직접 호출하지 않고 캐시된 상태만 반환)
+@app.get("/livez")
+async def liveness_probe(response: Response):
+    """활성 프로브 (이벤트 루프가 응답하고 점검 루프가 멈추지 않았는지)"""
+    if not health_monitor.is_live():
+        response.status_code = 503
+        return {"status": "stalled", "last_check_at": health_monitor.last_run_at}
+    return {"status": "ok"}
+
+@app.get("/readyz")
+async def readiness_probe(response: Response):
+    """준비 프로브 (필수 의존성 상태 및 캐시 예열 완료 여부)"""
+    reasons = health_monitor.not_ready_reasons()
+    if reasons:
+        response.status_code = 503
+    return {
+        "status": "not_ready" if reasons else "ready",
+        "reasons": reasons,
+        "dependencies": {name: health_monitor.status(name) for name in health_monitor.results}
+    }
 
 # 헬스체크 엔드포인트
 @app.get("/health", response_model=HealthResponse)
-async def health_check():
-    """서비스 헬스체크"""
-    # OpenSearch 연결 및 인덱스 확인
-    opensearch_status = "healthy"
-    index_exists = False
-    index_doc_count = 0
-    
-    try:
-        cluster_health = opensearch_client.cluster.health()
-        if cluster_health['status'] in ['green', 'yellow']:
-            opensearch_status = "healthy"
-        else:
-            opensearch_status = "degraded"
-            
-        # 인덱스 존재 및 문서 수 확인
-        if opensearch_client.indices.exists(index=OPENSEARCH_INDEX):
-            index_exists = True
-            stats = opensearch_client.indices.stats(index=OPENSEARCH_INDEX)
-            index_doc_count = stats['indices'][OPENSEARCH_INDEX]['total']['docs']['count']
-            
-    except Exception as e:
-        logger.error(f"OpenSearch 헬스체크 실패: {e}")
-        opensearch_status = "unhealthy"
-    
-    # Redis 연결 확인
-    redis_status = "healthy"
-    try:
-        redis_client.ping()
-    except Exception:
-        redis_status = "unhealthy"
-    
-    # Bedrock 연결 확인
-    bedrock_status = "healthy"
-    try:
-        # 간단한 임베딩 테스트
-        test_embedding = await generate_embedding("health check")
-        if not test_embedding:
-            bedrock_status = "unhealthy"
-    except Exception:
-        bedrock_status = "unhealthy"
+async def health_check(response: Response):
+    """서비스 헬스체크 (캐시된 점검 결과 기준, 시작 시 캐시 예열이 끝나기 전까지 503)"""
+    opensearch_status = health_monitor.status("opensearch")
+    redis_status = health_monitor.status("redis")
+    bedrock_status = health_monitor.status("bedrock")
+    opensearch_result = health_monitor.results["opensearch"]
     
     overall_status = "healthy"
-    if opensearch_status != "healthy" or redis_status != "healthy" or bedrock_status != "healthy":
+    if opensearch_status != "healthy" or redis_status != "healthy" or bedrock_status not in ("healthy", "unknown"):
         overall_status = "degraded"
     
+    cache_warmup = "disabled"
+    if cache_warmer:
+        cache_warmup = "ready" if cache_warmer.ready else "warming"
+        if not cache_warmer.ready:
+            overall_status = "warming"
+            response.status_code = 503
+    
     return HealthResponse(
         service=SERVICE_NAME,
         version=SERVICE_VERSION,
@@ -158,55 +535,71 @@ async def health_check():
         opensearch_status=opensearch_status,
         redis_status=redis_status,
         bedrock_status=bedrock_status,
-        index_exists=index_exists,
-        index_doc_count=index_doc_count
+        index_exists=opensearch_result.get("index_exists", False),
+        index_doc_count=opensearch_result.get("index_doc_count", 0),
+        cache_warmup=cache_warmup,
+        checks=health_monitor.snapshot()
     )
 
 # 메트릭 엔드포인트
 @app.get("/metrics")
-async def get_metrics():
-    """서비스 메트릭"""
+async def get_metrics(request: Request):
+    """Prometheus 메트릭 (파드 단위, Accept가 OpenMetrics이면 exemplar 포함)"""
+    if not PROMETHEUS_ENABLED:
+        raise HTTPException(status_code=404, detail="Prometheus 메트릭이 비활성화되어 있습니다")
+    body, content_type = metrics.render_metrics(request.headers.get("accept"))
+    return Response(content=body, media_type=content_type)
+
+@app.get("/metrics/summary")
+async def get_metrics_summary():
+    """구성 요소별 상태 요약 (파드 단위)"""
     try:
-        # Redis에서 통계 정보 가져오기
-        total_searches = redis_client.get("total_searches") or 0
-        cache_hits = redis_client.get("search_cache_hits") or 0
-        cache_misses = redis_client.get("search_cache_misses") or 0
-        avg_response_time = redis_client.get("avg_response_time_ms") or 0
-        
-        cache_hit_rate = 0.0
-        total_requests = int(cache_hits) + int(cache_misses)
-        if total_requests > 0:
-            cache_hit_rate = int(cache_hits) / total_requests * 100
-        
-        return {
-            "total_searches": int(total_searches),
-            "cache_hit_rate_percent": f"{cache_hit_rate:.2f}",
-            "cache_hits": int(cache_hits),
-            "cache_misses": int(cache_misses),
-            "avg_response_time_ms": float(avg_response_time)
-        }
+        index_generation = redis_client.get(INDEX_GENERATION_KEY) or 0
     except Exception as e:
-        logger.error(f"메트릭 조회 오류: {e}")
-        return {"error": "메트릭 조회 실패"}
+        logger.warning(f"인덱스 세대 조회 실패: {e}")
+        index_generation = None
+    
+    return {
+        "index_generation": int(index_generation) if index_generation is not None else None,
+        "opensearch_pool": opensearch_pool_stats.snapshot(),
+        "rerank": dict(rerank_batcher.stats, reranker=rerank_batcher.reranker.name) if rerank_batcher else None,
+        "semantic_cache": semantic_cache.snapshot() if semantic_cache else None,
+        "coalescing": search_flight.snapshot() if search_flight else None,
+        "suggestions": suggestion_index.snapshot() if suggestion_index else None,
+        "popular": popular_queries.snapshot() if popular_queries else None,
+        "circuit_breakers": {name: breaker.snapshot() for name, breaker in circuit_breakers.items()},
+        "admission": {
+            pool.name: pool.snapshot() for pool in (search_admission, batch_admission) if pool
+        },
+        "cache_warmup": cache_warmer.snapshot() if cache_warmer else None
+    }
 
-async def generate_embedding(text: str) -> Optional[List[float]]:
-    """텍스트에 대한 임베딩 생성 (캐싱 포함)"""
+def embedding_cache_key(text: str) -> str:
+    """질의 임베딩 캐시 키"""
+    return f"query_embedding:{hashlib.md5(text.encode()).hexdigest()}"
+
+async def generate_embedding(text: str, check_cache: bool = True) -> Optional[List[float]]:
+    """텍스트에 대한 임베딩 생성 (캐싱 포함, 호출자가 이미 캐시를 확인했으면 check_cache=False)"""
     # 캐시 키 생성
-    cache_key = f"query_embedding:{hashlib.md5(text.encode()).hexdigest()}"
+    cache_key = embedding_cache_key(text)
     
     # 캐시에서 확인
-    try:
-        cached_embedding = redis_client.get(cache_key)
-        if cached_embedding:
-            return json.loads(cached_embedding)
-    except Exception as e:
-        logger.warning(f"임베딩 캐시 조회 실패: {e}")
+    if check_cache:
+        try:
+            with redis_breaker.protect():
+                cached_embedding = redis_client.get(cache_key)
+            if cached_embedding:
+                metrics.QUERY_EMBEDDINGS.labels("cache").inc()
+                return json.loads(cached_embedding)
+        except Exception as e:
+            logger.warning(f"임베딩 캐시 조회 실패: {e}")
     
     # 개발 환경에서는 더미 임베딩 생성 (AWS 자격 증명 없이 테스트 가능)
     dev_mode = os.getenv("ENVIRONMENT", "development").lower() == "development"
     
     if dev_mode:
         logger.info("개발 모드: 더미 임베딩 생성")
+        metrics.QUERY_EMBEDDINGS.labels("dummy").inc()
         # 텍스트 기반으로 일관된 더미 임베딩 생성
         import random
         random.seed(hash(text) % (2**32))  # 텍스트 기반 시드로 일관성 보장
@@ -214,7 +607,8 @@ async def generate_embedding(text: str) -> Optional[List[float]]:
         
         # 캐시에 저장
         try:
-            redis_client.setex(cache_key, 3600, json.dumps(dummy_embedding))
+            with redis_breaker.protect():
+                redis_client.setex(cache_key, 3600, json.dumps(dummy_embedding))
         except Exception as e:
             logger.warning(f"임베딩 캐시 저장 실패: {e}")
         
@@ -224,30 +618,45 @@ async def generate_embedding(text: str) -> Optional[List[float]]:
     try:
         payload = {"inputText": text[:4000]}  # 토큰 제한
         
-        response = bedrock.invoke_model(
-            modelId=EMBEDDING_MODEL,
-            contentType="application/json",
-            accept="application/json",
-            body=json.dumps(payload).encode("utf-8"),
-        )
+        # boto3는 동기 클라이언트이므로 이벤트 루프를 막지 않도록 스레드에서 호출
+        metrics.QUERY_EMBEDDINGS.labels("bedrock").inc()
+        with bedrock_breaker.protect(), metrics.observe_stage("embed"):
+            response = await deadline.bounded(asyncio.to_thread(
+                bedrock.invoke_model,
+                modelId=EMBEDDING_MODEL,
+                contentType="application/json",
+                accept="application/json",
+                body=json.dumps(payload).encode("utf-8"),
+            ), "embed")
         
         result = json.loads(response["body"].read())
         embedding = result.get("embedding") or result.get("vector")
         
         if not embedding or len(embedding) != 1536:
             logger.error(f"임베딩 생성 실패 또는 잘못된 차원: {len(embedding) if embedding else 0}")
+            health_monitor.record_outcome("bedrock", False, "잘못된 임베딩 응답")
             return None
+        health_monitor.record_outcome("bedrock", True)
         
         # 캐시에 저장 (1시간)
         try:
-            redis_client.setex(cache_key, 3600, json.dumps(embedding))
+            with redis_breaker.protect():
+                redis_client.setex(cache_key, 3600, json.dumps(embedding))
         except Exception as e:
             logger.warning(f"임베딩 캐시 저장 실패: {e}")
         
         return embedding
         
+    except CircuitOpenError:
+        # Bedrock 장애 중에는 호출 없이 즉시 실패 (호출자가 키워드 검색으로 대체)
+        metrics.QUERY_EMBEDDINGS.labels("rejected").inc()
+        return None
+    except DeadlineExceeded:
+        logger.warning(f"요청 기한 내 임베딩 생성 실패: '{text[:50]}'")
+        return None
     except Exception as e:
         logger.error(f"Bedrock 임베딩 생성 오류: {e}")
+        health_monitor.record_outcome("bedrock", False, str(e))
         # Bedrock 실패 시에도 더미 임베딩 반환 (개발 환경)
         if dev_mode:
             logger.warning("Bedrock 실패, 더미 임베딩으로 대체")
@@ -256,103 +665,389 @@ async def generate_embedding(text: str) -> Optional[List[float]]:
             return [random.uniform(-1, 1) for _ in range(1536)]
         return None
 
+# 인덱스 벡터 인코딩 캐시 (인덱싱 서비스가 매핑 _meta에 기록)
+index_encoding_cache = {
+    "vector_encoding": None,
+    "knn_engine": "nmslib",
+    "space_type": "l2",
+    "byte_scale": 127.0,
+    "normalized": False,
+    "indices": [],
+    "checked_at": 0.0
+}
+
+# _meta에 knn_engine이 없는 이전 버전 인덱스의 인코딩별 엔진
+LEGACY_KNN_ENGINES = {"fp16": "faiss", "pq": "faiss", "byte": "lucene"}
+
+async def get_index_vector_encoding() -> Dict[str, Any]:
+    """인덱스 매핑(_meta)의 벡터 인코딩 조회 (주기적으로 갱신)"""
+    now = time.time()
+    if index_encoding_cache["vector_encoding"] and now - index_encoding_cache["checked_at"] < INDEX_META_REFRESH_SECONDS:
+        return index_encoding_cache
+    
+    try:
+        with opensearch_breaker.protect():
+            mapping = await opensearch_client.indices.get_mapping(index=OPENSEARCH_INDEX)
+        for index_mapping in mapping.values():
+            meta = index_mapping.get("mappings", {}).get("_meta", {})
+            index_encoding_cache["vector_encoding"] = meta.get("vector_encoding", "float32")
+            index_encoding_cache["knn_engine"] = meta.get(
+                "knn_engine",
+                LEGACY_KNN_ENGINES.get(index_encoding_cache["vector_encoding"], "nmslib")
+            )
+            index_encoding_cache["space_type"] = meta.get("space_type", "l2")
+            index_encoding_cache["byte_scale"] = float(meta.get("byte_scale", 127.0))
+            index_encoding_cache["normalized"] = bool(meta.get("normalized", False))
+            if not index_encoding_cache["normalized"] and index_encoding_cache["space_type"] != "cosinesimil":
+                logger.warning(
+                    f"단위 벡터로 정규화되지 않은 {index_encoding_cache['space_type']} 인덱스: "
+                    "min_score/점수가 코사인 유사도와 다를 수 있음 (재인덱싱 시 정규화됨)"
+                )
+            break
+        # 읽기 별칭이 가리키는 물리 인덱스 (블루/그린 교체, 파티션 추가 시 변경)
+        index_encoding_cache["indices"] = sorted(mapping.keys())
+        index_encoding_cache["checked_at"] = now
+    except Exception as e:
+        logger.warning(f"인덱스 인코딩 조회 실패: {e}")
+    
+    return index_encoding_cache
+
+async def get_index_version(generation: str) -> str:
+    """검색 대상 인덱스 버전 (물리 인덱스 + 인덱스 세대, 시맨틱 캐시 무효화 기준)"""
+    encoding = await get_index_vector_encoding()
+    return f"{','.join(encoding['indices'])}@{generation}"
+
+async def encode_query_vector(vector: List[float]) -> List[Any]:
+    """질의 벡터를 인덱스와 동일한 인코딩으로 변환
+
+    float 인덱스는 _meta.normalized인 경우에만 단위 벡터로 정규화 (이전 인덱스의 원본 벡터와 같은 공간 유지),
+    byte 인덱스는 인덱싱 시 항상 정규화 후 양자화되므로 질의도 같은 방식으로 변환
+    """
+    encoding = await get_index_vector_encoding()
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    if encoding["vector_encoding"] != "byte":
+        return [value / norm for value in vector] if encoding["normalized"] else list(vector)
+    
+    # byte 인덱스: 정규화 후 정수 양자화
+    scale = encoding["byte_scale"]
+    return [max(-128, min(127, int(round(value / norm * scale)))) for value in vector]
+
+def hit_to_result(hit: Dict[str, Any]) -> Dict[str, Any]:
+    """OpenSearch 히트를 검색 결과 형식으로 변환"""
+    source = hit["_source"]
+    return {
+        "doc_id": source.get("doc_id", ""),
+        "chunk_index": source.get("chunk_index", 0),
+        "chunk_text": source.get("chunk_text", ""),
+        "score": float(hit["_score"]),
+        "metadata": source.get("metadata", {}),
+        "indexed_at": source.get("indexed_at", "")
+    }
+
+async def search_keyword_documents(
+    query: str,
+    top_k: int = 5,
+    indices: Optional[List[str]] = None,
+    filter_clauses: Optional[List[Dict[str, Any]]] = None
+) -> List[Dict[str, Any]]:
+    """chunk_text BM25 키워드 검색"""
+    try:
+        with opensearch_breaker.protect(), metrics.observe_stage("keyword"):
+            response = await deadline.bounded(opensearch_client.search(
+                index=indices or [OPENSEARCH_INDEX],
+                body=build_keyword_query(query, top_k, filter_clauses),
+                ignore_unavailable=True,
+                request_timeout=deadline.timeout(SEARCH_REQUEST_TIMEOUT)
+            ), "keyword")
+        return [hit_to_result(hit) for hit in response.get("hits", {}).get("hits", [])]
+        
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
+    except Exception as e:
+        logger.error(f"키워드 검색 실패: {e}")
+        return []
+
+async def run_search(
+    request: SearchRequest,
+    search_indices: List[str],
+    mode: str,
+    fusion: str,
+    top_k: Optional[int] = None,
+    query_embedding: Optional[List[float]] = None
+):
+    """검색 모드에 따라 벡터/키워드/하이브리드 검색 수행 (top_k: 반환할 후보 수)
+
+    query_embedding이 주어지면 (시맨틱 캐시 조회에 사용한 임베딩) 다시 생성하지 않음
+    질의 임베딩을 만들 수 없으면 (Bedrock 장애, 기한 초과) 키워드 검색 결과로 대체
+    하이브리드에서 벡터 검색이 기한을 넘기면 키워드 결과만으로 부분 응답
+
+    Returns:
+        (결과 목록, 실제 수행된 검색 방식, 대체 사유 또는 None)
+    """
+    top_k = top_k or request.top_k
+    filters = request.filters or SearchFilters()
+    filter_clauses = build_filter_clauses(
+        filters.doc_ids,
+        filters.metadata,
+        filters.indexed_after,
+        filters.indexed_before
+    )
+    
+    if mode == "keyword":
+        return await search_keyword_documents(request.query, top_k, search_indices, filter_clauses), "keyword", None
+    
+    if mode == "vector":
+        query_embedding = query_embedding or await generate_embedding(request.query)
+        if not query_embedding:
+            logger.warning(f"질의 임베딩 생성 실패, 키워드 검색으로 대체: '{request.query}'")
+            results = await search_keyword_documents(request.query, top_k, search_indices, filter_clauses)
+            return results, "keyword", "lexical_fallback"
+        results = await search_similar_documents(
+            query_embedding, top_k, request.min_score, search_indices, filter_clauses
+        )
+        return results, "vector", None
+    
+    # hybrid: BM25 검색을 먼저 시작하고 임베딩 생성과 병렬로 진행
+    keyword_task = asyncio.create_task(
+        search_keyword_documents(request.query, top_k * 2, search_indices, filter_clauses)
+    )
+    
+    # 명백한 키워드 질의(제품 코드, 오류 ID 등)는 BM25 결과가 있으면 임베딩 생성 생략
+    if KEYWORD_SHORTCUT_ENABLED and looks_like_keyword_query(request.query):
+        keyword_results = await keyword_task
+        if keyword_results:
+            return keyword_results[:top_k], "keyword", None
+        keyword_task = None
+    
+    query_embedding = query_embedding or await generate_embedding(request.query)
+    if not query_embedding:
+        logger.warning(f"질의 임베딩 생성 실패, 키워드 검색으로 대체: '{request.query}'")
+        keyword_results = await keyword_task if keyword_task else []
+        return keyword_results[:top_k], "keyword", "lexical_fallback"
+    
+    try:
+        vector_results = await search_similar_documents(
+            query_embedding, top_k * 2, request.min_score, search_indices, filter_clauses
+        )
+    except DeadlineExceeded:
+        if not keyword_task:
+            raise
+        logger.warning(f"벡터 검색 기한 초과, 키워드 결과로 부분 응답: '{request.query}'")
+        return (await keyword_task)[:top_k], "keyword", "partial"
+    except CircuitOpenError:
+        if keyword_task:
+            keyword_task.cancel()
+        raise
+    keyword_results = await keyword_task if keyword_task else []
+    
+    weights = [request.vector_weight, request.keyword_weight]
+    if fusion == "weighted":
+        fused = weighted_score_fusion([vector_results, keyword_results], weights)
+    else:
+        fused = reciprocal_rank_fusion([vector_results, keyword_results], weights, HYBRID_RRF_K)
+    return fused[:top_k], "hybrid", None
+
+def build_vector_search_body(
+    query_vector: List[Any],
+    candidates: int,
+    filter_clauses: Optional[List[Dict[str, Any]]],
+    encoding: Dict[str, Any],
+    raw_min_score: Optional[float]
+) -> Dict[str, Any]:
+    """k-NN 검색 요청 본문 (단일 검색 / _msearch 공통)"""
+    search_body = {
+        "query": build_filtered_knn_query(
+            query_vector,
+            candidates,
+            filter_clauses or [],
+            encoding["knn_engine"],
+            encoding["space_type"]
+        ),
+        "_source": ["doc_id", "chunk_index", "chunk_text", "metadata", "indexed_at"],
+        "size": candidates
+    }
+    if raw_min_score is not None:
+        search_body["min_score"] = raw_min_score
+    return search_body
+
+def parse_vector_hits(hits: List[Dict[str, Any]], top_k: int, encoding: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """k-NN 히트를 결과로 변환 (이미 점수 순이므로 정렬 없이 중복 청크만 제거, 점수는 코사인)"""
+    results = []
+    seen = set()
+    for hit in hits:
+        result = hit_to_result(hit)
+        key = (result["doc_id"], result["chunk_index"])
+        if key in seen:
+            continue
+        seen.add(key)
+        result["score"] = raw_score_to_cosine(result["score"], encoding)
+        results.append(result)
+        if len(results) == top_k:
+            break
+    return results
+
 async def search_similar_documents(
     query_embedding: List[float],
     top_k: int = 5,
-    min_score: float = 0.5
+    min_score: float = 0.5,
+    indices: Optional[List[str]] = None,
+    filter_clauses: Optional[List[Dict[str, Any]]] = None
 ) -> List[Dict[str, Any]]:
-    """벡터 유사도 검색"""
+    """벡터 유사도 검색 (여러 파티션 인덱스 지정 시 OpenSearch가 결과를 병합)
+
+    필터 조건은 k-NN 탐색 단계에서 적용되므로 필터를 만족하는 문서 중 top-k가 반환됨.
+    min_score와 반환 점수는 코사인 유사도이며, 임계값은 원시 점수로 변환해 OpenSearch에서 적용
+    """
     try:
-        # KNN 검색 쿼리
-        search_body = {
-            "query": {
-                "knn": {
-                    "embedding": {
-                        "vector": query_embedding,
-                        "k": top_k * 2  # 더 많이 가져와서 필터링
-                    }
-                }
-            },
-            "_source": ["doc_id", "chunk_index", "chunk_text", "metadata", "indexed_at"],
-            "size": top_k * 2
-        }
-        
-        # OpenSearch에서 검색 수행
-        response = opensearch_client.search(
-            index=OPENSEARCH_INDEX,
-            body=search_body
-        )
+        encoding = await get_index_vector_encoding()
+        query_vector = await encode_query_vector(query_embedding)
+        raw_min_score = cosine_to_raw_score(min_score, encoding) if min_score is not None else None
+        candidates = min(max(top_k, math.ceil(top_k * KNN_INITIAL_OVERFETCH)), max(KNN_MAX_CANDIDATES, top_k))
         
-        # 결과 처리
-        results = []
-        for hit in response.get("hits", {}).get("hits", []):
-            score = hit["_score"]
+        while True:
+            # OpenSearch에서 검색 수행
+            with opensearch_breaker.protect(), metrics.observe_stage("knn"):
+                response = await deadline.bounded(opensearch_client.search(
+                    index=indices or [OPENSEARCH_INDEX],
+                    body=build_vector_search_body(query_vector, candidates, filter_clauses, encoding, raw_min_score),
+                    ignore_unavailable=True,  # 아직 생성되지 않은 파티션은 건너뜀
+                    request_timeout=deadline.timeout(SEARCH_REQUEST_TIMEOUT)
+                ), "knn")
+            hits = response.get("hits", {}).get("hits", [])
+            results = parse_vector_hits(hits, top_k, encoding)
+            
+            # 조기 종료: top_k 확보 / 임계값·필터로 후보 소진 / 최대 후보 수 도달
+            if len(results) >= top_k or len(hits) < candidates or candidates >= KNN_MAX_CANDIDATES:
+                return results
             
-            # 최소 점수 필터링
-            if score >= min_score:
-                source = hit["_source"]
-                results.append({
-                    "doc_id": source.get("doc_id", ""),
-                    "chunk_index": source.get("chunk_index", 0),
-                    "chunk_text": source.get("chunk_text", ""),
-                    "score": float(score),
-                    "metadata": source.get("metadata", {}),
-                    "indexed_at": source.get("indexed_at", "")
-                })
-        
-        # 점수 순으로 정렬하고 상위 k개만 반환
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:top_k]
+            # 중복 제거로 부족해진 경우에만 후보 수 확대
+            logger.debug(f"k-NN 후보 확대: {candidates} -> {min(candidates * 2, KNN_MAX_CANDIDATES)}")
+            candidates = min(candidates * 2, KNN_MAX_CANDIDATES)
         
+    except (CircuitOpenError, DeadlineExceeded):
+        raise
     except Exception as e:
         logger.error(f"벡터 검색 실패: {e}")
         return []
 
-# 메인 검색 엔드포인트
-@app.post("/search", response_model=SearchResponse)
-async def search_documents(request: SearchRequest):
-    """문서 검색"""
+def cached_search_response(
+    request: SearchRequest,
+    cached_result: Dict[str, Any],
+    mode: str,
+    cache_tier: str,
+    start_time: float,
+    degraded: Optional[str] = None
+) -> SearchResponse:
+    """캐시된 결과로 응답 생성"""
+    return SearchResponse(
+        query=request.query,
+        results=[SearchResult(**result) for result in cached_result["results"]],
+        total_results=cached_result["total_results"],
+        processing_time_ms=int((time.time() - start_time) * 1000),
+        cached=True,
+        search_mode=cached_result.get("search_mode", mode),
+        reranked=cached_result.get("reranked", False),
+        cache_tier=cache_tier,
+        degraded=degraded
+    )
+
+def load_cached_result(cache_key: str, generation: str) -> Optional[Dict[str, Any]]:
+    """현재 인덱스 세대의 캐시된 결과 조회"""
+    try:
+        with redis_breaker.protect():
+            cached_data = redis_client.get(cache_key)
+        if cached_data:
+            cached_result = json.loads(cached_data)
+            if cached_result.get("generation") == generation:
+                return cached_result
+    except Exception as e:
+        logger.warning(f"검색 캐시 조회 실패: {e}")
+    return None
+
+def request_search_indices(request: Union[SearchRequest, BatchSearchRequest]) -> List[str]:
+    """요청의 검색 대상 인덱스 (파티션 지정 또는 인덱싱 시각 범위로 축소된 시간 파티션)"""
+    filters = request.filters or SearchFilters()
+    return resolve_search_indices(
+        OPENSEARCH_INDEX,
+        request.partitions,
+        filters.indexed_after,
+        filters.indexed_before,
+        PARTITION_TIME_GRANULARITY if PARTITION_STRATEGY == "time" and not PARTITION_TIME_FIELD else None,
+        PARTITION_ROUTING_MAX_INDICES
+    )
+
+def uses_semantic_cache(request: SearchRequest, mode: str) -> bool:
+    """시맨틱 캐시 대상 여부 (키워드 질의는 임베딩 생성 자체를 생략하므로 제외)"""
+    return semantic_cache is not None and mode != "keyword" and not (
+        mode == "hybrid" and KEYWORD_SHORTCUT_ENABLED and looks_like_keyword_query(request.query)
+    )
+
+def semantic_cache_scope(request: SearchRequest, search_indices: List[str], search_options: str) -> str:
+    """시맨틱 캐시 비교 범위 (검색 조건이 같은 항목끼리만 비교)"""
+    return f"{request.top_k}_{request.min_score}_{search_indices}_{search_options}"
+
+async def execute_search(
+    request: SearchRequest,
+    search_indices: List[str],
+    mode: str,
+    fusion: str,
+    search_options: str,
+    rerank_enabled: bool,
+    rerank_candidates: int,
+    cache_key: str,
+    generation: str
+) -> SearchResponse:
+    """캐시 미스 시 검색 수행 및 결과 캐싱 (processing_time_ms는 호출자가 채움)"""
     start_time = time.time()
     
+    # 다른 레플리카가 같은 질의를 검색 중이면 그 결과가 캐시에 기록되기를 대기
+    lease_token = None
+    if search_lease and not redis_breaker.is_open():
+        lease_token = await asyncio.to_thread(search_lease.acquire, cache_key)
+        if lease_token is None:
+            cached_result = await search_lease.wait_for(
+                cache_key,
+                lambda: load_cached_result(cache_key, generation),
+                deadline.timeout(SEARCH_COALESCE_WAIT_MS / 1000)
+            )
+            if cached_result:
+                return cached_search_response(request, cached_result, mode, "exact", start_time)
+    
     try:
-        logger.info(f"검색 요청: '{request.query}', top_k: {request.top_k}")
+        # 1. 시맨틱 캐시 조회 (표현만 다른 같은 의미의 질의)
+        query_embedding = None
+        semantic_scope = None
+        if uses_semantic_cache(request, mode):
+            query_embedding = await generate_embedding(request.query)
+            if query_embedding:
+                semantic_scope = semantic_cache_scope(request, search_indices, search_options)
+                index_version = await get_index_version(generation)
+                with metrics.observe_stage("semantic_lookup"):
+                    semantic_hit = semantic_cache.lookup(query_embedding, semantic_scope, index_version)
+                metrics.CACHE_LOOKUPS.labels("semantic", "hit" if semantic_hit else "miss").inc()
+                if semantic_hit:
+                    cached_result, similarity = semantic_hit
+                    logger.info(f"시맨틱 캐시 적중: '{request.query}' (유사도 {similarity:.3f})")
+                    return cached_search_response(request, cached_result, mode, "semantic", start_time)
         
-        # 캐시 키 생성
-        cache_key = f"search_result:{hashlib.md5(f'{request.query}_{request.top_k}_{request.min_score}'.encode()).hexdigest()}"
+        # 2. 질의 임베딩 생성 및 검색 수행 (검색 모드에 따라 키워드 검색 병행)
+        search_results, performed_mode, degraded = await run_search(
+            request,
+            search_indices,
+            mode,
+            fusion,
+            rerank_candidates if rerank_enabled else request.top_k,
+            query_embedding
+        )
         
-        # 캐시에서 확인
-        cached_result = None
-        try:
-            cached_data = redis_client.get(cache_key)
-            if cached_data:
-                cached_result = json.loads(cached_data)
-                redis_client.incr("search_cache_hits")
-                
-                processing_time = int((time.time() - start_time) * 1000)
-                
-                return SearchResponse(
-                    query=request.query,
-                    results=[SearchResult(**result) for result in cached_result["results"]],
-                    total_results=cached_result["total_results"],
-                    processing_time_ms=processing_time,
-                    cached=True
+        # 2-1. 재순위화 (예산 또는 요청 기한 초과 시 ANN 순서 유지)
+        reranked = False
+        if rerank_enabled and not deadline.expired():
+            with metrics.observe_stage("rerank"):
+                search_results, reranked = await rerank_batcher.rerank(
+                    request.query, search_results, deadline.timeout(RERANK_BUDGET_MS / 1000)
                 )
-        except Exception as e:
-            logger.warning(f"검색 캐시 조회 실패: {e}")
-        
-        redis_client.incr("search_cache_misses")
-        
-        # 1. 질의 임베딩 생성
-        query_embedding = await generate_embedding(request.query)
-        if not query_embedding:
-            raise HTTPException(status_code=500, detail="질의 임베딩 생성 실패")
-        
-        # 2. 벡터 검색 수행
-        search_results = await search_similar_documents(
-            query_embedding,
-            request.top_k,
-            request.min_score
-        )
+        search_results = search_results[:request.top_k]
         
         # 3. 결과 구성
         results = []
@@ -362,45 +1057,280 @@ async def search_documents(request: SearchRequest):
                 chunk_index=result["chunk_index"],
                 chunk_text=result["chunk_text"],
                 score=result["score"],
-                metadata=result["metadata"] if request.include_metadata else {}
+                metadata=result["metadata"] if request.include_metadata else {},
+                rerank_score=result.get("rerank_score")
             )
             results.append(search_result)
         
-        processing_time = int((time.time() - start_time) * 1000)
-        
         # 4. 응답 생성
         response = SearchResponse(
             query=request.query,
             results=results,
             total_results=len(results),
-            processing_time_ms=processing_time,
-            cached=False
+            processing_time_ms=int((time.time() - start_time) * 1000),
+            cached=False,
+            search_mode=performed_mode,
+            reranked=reranked,
+            degraded=degraded
         )
         
-        # 5. 결과 캐싱 (성공한 경우만)
-        if results:
+        # 5. 결과 캐싱 (성공한 경우만, 재순위화 예산 초과로 ANN 순서가 된 결과와 대체 결과는 제외)
+        # 요청 기한이 지났으면 응답을 먼저 보내도록 캐시 저장 생략
+        if results and (reranked or not rerank_enabled) and not degraded and not deadline.expired():
             try:
                 cache_data = {
                     "results": [result.dict() for result in results],
-                    "total_results": len(results)
+                    "total_results": len(results),
+                    "search_mode": performed_mode,
+                    "reranked": reranked,
+                    "generation": generation  # 검색 시작 시점 세대 (검색 중 변경되면 다음 조회에서 무효)
                 }
-                redis_client.setex(cache_key, 1800, json.dumps(cache_data))  # 30분 캐시
+                pipeline = redis_client.pipeline()
+                # 인덱스 세대로 유효성을 검증하므로 TTL을 길게 유지
+                pipeline.setex(cache_key, SEARCH_CACHE_TTL_SECONDS, json.dumps(cache_data))
+                # 문서 삭제 시 인덱싱 서비스가 관련 캐시를 무효화할 수 있도록 역인덱스 기록
+                for doc_id in {result.doc_id for result in results}:
+                    pipeline.sadd(f"search_result_docs:{doc_id}", cache_key)
+                    pipeline.expire(f"search_result_docs:{doc_id}", SEARCH_CACHE_TTL_SECONDS)
+                with redis_breaker.protect(), metrics.observe_stage("cache_store"):
+                    pipeline.execute()
             except Exception as e:
                 logger.warning(f"검색 결과 캐시 저장 실패: {e}")
+            
+            if semantic_scope:
+                semantic_cache.store(query_embedding, semantic_scope, index_version, cache_data)
+        
+        return response
+        
+    finally:
+        if lease_token:
+            await asyncio.to_thread(search_lease.release, cache_key, lease_token)
+
+def record_search_query(query: str, total_results: int):
+    """결과가 있었던 사용자 검색어를 자동완성 인덱스와 인기 검색어에 기록 (요청 기한 초과 시 생략)"""
+    if not total_results or prewarming.get() or deadline.expired():
+        return
+    if suggestion_index:
+        suggestion_index.record(query)
+    if popular_queries:
+        popular_queries.record(" ".join(query.split()))
+
+async def suggestion_flush_loop():
+    """자동완성 인덱스 버퍼를 주기적으로 Redis에 반영"""
+    while True:
+        await asyncio.sleep(SUGGEST_FLUSH_SECONDS)
+        try:
+            await suggestion_index.flush()
+        except Exception as e:
+            logger.warning(f"검색어 자동완성 반영 오류: {e}")
+
+async def popular_merge_loop():
+    """파드의 인기 검색어 스케치를 주기적으로 Redis에 병합"""
+    while True:
+        await asyncio.sleep(POPULAR_MERGE_SECONDS)
+        try:
+            await popular_queries.merge()
+        except Exception as e:
+            logger.warning(f"인기 검색어 병합 오류: {e}")
+
+async def warm_query(query: str):
+    """검색어 한 건 예열 (질의 임베딩, 기본 조건 검색 결과, 시맨틱 캐시)"""
+    token = prewarming.set(True)
+    try:
+        # 캐시된 임베딩은 TTL만 연장, 없으면 새로 생성 (Redis 장애 시 검색 단계에 맡김)
+        try:
+            with redis_breaker.protect():
+                cached = redis_client.expire(embedding_cache_key(query), 3600)
+            if not cached:
+                await generate_embedding(query, check_cache=False)
+        except (CircuitOpenError, redis.RedisError) as e:
+            logger.debug(f"예열 임베딩 캐시 갱신 생략: {e}")
+        # 결과 캐시가 현재 인덱스 세대로 있으면 캐시 적중으로 바로 반환됨
+        await search_documents(SearchRequest(query=query))
+    finally:
+        prewarming.reset(token)
+
+# 캐시 예열기 (시작 시, 인덱스 세대 변경 시, 주기적으로 인기 검색어 재생)
+cache_warmer = CacheWarmer(warm_query, PREWARM_RATE_PER_SECOND) if (
+    PREWARM_ENABLED and popular_queries
+) else None
+
+def popular_warm_queries(limit: int) -> List[str]:
+    """예열 대상 검색어 (최근 1시간 인기 순, 부족하면 최근 1일로 보충)"""
+    queries = [entry["query"] for entry in popular_queries.top("hour", limit)]
+    if len(queries) < limit:
+        for entry in popular_queries.top("day", limit):
+            if entry["query"] not in queries:
+                queries.append(entry["query"])
+    return queries[:limit]
+
+async def startup_warmup():
+    """시작 시 예열 (완료 또는 시간 초과 후 준비 상태로 전환)"""
+    try:
+        with redis_breaker.protect():
+            cache_warmer.generation = redis_client.get(INDEX_GENERATION_KEY) or "0"
+        queries = await asyncio.to_thread(popular_warm_queries, PREWARM_STARTUP_TOP_K)
+        await cache_warmer.run(queries, "startup", PREWARM_STARTUP_TIMEOUT_SECONDS)
+    except Exception as e:
+        logger.warning(f"시작 시 캐시 예열 오류: {e}")
+    finally:
+        cache_warmer.ready = True
+
+async def prewarm_loop():
+    """인기 검색어 캐시 주기적 예열"""
+    while True:
+        await asyncio.sleep(PREWARM_INTERVAL_SECONDS)
+        try:
+            queries = await asyncio.to_thread(popular_warm_queries, PREWARM_TOP_K)
+            await cache_warmer.run(queries, "interval")
+        except Exception as e:
+            logger.warning(f"캐시 예열 오류: {e}")
+
+async def generation_watch_loop():
+    """인덱스 세대 변경(index-ready, 삭제, 별칭 교체) 시 결과 캐시 재예열"""
+    while True:
+        await asyncio.sleep(PREWARM_GENERATION_POLL_SECONDS)
+        try:
+            with redis_breaker.protect():
+                generation = redis_client.get(INDEX_GENERATION_KEY) or "0"
+            if cache_warmer.ready and generation != cache_warmer.generation:
+                cache_warmer.generation = generation
+                queries = await asyncio.to_thread(popular_warm_queries, PREWARM_TOP_K)
+                await cache_warmer.run(queries, f"generation {generation}")
+        except Exception as e:
+            logger.warning(f"인덱스 세대 변경 예열 오류: {e}")
+
+# 메인 검색 엔드포인트
+@app.post("/search", response_model=SearchResponse)
+async def search_documents(request: SearchRequest):
+    """문서 검색"""
+    start_time = time.time()
+    metrics.start_request()
+    endpoint = "prewarm" if prewarming.get() else "search"
+    
+    try:
+        logger.info(f"검색 요청: '{request.query}', top_k: {request.top_k}")
         
-        # 6. 통계 업데이트
-        redis_client.incr("total_searches")
+        # 검색 대상 파티션 결정
+        if request.partitions and PARTITION_STRATEGY == "none":
+            raise HTTPException(status_code=400, detail="파티셔닝이 설정되지 않은 인덱스입니다")
+        search_indices = request_search_indices(request)
         
-        # 평균 응답 시간 업데이트
         try:
-            current_avg = float(redis_client.get("avg_response_time_ms") or 0)
-            total_searches = int(redis_client.get("total_searches") or 1)
-            new_avg = (current_avg * (total_searches - 1) + processing_time) / total_searches
-            redis_client.set("avg_response_time_ms", f"{new_avg:.2f}")
+            mode, fusion = validate_search_mode(request.mode or DEFAULT_SEARCH_MODE, request.fusion)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        # 캐시 키 생성
+        search_options = f"{mode}_{fusion}_{request.vector_weight}_{request.keyword_weight}" if mode == "hybrid" else mode
+        rerank_enabled = rerank_batcher is not None and (RERANK_ENABLED if request.rerank is None else request.rerank)
+        rerank_candidates = max(request.top_k, request.rerank_candidates or RERANK_CANDIDATES)
+        if rerank_enabled:
+            search_options += f"_rerank{rerank_candidates}"
+        if request.filters:
+            search_options += f"_{json.dumps(request.filters.dict(), sort_keys=True)}"
+        cache_key = f"search_result:{hashlib.md5(f'{request.query}_{request.top_k}_{request.min_score}_{search_indices}_{search_options}'.encode()).hexdigest()}"
+        
+        # 캐시에서 확인 (결과와 현재 인덱스 세대를 한 번에 조회)
+        cached_result = None
+        stale_result = None
+        generation = "0"
+        try:
+            with redis_breaker.protect(), metrics.observe_stage("cache_lookup"):
+                cached_data, current_generation = redis_client.mget(cache_key, INDEX_GENERATION_KEY)
+            generation = current_generation or "0"
+            if cached_data:
+                cached_result = json.loads(cached_data)
+                if cached_result.get("generation") != generation:
+                    # 캐싱 이후 인덱스가 변경됨 (index-ready, 삭제, 별칭 교체), 의존성 장애 시에만 사용
+                    metrics.CACHE_LOOKUPS.labels("exact", "stale").inc()
+                    stale_result, cached_result = cached_result, None
+            if cached_result:
+                metrics.CACHE_LOOKUPS.labels("exact", "hit").inc()
+                metrics.record_request(endpoint, "exact_cache_hit", time.time() - start_time)
+                record_search_query(request.query, cached_result["total_results"])
+                if prewarming.get() and uses_semantic_cache(request, mode):
+                    # 다른 레플리카가 채운 Redis 캐시 결과로 이 프로세스의 시맨틱 캐시도 예열
+                    query_embedding = await generate_embedding(request.query)
+                    if query_embedding:
+                        semantic_cache.store(
+                            query_embedding,
+                            semantic_cache_scope(request, search_indices, search_options),
+                            await get_index_version(generation),
+                            cached_result
+                        )
+                return cached_search_response(request, cached_result, mode, "exact", start_time)
         except Exception as e:
-            logger.warning(f"평균 응답 시간 업데이트 실패: {e}")
+            logger.warning(f"검색 캐시 조회 실패: {e}")
+        
+        metrics.CACHE_LOOKUPS.labels("exact", "miss").inc()
+        
+        # Bedrock 장애 중에는 이전 세대 캐시 결과가 있으면 키워드 검색 대체보다 우선
+        if stale_result and mode != "keyword" and bedrock_breaker.is_open():
+            metrics.record_request(endpoint, "stale_cache_hit", time.time() - start_time)
+            return cached_search_response(request, stale_result, mode, "stale", start_time, "stale_cache")
+        
+        # 캐시 미스: 같은 캐시 키로 동시에 들어온 요청은 한 번만 검색 (나머지는 결과 공유)
+        async def compute() -> SearchResponse:
+            return await execute_search(
+                request, search_indices, mode, fusion, search_options,
+                rerank_enabled, rerank_candidates, cache_key, generation
+            )
         
-        logger.info(f"검색 완료: '{request.query}' - {len(results)}개 결과, {processing_time}ms")
+        try:
+            if search_flight:
+                # 공유 검색은 리더의 기한으로 실행, 리더의 기한 초과/부분 결과는 팔로워가 자신의 기한으로 재실행
+                response, coalesced = await deadline.bounded(search_flight.do(
+                    cache_key,
+                    compute,
+                    reusable=lambda shared: shared.degraded not in DEADLINE_DEGRADED,
+                    retry_on=(DeadlineExceeded,)
+                ), "coalesced")
+            else:
+                response, coalesced = await compute(), False
+        except DeadlineExceeded as e:
+            # 기한 초과: 이전 세대 캐시 결과 또는 빈 결과로 응답 (SLA 초과 대기 대신)
+            logger.warning(f"검색 기한 초과: '{request.query}' ({e.stage})")
+            metrics.record_request(endpoint, "deadline_exceeded", time.time() - start_time)
+            if stale_result:
+                return cached_search_response(request, stale_result, mode, "stale", start_time, "stale_cache")
+            return SearchResponse(
+                query=request.query,
+                results=[],
+                total_results=0,
+                processing_time_ms=int((time.time() - start_time) * 1000),
+                cached=False,
+                search_mode=mode,
+                degraded="deadline_exceeded"
+            )
+        except CircuitOpenError as e:
+            # OpenSearch 장애: 이전 세대 캐시 결과로 응답하거나 즉시 503 (타임아웃까지 대기하지 않음)
+            if stale_result:
+                metrics.record_request(endpoint, "stale_cache_hit", time.time() - start_time)
+                return cached_search_response(request, stale_result, mode, "stale", start_time, "stale_cache")
+            metrics.record_request(endpoint, "shed", time.time() - start_time)
+            raise HTTPException(
+                status_code=503,
+                detail=f"검색 백엔드 장애로 요청을 처리할 수 없습니다: {e}",
+                headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+            )
+        
+        processing_time = int((time.time() - start_time) * 1000)
+        response = response.model_copy(update={
+            "query": request.query,
+            "processing_time_ms": processing_time,
+            "coalesced": coalesced
+        })
+        
+        # 통계 업데이트 (프로세스 내 카운터, Redis 미사용)
+        outcome = "coalesced" if coalesced else (f"{response.cache_tier}_cache_hit" if response.cache_tier else "miss")
+        metrics.record_request(endpoint, outcome, time.time() - start_time)
+        record_search_query(request.query, response.total_results)
+        
+        logger.info(
+            f"검색 완료: '{request.query}' ({response.search_mode}) - {response.total_results}개 결과, "
+            f"{processing_time}ms{' (병합)' if coalesced else ''}"
+        )
         
         return response
         
@@ -408,96 +1338,440 @@ async def search_documents(request: SearchRequest):
         raise
     except Exception as e:
         processing_time = int((time.time() - start_time) * 1000)
+        metrics.record_request(endpoint, "error", time.time() - start_time)
         logger.error(f"검색 오류: '{request.query}' - {str(e)}")
         raise HTTPException(status_code=500, detail=f"검색 처리 중 오류 발생: {str(e)}")
 
+async def generate_embeddings_batch(texts: List[str]):
+    """여러 질의 임베딩 생성 (캐시는 파이프라인 한 번으로 조회, 미스는 동시 생성)
+
+    Returns:
+        ({질의: 임베딩}, 캐시 적중 수)
+    """
+    embeddings: Dict[str, Optional[List[float]]] = {}
+    try:
+        pipeline = redis_client.pipeline()
+        for text in texts:
+            pipeline.get(embedding_cache_key(text))
+        with redis_breaker.protect():
+            cached_embeddings = pipeline.execute()
+        for text, cached_embedding in zip(texts, cached_embeddings):
+            if cached_embedding:
+                embeddings[text] = json.loads(cached_embedding)
+    except Exception as e:
+        logger.warning(f"임베딩 캐시 일괄 조회 실패: {e}")
+    cache_hits = len(embeddings)
+    
+    semaphore = asyncio.Semaphore(SEARCH_BATCH_EMBED_CONCURRENCY)
+    
+    async def embed(text: str):
+        async with semaphore:
+            embeddings[text] = await generate_embedding(text, check_cache=False)
+    
+    await asyncio.gather(*[embed(text) for text in texts if text not in embeddings])
+    return embeddings, cache_hits
+
+async def msearch_vectors(
+    query_vectors: List[List[Any]],
+    top_k: int,
+    min_score: Optional[float],
+    search_indices: List[str],
+    filter_clauses: List[Dict[str, Any]],
+    encoding: Dict[str, Any]
+) -> List[Any]:
+    """k-NN 질의들을 _msearch로 실행 (MSEARCH_CHUNK_SIZE 단위로 나눠 동시 요청)
+
+    Returns:
+        질의별 결과 목록 또는 오류 메시지(str)
+    """
+    raw_min_score = cosine_to_raw_score(min_score, encoding) if min_score is not None else None
+    header = {"index": ",".join(search_indices), "ignore_unavailable": True}
+    
+    async def run_chunk(vectors: List[List[Any]]) -> List[Any]:
+        lines = []
+        for vector in vectors:
+            lines.append(header)
+            lines.append(build_vector_search_body(vector, top_k, filter_clauses, encoding, raw_min_score))
+        try:
+            with opensearch_breaker.protect(), metrics.observe_stage("msearch"):
+                response = await deadline.bounded(
+                    opensearch_client.msearch(body=lines, request_timeout=deadline.timeout(SEARCH_REQUEST_TIMEOUT)),
+                    "msearch"
+                )
+        except CircuitOpenError:
+            raise
+        except DeadlineExceeded:
+            # 기한 안에 끝나지 않은 묶음만 실패로 표시 (나머지 질의 결과는 반환)
+            return ["검색 기한 초과"] * len(vectors)
+        except Exception as e:
+            logger.error(f"_msearch 실패: {e}")
+            return [f"검색 실패: {e}"] * len(vectors)
+        
+        chunk_results = []
+        for item in response.get("responses", []):
+            if "error" in item:
+                chunk_results.append(f"검색 실패: {item['error'].get('reason', item['error']) if isinstance(item['error'], dict) else item['error']}")
+            else:
+                chunk_results.append(parse_vector_hits(item.get("hits", {}).get("hits", []), top_k, encoding))
+        return chunk_results
+    
+    chunks = [query_vectors[i:i + MSEARCH_CHUNK_SIZE] for i in range(0, len(query_vectors), MSEARCH_CHUNK_SIZE)]
+    chunk_results = await asyncio.gather(*[run_chunk(chunk) for chunk in chunks])
+    return [result for results in chunk_results for result in results]
+
+# 배치 검색 엔드포인트 (평가 세트, 대량 조회용)
+@app.post("/search/batch", response_model=BatchSearchResponse)
+async def search_documents_batch(request: BatchSearchRequest):
+    """여러 질의 일괄 검색 (중복 질의 제거, 임베딩 공유, _msearch 한 번에 실행)"""
+    start_time = time.time()
+    metrics.start_request()
+    
+    if not request.queries:
+        raise HTTPException(status_code=400, detail="검색할 질의가 없습니다")
+    if len(request.queries) > SEARCH_BATCH_MAX_QUERIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 검색할 수 있는 질의는 최대 {SEARCH_BATCH_MAX_QUERIES}개입니다"
+        )
+    if request.partitions and PARTITION_STRATEGY == "none":
+        raise HTTPException(status_code=400, detail="파티셔닝이 설정되지 않은 인덱스입니다")
+    
+    try:
+        search_indices = request_search_indices(request)
+        filters = request.filters or SearchFilters()
+        filter_clauses = build_filter_clauses(
+            filters.doc_ids,
+            filters.metadata,
+            filters.indexed_after,
+            filters.indexed_before
+        )
+        
+        # 1. 중복 질의 제거 (순서 유지) 후 임베딩 일괄 생성
+        unique_queries = list(dict.fromkeys(request.queries))
+        embeddings, cache_hits = await generate_embeddings_batch(unique_queries)
+        
+        # 2. 임베딩이 있는 질의만 _msearch로 검색
+        encoding = await get_index_vector_encoding()
+        searchable = [query for query in unique_queries if embeddings.get(query)]
+        query_vectors = [await encode_query_vector(embeddings[query]) for query in searchable]
+        search_results = await msearch_vectors(
+            query_vectors, request.top_k, request.min_score, search_indices, filter_clauses, encoding
+        )
+        results_by_query: Dict[str, Any] = dict(zip(searchable, search_results))
+        
+        # 3. 요청 순서대로 질의별 결과 구성
+        batch_results = []
+        for query in request.queries:
+            outcome = results_by_query.get(query, "질의 임베딩 생성 실패")
+            if isinstance(outcome, str):
+                batch_results.append(BatchQueryResult(query=query, results=[], total_results=0, error=outcome))
+                continue
+            
+            results = [
+                SearchResult(
+                    doc_id=result["doc_id"],
+                    chunk_index=result["chunk_index"],
+                    chunk_text=result["chunk_text"],
+                    score=result["score"],
+                    metadata=result["metadata"] if request.include_metadata else {}
+                )
+                for result in outcome
+            ]
+            batch_results.append(BatchQueryResult(query=query, results=results, total_results=len(results)))
+        
+        metrics.record_request("batch", "ok", time.time() - start_time, count=len(request.queries))
+        
+        processing_time = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"배치 검색 완료: {len(request.queries)}개 질의 (고유 {len(unique_queries)}개, "
+            f"임베딩 캐시 적중 {cache_hits}개), {processing_time}ms"
+        )
+        
+        return BatchSearchResponse(
+            results=batch_results,
+            total_queries=len(request.queries),
+            unique_queries=len(unique_queries),
+            embedding_cache_hits=cache_hits,
+            processing_time_ms=processing_time
+        )
+        
+    except HTTPException:
+        raise
+    except CircuitOpenError as e:
+        metrics.record_request("batch", "shed", time.time() - start_time, count=len(request.queries))
+        raise HTTPException(
+            status_code=503,
+            detail=f"검색 백엔드 장애로 요청을 처리할 수 없습니다: {e}",
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+        )
+    except Exception as e:
+        metrics.record_request("batch", "error", time.time() - start_time, count=len(request.queries))
+        logger.error(f"배치 검색 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"배치 검색 처리 중 오류 발생: {str(e)}")
+
+# 스트리밍 검색 엔드포인트 (채팅 UI 등 첫 결과까지의 시간이 중요한 경우)
+@app.post("/search/stream")
+async def search_documents_stream(request: StreamSearchRequest, http_request: Request):
+    """단계별 결과 스트리밍 (키워드 결과 -> 벡터 결과 -> 최종 병합/재순위화 순서)
+
+    이벤트: lexical, vector, final, done (오류 시 error)
+    """
+    stream_format = (request.format or "ndjson").lower()
+    if stream_format not in SUPPORTED_STREAM_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 스트림 형식: {stream_format} (지원: {', '.join(SUPPORTED_STREAM_FORMATS)})"
+        )
+    if request.partitions and PARTITION_STRATEGY == "none":
+        raise HTTPException(status_code=400, detail="파티셔닝이 설정되지 않은 인덱스입니다")
+    try:
+        mode, fusion = validate_search_mode(request.mode or DEFAULT_SEARCH_MODE, request.fusion)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    search_indices = request_search_indices(request)
+    filters = request.filters or SearchFilters()
+    filter_clauses = build_filter_clauses(
+        filters.doc_ids,
+        filters.metadata,
+        filters.indexed_after,
+        filters.indexed_before
+    )
+    rerank_enabled = rerank_batcher is not None and (RERANK_ENABLED if request.rerank is None else request.rerank)
+    candidate_k = max(request.top_k, request.rerank_candidates or RERANK_CANDIDATES) if rerank_enabled else request.top_k
+    
+    # 수락 제어 (슬롯은 스트림이 끝나거나 클라이언트가 끊은 뒤 반환, 스트림 길이는 한도 조정에 반영하지 않음)
+    slot_held = False
+    if search_admission:
+        priority = parse_priority(http_request.headers.get(PRIORITY_HEADER), PRIORITY_INTERACTIVE)
+        try:
+            await search_admission.acquire(priority, deadline.remaining())
+        except AdmissionRejected as e:
+            metrics.record_request("stream", "rejected", 0.0)
+            raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(int(e.retry_after))})
+        slot_held = True
+    
+    def release_slot():
+        """슬롯 반환 (스트림 종료, 전송 오류, 스트림 시작 전 연결 종료 중 먼저 온 경우 한 번만)"""
+        nonlocal slot_held
+        if slot_held:
+            slot_held = False
+            search_admission.release(0.0, sample=False)
+    
+    async def event_stream():
+        start_time = time.time()
+        metrics.start_request()
+        
+        def emit(event: str, results: Optional[List[Dict[str, Any]]] = None, **extra) -> str:
+            data = dict(extra, elapsed_ms=int((time.time() - start_time) * 1000))
+            if results is not None:
+                data["results"] = stream_results(
+                    results, request.query, request.include_metadata, request.max_chars, request.highlight
+                )
+            return format_event(event, data, stream_format)
+        
+        async def vector_search() -> List[Dict[str, Any]]:
+            query_embedding = await generate_embedding(request.query)
+            if not query_embedding:
+                # Bedrock 장애: 하이브리드는 키워드 결과만으로, 벡터 모드는 키워드 검색으로 대체
+                if mode == "hybrid":
+                    return []
+                return await search_keyword_documents(request.query, candidate_k, search_indices, filter_clauses)
+            return await search_similar_documents(
+                query_embedding,
+                candidate_k * 2 if mode == "hybrid" else candidate_k,
+                request.min_score,
+                search_indices,
+                filter_clauses
+            )
+        
+        tasks = {}
+        try:
+            if mode in ("keyword", "hybrid"):
+                lexical_k = candidate_k * 2 if mode == "hybrid" else candidate_k
+                tasks[asyncio.create_task(
+                    search_keyword_documents(request.query, lexical_k, search_indices, filter_clauses)
+                )] = "lexical"
+            if mode in ("vector", "hybrid"):
+                tasks[asyncio.create_task(vector_search())] = "vector"
+            
+            # 먼저 끝난 단계부터 전송 (키워드 검색은 임베딩 생성이 없어 보통 먼저 도착)
+            stage_results = {}
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    stage = tasks[task]
+                    stage_results[stage] = task.result()
+                    yield emit(stage, stage_results[stage][:request.top_k])
+            
+            # 최종 순서: 하이브리드 병합 후 재순위화
+            if mode == "hybrid":
+                weights = [request.vector_weight, request.keyword_weight]
+                lists = [stage_results.get("vector", []), stage_results.get("lexical", [])]
+                if fusion == "weighted":
+                    final_results = weighted_score_fusion(lists, weights)
+                else:
+                    final_results = reciprocal_rank_fusion(lists, weights, HYBRID_RRF_K)
+            else:
+                final_results = stage_results.get("vector", stage_results.get("lexical", []))
+            final_results = final_results[:candidate_k]
+            
+            reranked = False
+            if rerank_enabled:
+                with metrics.observe_stage("rerank"):
+                    final_results, reranked = await rerank_batcher.rerank(
+                        request.query, final_results, RERANK_BUDGET_MS / 1000
+                    )
+            final_results = final_results[:request.top_k]
+            
+            yield emit("final", final_results, search_mode=mode, reranked=reranked)
+            yield emit("done", total_results=len(final_results))
+            
+            metrics.record_request("stream", "ok", time.time() - start_time)
+            record_search_query(request.query, len(final_results))
+            
+        except Exception as e:
+            metrics.record_request("stream", "error", time.time() - start_time)
+            logger.error(f"스트리밍 검색 오류: '{request.query}' - {e}")
+            yield emit("error", detail=f"검색 처리 중 오류 발생: {str(e)}")
+        finally:
+            # 클라이언트가 연결을 끊으면 남은 단계 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            release_slot()
+    
+    try:
+        # 백그라운드 작업은 본문 생성이 시작되지 않은 경우(시작 전 연결 종료)를 위한 보조 반환 경로
+        return StreamingResponse(
+            event_stream(),
+            media_type=MEDIA_TYPES[stream_format],
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            background=BackgroundTask(release_slot)
+        )
+    except Exception:
+        release_slot()
+        raise
+
 # GET 방식 검색 엔드포인트 (간단한 사용을 위해)
 @app.get("/search", response_model=SearchResponse)
 async def search_documents_get(
     q: str = Query(..., description="검색 질의"),
     top_k: int = Query(5, description="반환할 결과 수", ge=1, le=20),
-    min_score: float = Query(0.5, description="최소 유사도 점수", ge=0.0, le=1.0),
-    include_metadata: bool = Query(True, description="메타데이터 포함 여부")
+    min_score: float = Query(0.5, description="최소 코사인 유사도", ge=-1.0, le=1.0),
+    include_metadata: bool = Query(True, description="메타데이터 포함 여부"),
+    partitions: Optional[List[str]] = Query(None, description="검색할 파티션 키"),
+    mode: Optional[str] = Query(None, description="검색 모드 (vector, hybrid, keyword)"),
+    fusion: str = Query("rrf", description="하이브리드 병합 방식 (rrf, weighted)"),
+    vector_weight: float = Query(1.0, description="하이브리드 벡터 결과 가중치", ge=0.0),
+    keyword_weight: float = Query(1.0, description="하이브리드 키워드 결과 가중치", ge=0.0),
+    rerank: Optional[bool] = Query(None, description="재순위화 여부"),
+    doc_id: Optional[List[str]] = Query(None, description="검색할 문서 ID"),
+    metadata_filter: Optional[List[str]] = Query(None, alias="filter", description="메타데이터 필터 (field:value, 같은 필드는 OR)"),
+    indexed_after: Optional[str] = Query(None, description="인덱싱 시각 하한 (ISO 8601)"),
+    indexed_before: Optional[str] = Query(None, description="인덱싱 시각 상한 (ISO 8601)")
 ):
     """GET 방식 문서 검색"""
+    metadata_filters: Dict[str, List[str]] = {}
+    for item in metadata_filter or []:
+        field, separator, value = item.partition(":")
+        if not separator or not field:
+            raise HTTPException(status_code=400, detail=f"잘못된 메타데이터 필터: {item} (field:value 형식)")
+        metadata_filters.setdefault(field, []).append(value)
+    
+    filters = None
+    if doc_id or metadata_filters or indexed_after or indexed_before:
+        filters = SearchFilters(
+            doc_ids=doc_id,
+            metadata=metadata_filters or None,
+            indexed_after=indexed_after,
+            indexed_before=indexed_before
+        )
+    
     request = SearchRequest(
         query=q,
         top_k=top_k,
         min_score=min_score,
-        include_metadata=include_metadata
+        include_metadata=include_metadata,
+        partitions=partitions,
+        mode=mode,
+        fusion=fusion,
+        vector_weight=vector_weight,
+        keyword_weight=keyword_weight,
+        filters=filters,
+        rerank=rerank
     )
     return await search_documents(request)
 
 # 추천 검색어 엔드포인트
 @app.get("/suggestions")
 async def get_search_suggestions(
-    prefix: str = Query(..., description="검색어 접두사", min_length=2)
+    prefix: str = Query(..., description="검색어 접두사", min_length=2),
+    limit: int = Query(10, description="반환할 제안 수", ge=1, le=50)
 ):
-    """검색어 자동완성 제안"""
+    """검색어 자동완성 제안 (최근 빈도순)"""
+    if not suggestion_index:
+        return {"prefix": prefix, "suggestions": []}
+    
     try:
-        # Redis에서 최근 검색어 조회
-        pattern = f"search_result:*{prefix.lower()}*"
-        keys = redis_client.keys(pattern)
-        
-        # 최근 검색어 추출 (간단한 구현)
-        suggestions = []
-        for key in keys[:10]:  # 최대 10개
-            # 실제 구현에서는 더 정교한 로직 필요
-            suggestions.append(f"관련 검색어 {len(suggestions) + 1}")
-        
-        return {
-            "prefix": prefix,
-            "suggestions": suggestions
-        }
-        
+        # 동기 Redis 조회는 스레드에서 (Redis 장애 중에는 호출 없이 빈 제안)
+        with redis_breaker.protect():
+            suggestions = await asyncio.to_thread(suggestion_index.suggest, prefix, limit)
     except Exception as e:
         logger.error(f"검색어 제안 오류: {e}")
-        return {
-            "prefix": prefix,
-            "suggestions": []
-        }
+        suggestions = []
+    
+    return {
+        "prefix": prefix,
+        "suggestions": suggestions
+    }
 
 # 인기 검색어 엔드포인트
 @app.get("/popular")
-async def get_popular_queries():
-    """인기 검색어 조회"""
+async def get_popular_queries(
+    window: str = Query("hour", description="집계 기간 (hour, day)"),
+    limit: int = Query(10, description="반환할 검색어 수", ge=1, le=100)
+):
+    """인기 검색어 조회 (레플리카 병합 주기만큼 지연될 수 있음)"""
+    if window not in POPULAR_WINDOWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 기간: {window} (지원: {', '.join(POPULAR_WINDOWS)})"
+        )
+    if not popular_queries:
+        return {"window": window, "popular_queries": [], "updated_at": datetime.utcnow().isoformat()}
+    
     try:
-        # 실제 구현에서는 Redis sorted set 등을 사용하여 검색 빈도 추적
-        popular_queries = [
-            {"query": "AWS Lambda", "count": 15},
-            {"query": "서버리스 아키텍처", "count": 12},
-            {"query": "벡터 검색", "count": 8},
-            {"query": "임베딩", "count": 6},
-            {"query": "OpenSearch", "count": 5}
-        ]
-        
-        return {
-            "popular_queries": popular_queries,
-            "updated_at": datetime.utcnow().isoformat()
-        }
-        
+        # 동기 Redis 조회는 스레드에서 (Redis 장애 중에는 호출 없이 빈 목록)
+        with redis_breaker.protect():
+            top_queries = await asyncio.to_thread(popular_queries.top, window, limit)
     except Exception as e:
         logger.error(f"인기 검색어 조회 오류: {e}")
-        return {
-            "popular_queries": [],
-            "updated_at": datetime.utcnow().isoformat()
-        }
+        top_queries = []
+    
+    return {
+        "window": window,
+        "popular_queries": top_queries,
+        "updated_at": datetime.utcnow().isoformat()
+    }
 
 # 애플리케이션 시작 시 초기화
 @app.on_event("startup")
 async def startup_event():
     """애플리케이션 시작 시 실행"""
     logger.info(f"{SERVICE_NAME} v{SERVICE_VERSION} 시작")
+    tracing.init_tracing(SERVICE_NAME, SERVICE_VERSION)
     
     # OpenSearch 연결 테스트
     try:
-        cluster_info = opensearch_client.info()
+        cluster_info = await opensearch_client.info()
         logger.info(f"OpenSearch 연결 성공: {cluster_info['version']['number']}")
         
         # 인덱스 존재 확인
-        if opensearch_client.indices.exists(index=OPENSEARCH_INDEX):
-            stats = opensearch_client.indices.stats(index=OPENSEARCH_INDEX)
-            doc_count = stats['indices'][OPENSEARCH_INDEX]['total']['docs']['count']
+        if await opensearch_client.indices.exists(index=OPENSEARCH_INDEX):
+            stats = await opensearch_client.indices.stats(index=OPENSEARCH_INDEX)
+            doc_count = stats['_all']['total']['docs']['count']
             logger.info(f"인덱스 '{OPENSEARCH_INDEX}' 확인: {doc_count}개 문서")
         else:
             logger.warning(f"인덱스 '{OPENSEARCH_INDEX}'가 존재하지 않습니다")
@@ -521,11 +1795,32 @@ async def startup_event():
             logger.warning("Bedrock 연결 실패")
     except Exception as e:
         logger.error(f"Bedrock 연결 실패: {e}")
+    
+    asyncio.create_task(health_monitor.loop())
+    if suggestion_index:
+        asyncio.create_task(suggestion_flush_loop())
+    if popular_queries:
+        asyncio.create_task(popular_merge_loop())
+    if cache_warmer:
+        # 예열이 끝날 때까지 /readyz, /health는 503 (준비되지 않은 파드로 트래픽이 가지 않도록)
+        health_monitor.add_gate("cache_warmup", lambda: cache_warmer.ready)
+        asyncio.create_task(startup_warmup())
+        asyncio.create_task(prewarm_loop())
+        asyncio.create_task(generation_watch_loop())
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
     logger.info(f"{SERVICE_NAME} 종료")
+    if suggestion_index:
+        await suggestion_index.flush()
+    if popular_queries:
+        await popular_queries.merge()
+    try:
+        await opensearch_client.close()
+    except Exception:
+        pass
+    tracing.shutdown_tracing()
     try:
         redis_client.close()
     except Exception:
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+서킷 브레이커 모듈
+의존성(Bedrock, OpenSearch, Redis)별 실패율을 시간 창 단위로 집계해 장애 중에는 호출 없이 즉시 실패시키는 기능 제공
+
+- closed: 최근 window_seconds 동안 호출이 minimum_calls 이상이고 실패율이 failure_rate_threshold 이상이면 open
+- open: open_seconds 동안 호출 거부 (CircuitOpenError), 이후 half_open
+- half_open: 동시에 half_open_max_calls개까지만 시험 호출, 모두 성공하면 closed, 하나라도 실패하면 다시 open
+- slow_call_seconds 지정 시 그보다 오래 걸린 호출도 실패로 집계 (타임아웃 직전까지 느려지는 장애 대응)
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Prometheus 게이지 값
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출을 거부함"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} 서킷 열림 ({retry_after:.1f}초 후 재시도)")
+        self.name = name
+        self.retry_after = retry_after
+
+class CircuitBreaker:
+    """실패율 기반 서킷 브레이커 (단일 이벤트 루프 내에서 사용)"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window_seconds: int = 30,
+        open_seconds: float = 15.0,
+        half_open_max_calls: int = 3,
+        slow_call_seconds: Optional[float] = None,
+        is_failure: Optional[Callable[[BaseException], bool]] = None
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.slow_call_seconds = slow_call_seconds
+        self.is_failure = is_failure or (lambda error: True)
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.half_open_in_flight = 0
+        self.half_open_successes = 0
+        # 초 단위 버킷 [초, 호출 수, 실패 수]
+        self.buckets: deque = deque()
+        self.stats = {"opened": 0, "rejected": 0, "failures": 0, "slow_calls": 0}
+
+    def _trim(self, now: float):
+        """시간 창을 벗어난 버킷 제거"""
+        horizon = int(now) - self.window_seconds
+        while self.buckets and self.buckets[0][0] <= horizon:
+            self.buckets.popleft()
+
+    def _record(self, failed: bool):
+        """현재 초 버킷에 호출 결과 기록"""
+        now = time.monotonic()
+        second = int(now)
+        if not self.buckets or self.buckets[-1][0] != second:
+            self.buckets.append([second, 0, 0])
+        self.buckets[-1][1] += 1
+        self.buckets[-1][2] += int(failed)
+        self._trim(now)
+
+    def window_counts(self):
+        """시간 창 내 (호출 수, 실패 수)"""
+        self._trim(time.monotonic())
+        return sum(bucket[1] for bucket in self.buckets), sum(bucket[2] for bucket in self.buckets)
+
+    def _transition(self, state: str):
+        """상태 전환"""
+        self.state = state
+        if state == OPEN:
+            self.opened_at = time.monotonic()
+            self.stats["opened"] += 1
+        if state in (OPEN, CLOSED):
+            self.half_open_in_flight = 0
+            self.half_open_successes = 0
+        if state == CLOSED:
+            self.buckets.clear()
+
+    def retry_after(self) -> float:
+        """open 상태가 끝날 때까지 남은 시간 (초)"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.open_seconds - time.monotonic())
+
+    def is_open(self) -> bool:
+        """호출이 거부되는 상태인지 (시험 호출 가능 시점이 지났으면 False)"""
+        return self.state == OPEN and self.retry_after() > 0
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (half_open 시험 호출 슬롯 확보 포함)"""
+        if self.state == OPEN:
+            if self.retry_after() > 0:
+                return False
+            self._transition(HALF_OPEN)
+        if self.state == HALF_OPEN:
+            if self.half_open_in_flight >= self.half_open_max_calls:
+                return False
+            self.half_open_in_flight += 1
+        return True
+
+    def record_success(self, probe: bool):
+        """호출 성공 기록"""
+        if probe:
+            self.half_open_in_flight = max(0, self.half_open_in_flight - 1)
+            if self.state == HALF_OPEN:
+                self.half_open_successes += 1
+                if self.half_open_successes >= self.half_open_max_calls:
+                    self._transition(CLOSED)
+            return
+        self._record(False)
+
+    def record_failure(self, probe: bool):
+        """호출 실패 기록 (실패율 임계값 초과 시 open)"""
+        self.stats["failures"] += 1
+        if probe:
+            if self.state == HALF_OPEN:
+                self._transition(OPEN)
+            return
+        self._record(True)
+        if self.state == CLOSED:
+            calls, failures = self.window_counts()
+            if calls >= self.minimum_calls and failures / calls >= self.failure_rate_threshold:
+                self._transition(OPEN)
+
+    @contextmanager
+    def protect(self) -> Iterator[None]:
+        """보호 구간 (거부 시 CircuitOpenError, 구간 내 예외와 소요 시간으로 결과 기록)"""
+        if not self.allow():
+            self.stats["rejected"] += 1
+            raise CircuitOpenError(self.name, self.retry_after())
+        probe = self.state == HALF_OPEN
+        started = time.monotonic()
+        try:
+            yield
+        except asyncio.CancelledError:
+            # 호출자 취소는 의존성 결과가 아님 (시험 슬롯만 반환)
+            if probe:
+                self.half_open_in_flight = max(0, self.half_open_in_flight - 1)
+            raise
+        except Exception as e:
+            if self.is_failure(e):
+                self.record_failure(probe)
+            else:
+                self.record_success(probe)
+            raise
+        else:
+            if self.slow_call_seconds and time.monotonic() - started > self.slow_call_seconds:
+                self.stats["slow_calls"] += 1
+                self.record_failure(probe)
+            else:
+                self.record_success(probe)
+
+    def state_value(self) -> int:
+        """상태 게이지 값 (0 closed, 1 half_open, 2 open)"""
+        if self.state == OPEN and self.retry_after() == 0:
+            return STATE_VALUES[HALF_OPEN]
+        return STATE_VALUES[self.state]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """브레이커 상태"""
+        calls, failures = self.window_counts()
+        return dict(
+            self.stats,
+            state=self.state,
+            window_calls=calls,
+            window_failure_rate=round(failures / calls, 3) if calls else 0.0,
+            retry_after_seconds=round(self.retry_after(), 1)
+        )
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+요청 기한 모듈
+요청 단위 기한(deadline)을 컨텍스트 변수로 전달하고 단계별로 남은 시간만큼만 기다리는 기능 제공
+
+- 기한은 요청 헤더(밀리초 예산) 또는 기본값으로 정해지며 같은 요청에서 생성된 태스크에도 전달됨
+- 기한이 없으면(예열 등 내부 호출) 제한 없이 동작
+- 기한 초과 시 DeadlineExceeded (호출자가 부분/대체 응답으로 처리)
+"""
+
+import asyncio
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Optional
+
+# 기한 (time.monotonic 기준, 없으면 None)
+deadline_var: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+class DeadlineExceeded(Exception):
+    """요청 기한 초과"""
+
+    def __init__(self, stage: str):
+        super().__init__(f"요청 기한 초과 ({stage})")
+        self.stage = stage
+
+def parse_budget_ms(value: Optional[str], default_ms: float, max_ms: float) -> float:
+    """헤더의 밀리초 예산 (형식 오류/미지정 시 기본값, 최대값으로 제한)"""
+    try:
+        budget_ms = float(value) if value else default_ms
+    except ValueError:
+        budget_ms = default_ms
+    if budget_ms <= 0:
+        budget_ms = default_ms
+    return min(budget_ms, max_ms)
+
+def start(budget_seconds: float):
+    """현재 컨텍스트에 기한 설정 (reset용 토큰 반환)"""
+    return deadline_var.set(time.monotonic() + budget_seconds)
+
+def reset(token):
+    """기한 설정 해제"""
+    deadline_var.reset(token)
+
+def remaining() -> Optional[float]:
+    """남은 시간 (초, 기한이 없으면 None)"""
+    deadline = deadline_var.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+def expired() -> bool:
+    """기한 초과 여부"""
+    left = remaining()
+    return left is not None and left <= 0
+
+def timeout(default: float) -> float:
+    """단계 타임아웃 (기본값과 남은 시간 중 작은 값)"""
+    left = remaining()
+    if left is None:
+        return default
+    return max(0.0, min(default, left))
+
+def check(stage: str):
+    """기한이 지났으면 DeadlineExceeded"""
+    if expired():
+        raise DeadlineExceeded(stage)
+
+async def bounded(awaitable: Awaitable[Any], stage: str) -> Any:
+    """남은 시간 안에 끝나지 않으면 취소하고 DeadlineExceeded"""
+    left = remaining()
+    if left is None:
+        return await awaitable
+    if left <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded(stage)
+    try:
+        return await asyncio.wait_for(awaitable, left)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded(stage)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+하이브리드 검색 모듈
+BM25(키워드) 결과와 벡터(k-NN) 결과를 RRF 또는 가중 정규화 점수로 병합하는 기능 제공
+"""
+
+import re
+from typing import Dict, List, Optional, Any, Tuple
+
+SUPPORTED_SEARCH_MODES = ("vector", "hybrid", "keyword")
+SUPPORTED_FUSIONS = ("rrf", "weighted")
+DEFAULT_RRF_K = 60
+
+# 제품 코드 / 오류 ID 형태 (예: ABC-1234, E1023, KB000123, 0x80070005)
+_CODE_TOKEN = re.compile(r"^(?=.*\d)(?=.*[A-Za-z])[A-Za-z0-9][A-Za-z0-9_.:/-]*$|^0x[0-9a-fA-F]+$|^\d{4,}$")
+_QUOTED = re.compile(r'^".+"$')
+
+def validate_search_mode(mode: str, fusion: str) -> Tuple[str, str]:
+    """검색 모드 / 병합 방식 검증"""
+    mode = (mode or "vector").lower()
+    fusion = (fusion or "rrf").lower()
+    if mode not in SUPPORTED_SEARCH_MODES:
+        raise ValueError(f"지원하지 않는 검색 모드: {mode} (지원: {', '.join(SUPPORTED_SEARCH_MODES)})")
+    if fusion not in SUPPORTED_FUSIONS:
+        raise ValueError(f"지원하지 않는 병합 방식: {fusion} (지원: {', '.join(SUPPORTED_FUSIONS)})")
+    return mode, fusion
+
+def looks_like_keyword_query(query: str) -> bool:
+    """임베딩 없이 키워드 검색만으로 충분한 질의인지 판단
+
+    따옴표로 감싼 구문이거나, 세 단어 이하이면서 코드/ID 형태의 토큰을 포함하는 경우
+    """
+    query = query.strip()
+    if _QUOTED.match(query):
+        return True
+
+    tokens = query.split()
+    return 0 < len(tokens) <= 3 and any(_CODE_TOKEN.match(token) for token in tokens)
+
+def build_keyword_query(query: str, size: int, filter_clauses: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """chunk_text BM25 검색 쿼리"""
+    query = query.strip()
+    if _QUOTED.match(query):
+        text_query = {"match_phrase": {"chunk_text": query.strip('"')}}
+    else:
+        text_query = {"match": {"chunk_text": {"query": query, "operator": "or"}}}
+
+    if filter_clauses:
+        text_query = {"bool": {"must": [text_query], "filter": filter_clauses}}
+
+    return {
+        "query": text_query,
+        "_source": ["doc_id", "chunk_index", "chunk_text", "metadata", "indexed_at"],
+        "size": size
+    }
+
+def result_key(result: Dict[str, Any]) -> Tuple[str, int]:
+    """결과 식별 키 (문서 ID, 청크 번호)"""
+    return result.get("doc_id", ""), result.get("chunk_index", 0)
+
+def reciprocal_rank_fusion(
+    result_lists: List[List[Dict[str, Any]]],
+    weights: List[float],
+    rank_constant: int = DEFAULT_RRF_K
+) -> List[Dict[str, Any]]:
+    """가중 RRF: score = Σ weight / (rank_constant + rank)"""
+    fused: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    scores: Dict[Tuple[str, int], float] = {}
+
+    for results, weight in zip(result_lists, weights):
+        for rank, result in enumerate(results, start=1):
+            key = result_key(result)
+            fused.setdefault(key, result)
+            scores[key] = scores.get(key, 0.0) + weight / (rank_constant + rank)
+
+    return _ranked(fused, scores)
+
+def weighted_score_fusion(
+    result_lists: List[List[Dict[str, Any]]],
+    weights: List[float]
+) -> List[Dict[str, Any]]:
+    """목록별 min-max 정규화 후 가중 합산"""
+    fused: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    scores: Dict[Tuple[str, int], float] = {}
+
+    for results, weight in zip(result_lists, weights):
+        if not results:
+            continue
+        raw = [result["score"] for result in results]
+        low, high = min(raw), max(raw)
+        for result in results:
+            key = result_key(result)
+            normalized = (result["score"] - low) / (high - low) if high > low else 1.0
+            fused.setdefault(key, result)
+            scores[key] = scores.get(key, 0.0) + weight * normalized
+
+    return _ranked(fused, scores)
+
+def _ranked(fused: Dict[Tuple[str, int], Dict[str, Any]], scores: Dict[Tuple[str, int], float]) -> List[Dict[str, Any]]:
+    """병합 점수 순 정렬 (원본 결과는 변경하지 않음)"""
+    ordered = sorted(scores, key=scores.get, reverse=True)
+    return [dict(fused[key], score=round(scores[key], 6)) for key in ordered]
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+메트릭 모듈
+파드(프로세스) 단위 Prometheus 카운터/히스토그램 레지스트리와 단계별 지연 시간 측정 기능 제공
+
+- 요청 경로에서 Redis를 사용하지 않음 (레플리카 간 합산은 Prometheus가 수행)
+- 히스토그램 관측값에 트레이스 ID(트레이싱 비활성화 시 요청 ID) 예시(exemplar)를 붙여 느린 요청을 트레이스와 연결
+- 단계별 측정 시 같은 이름의 트레이싱 스팬도 함께 기록
+"""
+
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional, Tuple
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client.exposition import CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client.openmetrics.exposition import (
+    CONTENT_TYPE_LATEST as OPENMETRICS_CONTENT_TYPE,
+    generate_latest as generate_openmetrics
+)
+
+import tracing
+
+REGISTRY = CollectorRegistry(auto_describe=True)
+
+# 5ms ~ 10s
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+
+SEARCH_REQUESTS = Counter(
+    "search_requests_total",
+    "검색 요청 수",
+    ["endpoint", "outcome"],
+    registry=REGISTRY
+)
+SEARCH_LATENCY = Histogram(
+    "search_request_duration_seconds",
+    "검색 요청 전체 처리 시간",
+    ["endpoint"],
+    buckets=LATENCY_BUCKETS,
+    registry=REGISTRY
+)
+STAGE_LATENCY = Histogram(
+    "search_stage_duration_seconds",
+    "검색 단계별 처리 시간 (embed, knn, msearch, keyword, rerank, cache_lookup, semantic_lookup, cache_store)",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+    registry=REGISTRY
+)
+CACHE_LOOKUPS = Counter(
+    "search_cache_lookups_total",
+    "검색 결과 캐시 조회 결과",
+    ["tier", "result"],
+    registry=REGISTRY
+)
+QUERY_EMBEDDINGS = Counter(
+    "search_query_embeddings_total",
+    "질의 임베딩 조회/생성 수",
+    ["source"],
+    registry=REGISTRY
+)
+ADMISSION_LIMIT = Gauge(
+    "search_admission_limit",
+    "수락 제어 풀별 현재 동시 실행 한도",
+    ["pool"],
+    registry=REGISTRY
+)
+ADMISSION_IN_FLIGHT = Gauge(
+    "search_admission_in_flight",
+    "수락 제어 풀별 실행 중 요청 수",
+    ["pool"],
+    registry=REGISTRY
+)
+ADMISSION_QUEUED = Gauge(
+    "search_admission_queued",
+    "수락 제어 풀별 대기 중 요청 수",
+    ["pool"],
+    registry=REGISTRY
+)
+CIRCUIT_BREAKER_STATE = Gauge(
+    "search_circuit_breaker_state",
+    "의존성별 서킷 브레이커 상태 (0 closed, 1 half_open, 2 open)",
+    ["dependency"],
+    registry=REGISTRY
+)
+
+# 현재 요청 ID (히스토그램 exemplar)
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+def start_request() -> str:
+    """요청 ID 발급 및 현재 컨텍스트에 설정"""
+    request_id = uuid.uuid4().hex[:16]
+    request_id_var.set(request_id)
+    return request_id
+
+def current_exemplar() -> Optional[Dict[str, str]]:
+    """현재 요청의 exemplar 라벨"""
+    trace_id = tracing.current_trace_id()
+    if trace_id:
+        return {"trace_id": trace_id}
+    request_id = request_id_var.get()
+    return {"request_id": request_id} if request_id else None
+
+def observe_latency(histogram, seconds: float):
+    """exemplar를 포함해 관측"""
+    histogram.observe(seconds, exemplar=current_exemplar())
+
+@contextmanager
+def observe_stage(stage: str):
+    """블록 실행 시간을 단계별 히스토그램과 트레이싱 스팬에 기록"""
+    started = time.perf_counter()
+    try:
+        with tracing.start_span(f"search.{stage}"):
+            yield
+    finally:
+        observe_latency(STAGE_LATENCY.labels(stage), time.perf_counter() - started)
+
+def register_gauge(name: str, documentation: str, func: Callable[[], float]) -> Gauge:
+    """스크레이프 시점에 값을 계산하는 게이지 등록"""
+    gauge = Gauge(name, documentation, registry=REGISTRY)
+    gauge.set_function(func)
+    return gauge
+
+def render_metrics(accept: Optional[str]) -> Tuple[bytes, str]:
+    """Prometheus 텍스트 형식으로 직렬화 (OpenMetrics 요청 시 exemplar 포함)"""
+    if accept and "application/openmetrics-text" in accept:
+        return generate_openmetrics(REGISTRY), OPENMETRICS_CONTENT_TYPE
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+def record_request(endpoint: str, outcome: str, seconds: float, count: int = 1):
+    """요청 수와 전체 처리 시간 기록"""
+    SEARCH_REQUESTS.labels(endpoint, outcome).inc(count)
+    observe_latency(SEARCH_LATENCY.labels(endpoint), seconds)
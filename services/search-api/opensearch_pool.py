@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+비동기 OpenSearch 클라이언트 모듈
+keep-alive 연결 풀 크기를 지정한 AsyncOpenSearch 생성과 풀 사용률 측정 기능 제공
+
+검색 요청이 이벤트 루프를 막지 않으므로 워커 하나가 최대 풀 크기만큼 동시 검색 가능
+"""
+
+import time
+from typing import Dict, Any, Optional
+
+from opensearchpy import AsyncOpenSearch, AIOHttpConnection
+from opensearchpy.exceptions import ConnectionTimeout
+
+class PoolStats:
+    """연결 풀 사용률 통계 (워커 프로세스 단위)"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.total_requests = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.total_duration = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 통계 조회"""
+        return {
+            "maxsize": self.maxsize,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "utilization_percent": round(self.in_flight / self.maxsize * 100, 2) if self.maxsize else 0.0,
+            "total_requests": self.total_requests,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "avg_request_ms": round(self.total_duration / self.total_requests * 1000, 2) if self.total_requests else 0.0
+        }
+
+class InstrumentedAIOHttpConnection(AIOHttpConnection):
+    """요청 수/동시 요청 수를 집계하는 aiohttp 연결"""
+
+    def __init__(self, *args, pool_stats: Optional[PoolStats] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_stats = pool_stats
+
+    async def perform_request(self, *args, **kwargs):
+        stats = self.pool_stats
+        if stats is None:
+            return await super().perform_request(*args, **kwargs)
+
+        stats.in_flight += 1
+        stats.total_requests += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        started = time.monotonic()
+        try:
+            return await super().perform_request(*args, **kwargs)
+        except ConnectionTimeout:
+            stats.timeouts += 1
+            raise
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            stats.total_duration += time.monotonic() - started
+
+def create_async_client(
+    endpoint: str,
+    maxsize: int,
+    timeout: float,
+    pool_stats: Optional[PoolStats] = None,
+    max_retries: int = 3,
+    retry_on_timeout: bool = True
+) -> AsyncOpenSearch:
+    """연결 풀 크기와 기본 타임아웃을 지정한 AsyncOpenSearch 생성
+
+    요청 하나의 최대 소요 시간은 timeout x (max_retries + 1)
+    """
+    return AsyncOpenSearch(
+        hosts=[endpoint],
+        http_compress=True,
+        connection_class=InstrumentedAIOHttpConnection,
+        pool_stats=pool_stats,
+        maxsize=maxsize,
+        use_ssl=False,
+        verify_certs=False,
+        ssl_show_warn=False,
+        timeout=timeout,
+        max_retries=max_retries,
+        retry_on_timeout=retry_on_timeout
+    )
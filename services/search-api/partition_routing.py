@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+파티션 라우팅 모듈
+검색 질의를 관련 파티션 인덱스로만 보내기 위한 인덱스 이름 계산 기능 제공
+(인덱싱 서비스의 partitioning 모듈과 동일한 이름 규칙 사용)
+
+- 파티션 지정 시 해당 파티션 인덱스만 검색
+- 인덱싱 시각 기준 시간 파티션이면 indexed_after/indexed_before 범위에 걸치는 기간 파티션만 검색
+  (문서 메타데이터 시각 기준 파티션은 indexed_at 범위와 대응하지 않으므로 전체 읽기 별칭 사용)
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Any
+
+DEFAULT_PARTITION_KEY = "default"
+
+# 시간 파티션 단위별 키 형식 (인덱싱 서비스와 동일)
+_TIME_FORMATS = {
+    "month": "%Y-%m",
+    "day": "%Y-%m-%d",
+}
+
+# 파티션 키 계산과 indexed_at 기록 사이의 시차 (경계 직후 문서가 이전 기간 파티션에 있을 수 있음)
+_TIME_KEY_SLACK = timedelta(minutes=1)
+
+def sanitize_partition_key(key: Any) -> str:
+    """인덱스 이름에 사용할 수 있는 파티션 키로 변환"""
+    sanitized = re.sub(r"[^a-z0-9_-]+", "-", str(key).strip().lower()).strip("-_")
+    return sanitized[:64] or DEFAULT_PARTITION_KEY
+
+def partition_index_name(base: str, key: Any) -> str:
+    """파티션 키에 해당하는 인덱스 이름"""
+    return f"{base}-p-{sanitize_partition_key(key)}"
+
+def parse_timestamp(value: str) -> Optional[datetime]:
+    """ISO 8601 문자열을 UTC 기준 naive datetime으로 변환 (형식 오류 시 None)"""
+    try:
+        timestamp = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+def time_partition_keys(
+    indexed_after: Optional[str],
+    indexed_before: Optional[str],
+    granularity: str = "month",
+    max_partitions: int = 64,
+    now: Optional[datetime] = None
+) -> Optional[List[str]]:
+    """indexed_at 범위에 걸치는 기간 파티션 키 (범위를 특정할 수 없거나 max_partitions 초과 시 None)"""
+    start = parse_timestamp(indexed_after) if indexed_after else None
+    if start is None:
+        return None
+    end = parse_timestamp(indexed_before) if indexed_before else (now or datetime.utcnow())
+    if end is None or end <= start:
+        return None
+
+    key_format = _TIME_FORMATS.get(granularity, _TIME_FORMATS["month"])
+    keys = []
+    current = start - _TIME_KEY_SLACK
+    while current < end:
+        key = current.strftime(key_format)
+        if key not in keys:
+            if len(keys) >= max_partitions:
+                return None
+            keys.append(key)
+        # 다음 기간의 시작
+        if granularity == "day":
+            current = datetime(current.year, current.month, current.day) + timedelta(days=1)
+        else:
+            current = datetime(current.year + current.month // 12, current.month % 12 + 1, 1)
+    return keys
+
+def resolve_search_indices(
+    base: str,
+    partitions: Optional[List[str]],
+    indexed_after: Optional[str] = None,
+    indexed_before: Optional[str] = None,
+    time_granularity: Optional[str] = None,
+    max_time_partitions: int = 64
+) -> List[str]:
+    """검색 대상 인덱스 목록 (파티션 미지정 시 전체 읽기 별칭)
+
+    time_granularity: 인덱싱 시각 기준 시간 파티셔닝 단위 (지정 시 indexed_at 범위로 파티션 축소)
+    """
+    if not partitions and time_granularity:
+        partitions = time_partition_keys(indexed_after, indexed_before, time_granularity, max_time_partitions)
+    if not partitions:
+        return [base]
+
+    return sorted({partition_index_name(base, key) for key in partitions})
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+인기 검색어 모듈
+파드 단위 Space-Saving 스케치로 검색어 빈도를 고정 메모리에서 집계하고
+주기적으로 Redis 시간 버킷(sorted set)에 병합해 최근 1시간/1일 인기 검색어를 계산하는 기능 제공
+
+- SpaceSaving: 최대 capacity개 카운터 (빈도 상위 항목은 과대 추정 오차 error 이내로 보장)
+- PopularQueries: 스케치 병합(5분/1시간 버킷) 및 기간별 조회
+- 스케치는 이벤트 루프 스레드에서만 갱신/초기화하고 Redis 쓰기만 작업 스레드에서 실행
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Tuple
+
+from loguru import logger
+
+# 기간별 (버킷 길이 초, 버킷 수)
+WINDOWS = {
+    "hour": (300, 12),
+    "day": (3600, 24),
+}
+
+class SpaceSaving:
+    """Space-Saving 상위 빈도 스케치"""
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def update(self, item: str, count: int = 1):
+        """항목 빈도 증가 (카운터가 가득 차면 최소 카운터를 교체하고 그 값을 오차로 승계)"""
+        if item in self.counts:
+            self.counts[item] += count
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+            return
+        victim = min(self.counts, key=self.counts.get)
+        floor = self.counts.pop(victim)
+        del self.errors[victim]
+        self.counts[item] = floor + count
+        self.errors[item] = floor
+
+    def top(self, n: int) -> List[Tuple[str, int, int]]:
+        """빈도 상위 n개 (항목, 추정 빈도, 최대 과대 추정치)"""
+        ranked = sorted(self.counts.items(), key=lambda entry: entry[1], reverse=True)[:n]
+        return [(item, count, self.errors[item]) for item, count in ranked]
+
+    def drain(self) -> Dict[str, int]:
+        """누적 빈도를 반환하고 초기화"""
+        counts = self.counts
+        self.counts, self.errors = {}, {}
+        return counts
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+class PopularQueries:
+    """파드 스케치 + Redis 시간 버킷 기반 인기 검색어 집계"""
+
+    def __init__(
+        self,
+        redis_client,
+        capacity: int = 1000,
+        bucket_size: int = 500,
+        key_prefix: str = "popular:"
+    ):
+        self.redis_client = redis_client
+        self.sketch = SpaceSaving(capacity)
+        self.bucket_size = bucket_size
+        self.key_prefix = key_prefix
+        self.stats = {"recorded": 0, "merges": 0, "merged_queries": 0}
+
+    def record(self, query: str):
+        """검색어 한 건 기록 (프로세스 내 스케치만 갱신)"""
+        self.sketch.update(query)
+        self.stats["recorded"] += 1
+
+    def bucket_key(self, window: str, now: float, offset: int = 0) -> str:
+        """기간의 현재(또는 offset개 이전) 버킷 키"""
+        bucket_seconds, _ = WINDOWS[window]
+        return f"{self.key_prefix}{window}:{int(now // bucket_seconds) - offset}"
+
+    def write(self, counts: Dict[str, int], now: float):
+        """누적 빈도를 Redis 현재 버킷에 반영 (블로킹 호출, 작업 스레드에서 실행)"""
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for window, (bucket_seconds, buckets) in WINDOWS.items():
+            key = self.bucket_key(window, now)
+            for query, count in counts.items():
+                pipeline.zincrby(key, count, query)
+            # 버킷마다 상위 bucket_size개만 유지
+            pipeline.zremrangebyrank(key, 0, -(self.bucket_size + 1))
+            pipeline.expire(key, bucket_seconds * (buckets + 1))
+        pipeline.execute()
+
+    async def merge(self) -> int:
+        """스케치 누적분을 Redis 현재 버킷에 병합 (병합한 검색어 수, 실패 시 스케치에 되돌림)"""
+        if not len(self.sketch):
+            return 0
+        counts = self.sketch.drain()
+        try:
+            await asyncio.to_thread(self.write, counts, time.time())
+        except Exception as e:
+            logger.warning(f"인기 검색어 병합 실패: {e}")
+            for query, count in counts.items():
+                self.sketch.update(query, count)
+            return 0
+
+        self.stats["merges"] += 1
+        self.stats["merged_queries"] += len(counts)
+        return len(counts)
+
+    def top(self, window: str = "hour", limit: int = 10) -> List[Dict[str, Any]]:
+        """기간 내 인기 검색어 (Redis 버킷 합산, 아직 병합되지 않은 파드 스케치 제외)"""
+        if window not in WINDOWS:
+            raise ValueError(f"지원하지 않는 기간: {window} (지원: {', '.join(WINDOWS)})")
+        _, buckets = WINDOWS[window]
+        now = time.time()
+        keys = [self.bucket_key(window, now, offset) for offset in range(buckets)]
+        ranked = self.redis_client.zunion(keys, withscores=True)
+        ranked.sort(key=lambda entry: entry[1], reverse=True)
+        return [{"query": query, "count": int(score)} for query, score in ranked[:limit]]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """집계 통계"""
+        return dict(self.stats, tracked=len(self.sketch), capacity=self.sketch.capacity)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+재순위화(rerank) 모듈
+ANN 상위 후보를 질의-문서 쌍 점수로 다시 정렬하는 재순위화기와 요청 간 배치 처리 기능 제공
+
+- bm25: 후보 집합 내 BM25 재점수 (의존성 없음, CPU)
+- onnx: 로컬 ONNX 크로스 인코더 (onnxruntime / tokenizers 필요)
+- fake: 테스트용 결정적 점수 (지연 시간 지정 가능)
+"""
+
+import asyncio
+import math
+import re
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Any, Tuple
+
+from loguru import logger
+
+try:
+    import numpy as np
+    import onnxruntime
+    from tokenizers import Tokenizer
+except ImportError as e:
+    onnxruntime = None
+    logger.debug(f"선택적 의존성 누락 (onnx 재순위화 비활성): {e}")
+
+SUPPORTED_RERANKERS = ("bm25", "onnx", "fake")
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+def tokenize(text: str) -> List[str]:
+    """소문자 단어 토큰 분리"""
+    return _TOKEN.findall(text.lower())
+
+class Reranker:
+    """재순위화기 기본 클래스"""
+
+    name = "base"
+
+    def score_batch(self, requests: List[Tuple[str, List[str]]]) -> List[List[float]]:
+        """(질의, 후보 텍스트 목록) 묶음에 대한 점수 계산"""
+        raise NotImplementedError
+
+class BM25Reranker(Reranker):
+    """후보 집합을 코퍼스로 하는 BM25 재점수"""
+
+    name = "bm25"
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+    def score_batch(self, requests: List[Tuple[str, List[str]]]) -> List[List[float]]:
+        return [self._score(query, texts) for query, texts in requests]
+
+    def _score(self, query: str, texts: List[str]) -> List[float]:
+        documents = [Counter(tokenize(text)) for text in texts]
+        if not documents:
+            return []
+
+        lengths = [sum(document.values()) for document in documents]
+        average_length = sum(lengths) / len(lengths) or 1.0
+        terms = set(tokenize(query))
+        document_frequency = {
+            term: sum(1 for document in documents if term in document) for term in terms
+        }
+
+        scores = []
+        for document, length in zip(documents, lengths):
+            score = 0.0
+            for term in terms:
+                frequency = document.get(term, 0)
+                if not frequency:
+                    continue
+                idf = math.log(1 + (len(documents) - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+                norm = frequency + self.k1 * (1 - self.b + self.b * length / average_length)
+                score += idf * frequency * (self.k1 + 1) / norm
+            scores.append(score)
+        return scores
+
+class OnnxCrossEncoderReranker(Reranker):
+    """ONNX 크로스 인코더 (예: ms-marco-MiniLM 계열을 ONNX로 변환한 모델)"""
+
+    name = "onnx"
+
+    def __init__(self, model_path: str, tokenizer_path: str, max_length: int = 256):
+        if onnxruntime is None:
+            raise RuntimeError("onnx 재순위화에는 onnxruntime, tokenizers 패키지가 필요합니다")
+
+        self.session = onnxruntime.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+        self.tokenizer = Tokenizer.from_file(tokenizer_path)
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+
+    def score_batch(self, requests: List[Tuple[str, List[str]]]) -> List[List[float]]:
+        # 모든 요청의 질의-문서 쌍을 한 번의 추론으로 처리
+        pairs = [(query, text) for query, texts in requests for text in texts]
+        if not pairs:
+            return [[] for _ in requests]
+
+        encodings = self.tokenizer.encode_batch(pairs)
+        inputs = {
+            "input_ids": np.asarray([encoding.ids for encoding in encodings], dtype=np.int64),
+            "attention_mask": np.asarray([encoding.attention_mask for encoding in encodings], dtype=np.int64),
+            "token_type_ids": np.asarray([encoding.type_ids for encoding in encodings], dtype=np.int64),
+        }
+        logits = self.session.run(None, {name: value for name, value in inputs.items() if name in self.input_names})[0]
+        flat_scores = logits.reshape(len(pairs), -1)[:, -1].tolist()
+
+        scores, offset = [], 0
+        for _, texts in requests:
+            scores.append(flat_scores[offset:offset + len(texts)])
+            offset += len(texts)
+        return scores
+
+class FakeReranker(Reranker):
+    """테스트용 재순위화기 (질의 토큰과 겹치는 수, 지정한 지연 시간)"""
+
+    name = "fake"
+
+    def __init__(self, delay_seconds: float = 0.0):
+        self.delay_seconds = delay_seconds
+        self.calls = 0
+
+    def score_batch(self, requests: List[Tuple[str, List[str]]]) -> List[List[float]]:
+        self.calls += 1
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+        return [
+            [float(len(set(tokenize(query)) & set(tokenize(text)))) for text in texts]
+            for query, texts in requests
+        ]
+
+def create_reranker(name: str, model_path: Optional[str] = None, tokenizer_path: Optional[str] = None) -> Reranker:
+    """설정 이름으로 재순위화기 생성"""
+    name = (name or "bm25").lower()
+    if name == "bm25":
+        return BM25Reranker()
+    if name == "onnx":
+        if not model_path or not tokenizer_path:
+            raise ValueError("onnx 재순위화에는 모델/토크나이저 경로가 필요합니다")
+        return OnnxCrossEncoderReranker(model_path, tokenizer_path)
+    if name == "fake":
+        return FakeReranker()
+    raise ValueError(f"지원하지 않는 재순위화기: {name} (지원: {', '.join(SUPPORTED_RERANKERS)})")
+
+def _discard_result(future: asyncio.Future):
+    """예산 초과로 기다리지 않게 된 점수 계산의 결과 정리 (실패는 로그만 남김)"""
+    if not future.cancelled() and future.exception() is not None:
+        logger.debug(f"예산 초과 후 재순위화 실패: {future.exception()}")
+
+class RerankBatcher:
+    """동시 요청의 재순위화를 모아 한 번에 처리하는 배치 처리기
+
+    첫 요청 후 max_wait_seconds 동안 (또는 max_pairs개 쌍이 모일 때까지) 모은 뒤
+    스레드에서 한 번에 점수를 계산. 각 요청은 자신의 예산 안에서만 결과를 기다림
+    """
+
+    def __init__(self, reranker: Reranker, max_pairs: int = 256, max_wait_seconds: float = 0.005):
+        self.reranker = reranker
+        self.max_pairs = max_pairs
+        self.max_wait_seconds = max_wait_seconds
+        self.pending: List[Tuple[str, List[str], asyncio.Future]] = []
+        self.pending_pairs = 0
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.stats = {"batches": 0, "requests": 0, "timeouts": 0, "errors": 0}
+
+    async def score(self, query: str, texts: List[str]) -> List[float]:
+        """질의-후보 점수 (배치에 합류하여 계산)"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((query, texts, future))
+        self.pending_pairs += len(texts)
+        self.stats["requests"] += 1
+
+        if self.pending_pairs >= self.max_pairs:
+            self._flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.max_wait_seconds, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """대기 중인 요청을 하나의 배치로 실행"""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+
+        batch, self.pending, self.pending_pairs = self.pending, [], 0
+        if batch:
+            self.stats["batches"] += 1
+            asyncio.ensure_future(self._run(batch))
+
+    async def _run(self, batch: List[Tuple[str, List[str], asyncio.Future]]):
+        try:
+            scores = await asyncio.to_thread(
+                self.reranker.score_batch, [(query, texts) for query, texts, _ in batch]
+            )
+            for (_, _, future), request_scores in zip(batch, scores):
+                if not future.done():
+                    future.set_result(request_scores)
+        except Exception as e:
+            self.stats["errors"] += 1
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def rerank(
+        self,
+        query: str,
+        candidates: List[Dict[str, Any]],
+        budget_seconds: float
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """예산 내에서 재순위화 (초과/실패 시 ANN 순서 유지)
+
+        Returns:
+            (정렬된 후보, 재순위화 적용 여부 - 후보가 2개 미만이면 순서가 정해져 있으므로 적용된 것으로 취급)
+        """
+        if len(candidates) < 2:
+            return candidates, True
+
+        scoring = asyncio.ensure_future(self.score(query, [candidate.get("chunk_text", "") for candidate in candidates]))
+        try:
+            scores = await asyncio.wait_for(asyncio.shield(scoring), timeout=budget_seconds)
+        except asyncio.TimeoutError:
+            # 배치 계산은 계속 진행되므로 나중에 실패해도 예외가 회수되지 않은 채 남지 않도록 확인
+            scoring.add_done_callback(_discard_result)
+            self.stats["timeouts"] += 1
+            logger.warning(f"재순위화 예산 초과 ({budget_seconds * 1000:.0f}ms), ANN 순서 사용")
+            return candidates, False
+        except Exception as e:
+            logger.warning(f"재순위화 실패, ANN 순서 사용: {e}")
+            return candidates, False
+
+        # 동점이면 ANN 순서 유지 (sorted는 안정 정렬)
+        order = sorted(range(len(candidates)), key=lambda i: scores[i], reverse=True)
+        return [dict(candidates[i], rerank_score=round(float(scores[i]), 6)) for i in order], True
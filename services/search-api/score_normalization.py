@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+점수 정규화 모듈
+공간 유형/엔진별 OpenSearch k-NN _score를 코사인 유사도로 변환하는 기능 제공
+
+OpenSearch k-NN 점수 산식
+- l2: 1 / (1 + d²)
+- cosinesimil: nmslib/faiss/knn_score 스크립트 2 - (1 - cos), lucene (2 - (1 - cos)) / 2
+- innerproduct: ip >= 0 이면 ip + 1, 아니면 1 / (1 - ip)
+
+l2 / innerproduct 공간은 저장/질의 벡터가 모두 단위 벡터여야 코사인으로 변환됨 (d² = 2 - 2cos, ip = cos).
+인덱싱 서비스는 모든 인코딩에서 단위 벡터로 저장하고(_meta.normalized) 질의 벡터도 검색 전에 정규화함.
+byte 인코딩은 단위 벡터에 byte_scale을 곱해 저장하므로 그만큼 보정함.
+모든 변환은 단조 증가이므로 코사인 임계값을 원시 점수 임계값으로 바꿔 OpenSearch에 전달 가능
+"""
+
+from typing import Dict, Any
+
+def _vector_scale(encoding: Dict[str, Any]) -> float:
+    """인덱스에 저장된 벡터의 노름 (byte 인코딩은 byte_scale)"""
+    return float(encoding.get("byte_scale", 127.0)) if encoding.get("vector_encoding") == "byte" else 1.0
+
+def _clip(value: float) -> float:
+    return max(-1.0, min(1.0, value))
+
+def raw_score_to_cosine(score: float, encoding: Dict[str, Any]) -> float:
+    """k-NN 원시 점수를 코사인 유사도 [-1, 1]로 변환"""
+    space_type = encoding.get("space_type", "l2")
+    scale = _vector_scale(encoding)
+
+    if space_type == "cosinesimil":
+        cosine = 2 * score - 1 if encoding.get("knn_engine") == "lucene" else score - 1
+    elif space_type == "innerproduct":
+        inner_product = score - 1 if score >= 1 else 1 - 1 / max(score, 1e-12)
+        cosine = inner_product / (scale * scale)
+    else:
+        squared_distance = 1 / max(score, 1e-12) - 1
+        cosine = 1 - squared_distance / (2 * scale * scale)
+
+    return round(_clip(cosine), 6)
+
+def cosine_to_raw_score(cosine: float, encoding: Dict[str, Any]) -> float:
+    """코사인 유사도 임계값을 k-NN 원시 점수 임계값으로 변환 (raw_score_to_cosine의 역함수)"""
+    cosine = _clip(cosine)
+    space_type = encoding.get("space_type", "l2")
+    scale = _vector_scale(encoding)
+
+    if space_type == "cosinesimil":
+        return (1 + cosine) / 2 if encoding.get("knn_engine") == "lucene" else 1 + cosine
+
+    if space_type == "innerproduct":
+        inner_product = cosine * scale * scale
+        return inner_product + 1 if inner_product >= 0 else 1 / (1 - inner_product)
+
+    squared_distance = 2 * scale * scale * (1 - cosine)
+    return 1 / (1 + squared_distance)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+검색 필터 모듈
+doc_id / 메타데이터 / indexed_at 조건을 k-NN 질의에 포함할 filter 절로 변환하는 기능 제공
+
+- faiss / lucene 엔진: knn 쿼리의 filter 파라미터 (탐색 중 필터링, 과다 조회 없이 정확한 top-k)
+- nmslib 엔진 (이전 버전 인덱스): 필터된 문서 집합에 대한 정확 검색 (knn_score 스크립트)
+"""
+
+from typing import Dict, List, Optional, Any
+
+# knn 쿼리의 filter 파라미터를 지원하는 엔진
+EFFICIENT_FILTER_ENGINES = ("faiss", "lucene")
+
+def build_filter_clauses(
+    doc_ids: Optional[List[str]] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    indexed_after: Optional[str] = None,
+    indexed_before: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """검색 조건을 bool filter 절 목록으로 변환 (조건이 없으면 빈 목록)"""
+    clauses = []
+
+    if doc_ids:
+        clauses.append({"terms": {"doc_id": doc_ids}})
+
+    for field, value in (metadata or {}).items():
+        values = value if isinstance(value, list) else [value]
+        # 동적 매핑된 문자열 필드는 정확 일치를 위해 keyword 서브필드 사용 (인덱싱 서비스 purge와 동일)
+        field_name = f"metadata.{field}.keyword" if all(isinstance(v, str) for v in values) else f"metadata.{field}"
+        clauses.append({"terms": {field_name: values}})
+
+    date_range = {}
+    if indexed_after:
+        date_range["gte"] = indexed_after
+    if indexed_before:
+        date_range["lt"] = indexed_before
+    if date_range:
+        clauses.append({"range": {"indexed_at": date_range}})
+
+    return clauses
+
+def build_filtered_knn_query(
+    vector: List[Any],
+    k: int,
+    filter_clauses: List[Dict[str, Any]],
+    knn_engine: str,
+    space_type: str
+) -> Dict[str, Any]:
+    """필터 조건을 포함한 k-NN 질의 (엔진별 사전 필터링 방식 선택)"""
+    if not filter_clauses:
+        return {"knn": {"embedding": {"vector": vector, "k": k}}}
+
+    filter_query = {"bool": {"filter": filter_clauses}}
+
+    if knn_engine in EFFICIENT_FILTER_ENGINES:
+        return {"knn": {"embedding": {"vector": vector, "k": k, "filter": filter_query}}}
+
+    # nmslib는 filter 파라미터를 지원하지 않으므로 필터된 문서에 대해서만 정확 거리 계산
+    return {
+        "script_score": {
+            "query": filter_query,
+            "script": {
+                "lang": "knn",
+                "source": "knn_score",
+                "params": {
+                    "field": "embedding",
+                    "query_value": vector,
+                    "space_type": space_type
+                }
+            }
+        }
+    }
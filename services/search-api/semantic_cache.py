@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+시맨틱 질의 캐시 모듈
+최근 질의 임베딩에 대한 인메모리 brute force 유사도 검색으로
+표현이 다른 같은 의미의 질의에 캐시된 검색 결과를 재사용하는 기능 제공
+
+- 워커 프로세스 단위 캐시 (최대 max_entries개, 가장 오래된 항목부터 덮어씀)
+- 검색 조건(scope)이 같은 항목끼리만 비교
+- 인덱스 버전이 바뀌면 전체 무효화
+"""
+
+import time
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
+
+class SemanticCache:
+    """질의 임베딩 유사도 기반 결과 캐시"""
+
+    def __init__(self, max_entries: int = 2048, threshold: float = 0.95, ttl_seconds: float = 1800):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.vectors: Optional[np.ndarray] = None
+        self.entries: List[Optional[Dict[str, Any]]] = [None] * max_entries
+        self.next_slot = 0
+        self.version: Optional[str] = None
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0}
+
+    def _check_version(self, version: str):
+        """인덱스 버전이 바뀌었으면 전체 무효화"""
+        if version != self.version:
+            if self.version is not None:
+                self.stats["invalidations"] += 1
+            self.invalidate()
+            self.version = version
+
+    def invalidate(self):
+        """모든 항목 제거"""
+        self.entries = [None] * self.max_entries
+        if self.vectors is not None:
+            self.vectors[:] = 0
+        self.next_slot = 0
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, embedding: List[float], scope: str, version: str) -> Optional[Tuple[Any, float]]:
+        """유사한 질의의 캐시 결과 조회
+
+        Returns:
+            (캐시된 값, 코사인 유사도) 또는 None
+        """
+        self._check_version(version)
+        if self.vectors is None or len(embedding) != self.vectors.shape[1]:
+            self.stats["misses"] += 1
+            return None
+
+        similarities = self.vectors @ self._normalize(embedding)
+        now = time.time()
+        for slot in np.argsort(similarities)[::-1]:
+            if similarities[slot] < self.threshold:
+                break
+            entry = self.entries[slot]
+            if entry and entry["scope"] == scope and now - entry["created_at"] < self.ttl_seconds:
+                self.stats["hits"] += 1
+                return entry["value"], float(similarities[slot])
+
+        self.stats["misses"] += 1
+        return None
+
+    def store(self, embedding: List[float], scope: str, version: str, value: Any):
+        """질의 임베딩과 결과 저장"""
+        self._check_version(version)
+        if self.vectors is None or len(embedding) != self.vectors.shape[1]:
+            self.vectors = np.zeros((self.max_entries, len(embedding)), dtype=np.float32)
+            self.entries = [None] * self.max_entries
+            self.next_slot = 0
+
+        slot = self.next_slot
+        self.vectors[slot] = self._normalize(embedding)
+        self.entries[slot] = {"scope": scope, "value": value, "created_at": time.time()}
+        self.next_slot = (slot + 1) % self.max_entries
+        self.stats["stores"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        return dict(
+            self.stats,
+            entries=sum(1 for entry in self.entries if entry),
+            max_entries=self.max_entries,
+            threshold=self.threshold,
+            version=self.version
+        )
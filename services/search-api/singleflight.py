@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+요청 병합(single-flight) 모듈
+같은 키로 동시에 들어온 요청 중 하나(리더)만 실제로 실행하고 나머지(팔로워)는 그 결과를 공유하는 기능 제공
+
+- SingleFlight: 프로세스 내 키별 실행 중 태스크 맵
+- RedisLease: 여러 레플리카 간 짧은 Redis 잠금 (잠금을 얻지 못한 레플리카는 리더가 캐시에 기록하기를 대기)
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+
+from loguru import logger
+
+# 자신이 획득한 잠금만 해제 (compare-and-delete)
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+class SingleFlight:
+    """프로세스 내 동일 키 요청 병합"""
+
+    def __init__(self):
+        self.in_flight: Dict[str, asyncio.Future] = {}
+        self.stats = {"leaders": 0, "followers": 0, "retries": 0}
+
+    async def do(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[Any]],
+        reusable: Optional[Callable[[Any], bool]] = None,
+        retry_on: Tuple[Type[BaseException], ...] = ()
+    ) -> Tuple[Any, bool]:
+        """키별로 func를 한 번만 실행 (func는 리더 컨텍스트의 복사본, 즉 리더의 요청 기한으로 실행)
+
+        리더의 결과가 reusable을 만족하지 않거나 retry_on 예외로 끝나면 (리더의 기한 초과 등)
+        팔로워는 결과를 공유하지 않고 자신의 컨텍스트로 한 번 더 병합 실행
+
+        Returns:
+            (결과, 다른 요청의 결과를 공유했는지 여부)
+        """
+        task = self.in_flight.get(key)
+        if task is None:
+            return await self._lead(key, func), False
+
+        self.stats["followers"] += 1
+        try:
+            result = await asyncio.shield(task)
+            if reusable is None or reusable(result):
+                return result, True
+        except retry_on:
+            pass
+
+        self.stats["retries"] += 1
+        task = self.in_flight.get(key)
+        if task is not None:
+            return await asyncio.shield(task), True
+        return await self._lead(key, func), False
+
+    async def _lead(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """별도 태스크로 실행해 리더 요청이 취소되어도 팔로워는 결과를 받음"""
+        task = asyncio.ensure_future(func())
+        self.in_flight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        self.stats["leaders"] += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future):
+        if self.in_flight.get(key) is task:
+            del self.in_flight[key]
+        # 기다리는 요청이 모두 취소된 경우에도 예외 미조회 경고가 남지 않도록 조회
+        if not task.cancelled():
+            task.exception()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """병합 통계"""
+        return dict(self.stats, in_flight=len(self.in_flight))
+
+class RedisLease:
+    """레플리카 간 리더 선출용 짧은 Redis 잠금"""
+
+    def __init__(self, redis_client, ttl_ms: int = 5000, prefix: str = "singleflight:"):
+        self.redis_client = redis_client
+        self.ttl_ms = ttl_ms
+        self.prefix = prefix
+
+    def acquire(self, key: str) -> Optional[str]:
+        """잠금 획득 (성공 시 해제용 토큰, 이미 다른 레플리카가 보유 중이면 None)"""
+        token = uuid.uuid4().hex
+        try:
+            if self.redis_client.set(self.prefix + key, token, nx=True, px=self.ttl_ms):
+                return token
+            return None
+        except Exception as e:
+            # Redis 장애 시 병합 없이 직접 실행
+            logger.warning(f"병합 잠금 획득 실패: {e}")
+            return token
+
+    def release(self, key: str, token: str):
+        """자신이 획득한 잠금 해제"""
+        try:
+            self.redis_client.eval(_RELEASE_SCRIPT, 1, self.prefix + key, token)
+        except Exception as e:
+            logger.warning(f"병합 잠금 해제 실패: {e}")
+
+    def is_held(self, key: str) -> bool:
+        """다른 레플리카가 아직 잠금을 보유 중인지 확인"""
+        try:
+            return bool(self.redis_client.exists(self.prefix + key))
+        except Exception:
+            return False
+
+    async def wait_for(
+        self,
+        key: str,
+        fetch: Callable[[], Optional[Any]],
+        timeout_seconds: float,
+        poll_seconds: float = 0.05
+    ) -> Optional[Any]:
+        """리더 레플리카의 결과를 대기 (fetch가 값을 반환하거나 잠금이 풀리거나 시간 초과까지)
+
+        fetch와 잠금 확인은 동기 Redis 호출이므로 스레드에서 실행
+        """
+        deadline = time.monotonic() + timeout_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(poll_seconds)
+            value = await asyncio.to_thread(fetch)
+            if value is not None:
+                return value
+            if not await asyncio.to_thread(self.is_held, key):
+                # 리더가 결과를 남기지 못하고 종료됨 (빈 결과, 오류)
+                return None
+        return None
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+스트리밍 응답 모듈
+검색 결과를 단계별 이벤트(NDJSON / SSE)로 직렬화하고 본문 축약/하이라이트 스니펫을 만드는 기능 제공
+"""
+
+import html
+import json
+import re
+from typing import Dict, List, Optional, Any
+
+SUPPORTED_STREAM_FORMATS = ("ndjson", "sse")
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+def format_event(event: str, data: Dict[str, Any], stream_format: str) -> str:
+    """이벤트 한 건 직렬화"""
+    if stream_format == "sse":
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    return json.dumps(dict(data, event=event), ensure_ascii=False) + "\n"
+
+def truncate_text(text: str, max_chars: Optional[int]) -> str:
+    """본문을 max_chars 이내로 축약 (단어 경계 우선)"""
+    if not max_chars or len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    boundary = cut.rfind(" ")
+    if boundary > max_chars * 0.6:
+        cut = cut[:boundary]
+    return cut.rstrip() + "…"
+
+def highlight_snippet(text: str, query: str, window: int = 160, tag: str = "em") -> Optional[str]:
+    """질의 단어가 처음 등장하는 위치 주변 스니펫 (질의 단어는 태그로 감쌈, 없으면 None)
+
+    본문은 HTML 이스케이프되므로 삽입된 태그 외의 마크업은 그대로 렌더링되지 않음
+    """
+    terms = {term for term in _TERM.findall(query.lower()) if len(term) > 1}
+    if not terms or not text:
+        return None
+
+    pattern = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    match = pattern.search(text)
+    if not match:
+        return None
+
+    start = max(0, match.start() - window // 3)
+    end = min(len(text), start + window)
+    # 일치 구간과 나머지를 각각 이스케이프 (&amp; 같은 엔티티 내부에 태그가 들어가지 않도록)
+    snippet, position = [], start
+    for term in pattern.finditer(text, start, end):
+        snippet.append(html.escape(text[position:term.start()]))
+        snippet.append(f"<{tag}>{html.escape(term.group(0))}</{tag}>")
+        position = term.end()
+    snippet.append(html.escape(text[position:end]))
+    snippet = "".join(snippet)
+    return ("…" if start > 0 else "") + snippet + ("…" if end < len(text) else "")
+
+def stream_results(
+    results: List[Dict[str, Any]],
+    query: str,
+    include_metadata: bool,
+    max_chars: Optional[int],
+    highlight: bool
+) -> List[Dict[str, Any]]:
+    """스트리밍 이벤트용 결과 변환"""
+    items = []
+    for result in results:
+        text = result.get("chunk_text", "")
+        item = {
+            "doc_id": result.get("doc_id", ""),
+            "chunk_index": result.get("chunk_index", 0),
+            "chunk_text": truncate_text(text, max_chars),
+            "score": result.get("score", 0.0),
+            "metadata": result.get("metadata", {}) if include_metadata else {}
+        }
+        if result.get("rerank_score") is not None:
+            item["rerank_score"] = result["rerank_score"]
+        if highlight:
+            item["highlight"] = highlight_snippet(text, query)
+        items.append(item)
+    return items
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+검색어 자동완성 모듈
+검색어를 접두사별 Redis sorted set에 빈도 점수로 기록하고 접두사 한 번의 조회로 제안 목록을 반환하는 기능 제공
+
+- 접두사마다 상위 max_per_prefix개만 유지 (ZREMRANGEBYRANK), 사용되지 않는 접두사 키는 TTL로 만료
+- 시간 감쇠: 접두사 키를 갱신할 때 마지막 감쇠 이후 경과 시간만큼 기존 점수 전체에 반감 계수를 곱함
+  (ZUNIONSTORE key 1 key WEIGHTS factor, 키당 최대 max_per_prefix개라 비용이 작음)
+- 요청 경로에서는 프로세스 내 버퍼에만 기록하고 주기적으로 반영 (MGET 한 번 + 파이프라인 한 번)
+- 버퍼는 이벤트 루프 스레드에서만 교체/복구하고 Redis 입출력만 작업 스레드에서 실행
+"""
+
+import asyncio
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+# 감쇠 계수가 이 값보다 크면 (경과 시간이 짧으면) 다음 반영 때까지 감쇠를 미룸
+MIN_DECAY_FACTOR = 0.99
+
+_WHITESPACE = re.compile(r"\s+")
+
+class SuggestionIndex:
+    """접두사별 sorted set 기반 검색어 자동완성 인덱스"""
+
+    def __init__(
+        self,
+        redis_client,
+        max_per_prefix: int = 50,
+        min_prefix_length: int = 2,
+        max_prefix_length: int = 20,
+        max_query_length: int = 100,
+        half_life_seconds: float = 7 * 86400,
+        ttl_seconds: int = 30 * 86400,
+        max_pending: int = 10000,
+        key_prefix: str = "suggest:",
+        decay_key_prefix: str = "suggest_decay:"
+    ):
+        self.redis_client = redis_client
+        self.max_per_prefix = max_per_prefix
+        self.min_prefix_length = min_prefix_length
+        self.max_prefix_length = max_prefix_length
+        self.max_query_length = max_query_length
+        self.half_life_seconds = half_life_seconds
+        self.ttl_seconds = ttl_seconds
+        self.max_pending = max_pending
+        self.key_prefix = key_prefix
+        self.decay_key_prefix = decay_key_prefix
+        self.pending: Counter = Counter()
+        self.stats = {"recorded": 0, "dropped": 0, "flushes": 0, "flushed_queries": 0, "lookups": 0}
+
+    def normalize(self, text: str) -> Optional[str]:
+        """소문자화 및 공백 정리 (기록 대상이 아니면 None)"""
+        normalized = _WHITESPACE.sub(" ", text).strip().lower()
+        if len(normalized) < self.min_prefix_length or len(normalized) > self.max_query_length:
+            return None
+        return normalized
+
+    def record(self, query: str):
+        """검색어 기록 (버퍼에만 추가, flush 시 Redis 반영)"""
+        normalized = self.normalize(query)
+        if normalized is None:
+            return
+        if normalized not in self.pending and len(self.pending) >= self.max_pending:
+            self.stats["dropped"] += 1
+            return
+        self.pending[normalized] += 1
+        self.stats["recorded"] += 1
+
+    def decay_factor(self, decayed_at: Optional[str], now: float) -> float:
+        """마지막 감쇠 시각 이후 경과 시간에 대한 점수 감쇠 계수"""
+        if not decayed_at:
+            return 1.0
+        elapsed = max(0.0, now - float(decayed_at))
+        return 0.5 ** (elapsed / self.half_life_seconds)
+
+    def prefixes(self, query: str) -> List[str]:
+        """기록할 접두사 목록"""
+        upper = min(len(query), self.max_prefix_length)
+        return [query[:length] for length in range(self.min_prefix_length, upper + 1)]
+
+    def write(self, updates: Dict[str, Counter], now: float):
+        """접두사별 증가분을 Redis에 반영 (블로킹 호출, 작업 스레드에서 실행)"""
+        prefixes = list(updates)
+        decayed_at = self.redis_client.mget([self.decay_key_prefix + prefix for prefix in prefixes])
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for prefix, last_decay in zip(prefixes, decayed_at):
+            key = self.key_prefix + prefix
+            decay_key = self.decay_key_prefix + prefix
+            factor = self.decay_factor(last_decay, now)
+            if factor < MIN_DECAY_FACTOR:
+                pipeline.zunionstore(key, {key: factor})
+            if last_decay is None or factor < MIN_DECAY_FACTOR:
+                pipeline.set(decay_key, now, ex=self.ttl_seconds)
+            else:
+                pipeline.expire(decay_key, self.ttl_seconds)
+            for query, count in updates[prefix].items():
+                pipeline.zincrby(key, count, query)
+            # 상위 max_per_prefix개만 유지
+            pipeline.zremrangebyrank(key, 0, -(self.max_per_prefix + 1))
+            pipeline.expire(key, self.ttl_seconds)
+        pipeline.execute()
+
+    async def flush(self) -> int:
+        """버퍼의 검색어를 Redis에 반영 (반영한 검색어 수, 실패 시 버퍼에 되돌림)"""
+        if not self.pending:
+            return 0
+        pending, self.pending = self.pending, Counter()
+
+        updates: Dict[str, Counter] = {}
+        for query, count in pending.items():
+            for prefix in self.prefixes(query):
+                updates.setdefault(prefix, Counter())[query] += count
+
+        try:
+            await asyncio.to_thread(self.write, updates, time.time())
+        except Exception as e:
+            logger.warning(f"검색어 자동완성 인덱스 반영 실패: {e}")
+            # 반영 중에 새로 기록된 검색어는 유지한 채 합산
+            self.pending.update(pending)
+            return 0
+
+        self.stats["flushes"] += 1
+        self.stats["flushed_queries"] += len(pending)
+        return len(pending)
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """접두사로 시작하는 검색어 (점수 높은 순)"""
+        normalized = _WHITESPACE.sub(" ", prefix).lstrip().lower()
+        if len(normalized) < self.min_prefix_length:
+            return []
+        self.stats["lookups"] += 1
+
+        key = self.key_prefix + normalized[:self.max_prefix_length]
+        if len(normalized) <= self.max_prefix_length:
+            return self.redis_client.zrevrange(key, 0, limit - 1)
+        # 최대 접두사 길이보다 긴 입력은 저장된 후보 중에서 다시 거름
+        candidates = self.redis_client.zrevrange(key, 0, self.max_per_prefix - 1)
+        return [query for query in candidates if query.startswith(normalized)][:limit]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """자동완성 통계"""
+        return dict(self.stats, pending=len(self.pending))
@@ -0,0 +1,6 @@
+"""search-api 단위 테스트 공통 설정 (서비스 디렉터리의 모듈을 import할 수 있도록 경로 추가)"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
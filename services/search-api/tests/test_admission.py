@@ -0,0 +1,132 @@
+"""수락 제어 테스트 (적응형 한도, 우선순위 대기열)"""
+
+import asyncio
+
+import pytest
+
+from admission import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    AdaptiveLimit,
+    AdmissionPool,
+    AdmissionRejected,
+    parse_priority
+)
+
+def pool(limit=1, max_queue=2, max_wait_seconds=1.0):
+    return AdmissionPool(
+        "test",
+        AdaptiveLimit(initial_limit=limit, min_limit=limit, max_limit=limit),
+        max_queue=max_queue,
+        max_wait_seconds=max_wait_seconds
+    )
+
+def test_parse_priority():
+    assert parse_priority("bulk") == PRIORITY_BULK
+    assert parse_priority(" Background ") == PRIORITY_BACKGROUND
+    assert parse_priority(None) == PRIORITY_INTERACTIVE
+    assert parse_priority("unknown", PRIORITY_BULK) == PRIORITY_BULK
+
+def test_admits_up_to_limit_then_times_out():
+    admission = pool(limit=2, max_wait_seconds=0.02)
+
+    async def run():
+        await admission.acquire()
+        await admission.acquire()
+        with pytest.raises(AdmissionRejected) as error:
+            await admission.acquire()
+        return error.value
+
+    error = asyncio.run(run())
+    assert error.reason == "대기 시간 초과"
+    assert error.retry_after >= 1
+    assert admission.snapshot()["in_flight"] == 2
+    assert admission.snapshot()["queued_now"] == 0
+
+def test_release_wakes_waiters_in_priority_order():
+    admission = pool(limit=1, max_queue=3)
+    order = []
+
+    async def waiter(priority, name):
+        await admission.acquire(priority)
+        order.append(name)
+        admission.release(0.01)
+
+    async def run():
+        await admission.acquire()
+        tasks = [
+            asyncio.create_task(waiter(PRIORITY_BACKGROUND, "background")),
+            asyncio.create_task(waiter(PRIORITY_BULK, "bulk")),
+            asyncio.create_task(waiter(PRIORITY_INTERACTIVE, "interactive")),
+        ]
+        await asyncio.sleep(0.01)
+        admission.release(0.01)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+    assert order == ["interactive", "bulk", "background"]
+    assert admission.in_flight == 0
+
+def test_full_queue_evicts_lower_priority():
+    admission = pool(limit=1, max_queue=1)
+    results = {}
+
+    async def waiter(priority, name):
+        try:
+            await admission.acquire(priority)
+            results[name] = "admitted"
+        except AdmissionRejected as e:
+            results[name] = e.reason
+
+    async def run():
+        await admission.acquire()
+        bulk = asyncio.create_task(waiter(PRIORITY_BULK, "bulk"))
+        await asyncio.sleep(0.01)
+        interactive = asyncio.create_task(waiter(PRIORITY_INTERACTIVE, "interactive"))
+        await asyncio.sleep(0.01)
+        # 같은 우선순위끼리는 밀어내지 않고 바로 거절
+        await waiter(PRIORITY_INTERACTIVE, "late")
+        admission.release(0.01)
+        await asyncio.gather(bulk, interactive)
+
+    asyncio.run(run())
+    assert results == {"bulk": "우선순위가 높은 요청에 밀림", "late": "대기열 초과", "interactive": "admitted"}
+    assert admission.stats["evicted"] == 1
+
+def test_cancelled_waiter_leaves_the_queue():
+    admission = pool(limit=1)
+
+    async def run():
+        await admission.acquire()
+        waiter = asyncio.create_task(admission.acquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        admission.release(0.01)
+
+    asyncio.run(run())
+    assert admission.snapshot()["queued_now"] == 0
+    assert admission.in_flight == 0
+
+def test_limit_shrinks_when_latency_grows():
+    limit = AdaptiveLimit(initial_limit=20, max_limit=100)
+    for _ in range(50):
+        limit.update(0.05, in_flight=20)
+    grown = limit.current()
+    for _ in range(50):
+        limit.update(0.5, in_flight=20)
+    assert grown > 20
+    assert limit.current() < grown
+
+def test_limit_does_not_grow_when_underused():
+    limit = AdaptiveLimit(initial_limit=20, max_limit=100)
+    for _ in range(50):
+        limit.update(0.05, in_flight=2)
+    assert limit.current() == 20
+
+def test_drop_backs_off():
+    limit = AdaptiveLimit(initial_limit=20, backoff=0.5)
+    limit.update(0.0, in_flight=20, dropped=True)
+    assert limit.current() == 10
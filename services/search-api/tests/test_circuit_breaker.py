@@ -0,0 +1,114 @@
+"""서킷 브레이커 테스트"""
+
+import asyncio
+
+import pytest
+
+import circuit_breaker
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+class Clock:
+    """time.monotonic 대체 (수동으로 진행)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    return clock
+
+def call(breaker, error=None):
+    """보호 구간 한 번 실행 (error가 있으면 구간 안에서 발생)"""
+    try:
+        with breaker.protect():
+            if error:
+                raise error
+    except (ValueError, KeyError):
+        pass
+
+def test_opens_when_failure_rate_exceeds_threshold(clock):
+    breaker = CircuitBreaker("test", failure_rate_threshold=0.5, minimum_calls=4)
+    call(breaker)
+    call(breaker, ValueError())
+    call(breaker)
+    assert breaker.state == CLOSED
+    call(breaker, ValueError())
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError) as error:
+        call(breaker)
+    assert error.value.retry_after == pytest.approx(breaker.open_seconds)
+    assert breaker.stats["rejected"] == 1
+
+def test_needs_minimum_calls(clock):
+    breaker = CircuitBreaker("test", minimum_calls=10)
+    for _ in range(9):
+        call(breaker, ValueError())
+    assert breaker.state == CLOSED
+
+def test_old_failures_leave_the_window(clock):
+    breaker = CircuitBreaker("test", minimum_calls=4, window_seconds=10)
+    for _ in range(3):
+        call(breaker, ValueError())
+    clock.now += 11
+    call(breaker, ValueError())
+    assert breaker.state == CLOSED
+    assert breaker.window_counts() == (1, 1)
+
+def test_half_open_probes_close_the_circuit(clock):
+    breaker = CircuitBreaker("test", minimum_calls=2, open_seconds=5, half_open_max_calls=2)
+    call(breaker, ValueError())
+    call(breaker, ValueError())
+    assert breaker.is_open()
+
+    clock.now += 5
+    assert not breaker.is_open()
+    call(breaker)
+    assert breaker.state == HALF_OPEN
+    call(breaker)
+    assert breaker.state == CLOSED
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker("test", minimum_calls=2, open_seconds=5)
+    call(breaker, ValueError())
+    call(breaker, ValueError())
+    clock.now += 5
+    call(breaker, ValueError())
+    assert breaker.state == OPEN
+    assert breaker.stats["opened"] == 2
+
+def test_half_open_limits_concurrent_probes(clock):
+    breaker = CircuitBreaker("test", minimum_calls=1, open_seconds=5, half_open_max_calls=1)
+    call(breaker, ValueError())
+    clock.now += 5
+    with breaker.protect():
+        with pytest.raises(CircuitOpenError):
+            call(breaker)
+
+def test_ignored_errors_count_as_success(clock):
+    breaker = CircuitBreaker("test", minimum_calls=2, is_failure=lambda error: not isinstance(error, KeyError))
+    for _ in range(5):
+        call(breaker, KeyError())
+    assert breaker.state == CLOSED
+    assert breaker.window_counts() == (5, 0)
+
+def test_slow_calls_count_as_failures(clock):
+    breaker = CircuitBreaker("test", minimum_calls=2, slow_call_seconds=1.0)
+    for _ in range(2):
+        with breaker.protect():
+            clock.now += 2
+    assert breaker.state == OPEN
+    assert breaker.stats["slow_calls"] == 2
+
+def test_cancellation_is_not_a_failure(clock):
+    breaker = CircuitBreaker("test", minimum_calls=1)
+    with pytest.raises(asyncio.CancelledError):
+        with breaker.protect():
+            raise asyncio.CancelledError()
+    assert breaker.state == CLOSED
+    assert breaker.window_counts() == (0, 0)
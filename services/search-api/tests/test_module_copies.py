@@ -0,0 +1,29 @@
+"""서비스 간 공용 모듈 사본 동일성 테스트
+
+각 서비스는 자체 디렉터리를 Docker 빌드 컨텍스트로 사용하므로 공용 모듈을 서비스마다 복사해 둠
+(한 사본만 수정되어 서비스 간 동작이 달라지지 않도록 모든 사본이 같은지 확인)
+"""
+
+import os
+
+import pytest
+
+SERVICES_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SHARED_MODULES = {
+    "tracing.py": ("search-api", "embedding-generator", "indexing-service", "text-extraction"),
+    "pipeline_metrics.py": ("text-extraction", "embedding-generator", "indexing-service"),
+    "health_monitor.py": ("search-api", "embedding-generator"),
+    "admission.py": ("search-api", "embedding-generator"),
+}
+
+@pytest.mark.parametrize("module", sorted(SHARED_MODULES))
+def test_module_copies_are_identical(module):
+    contents = {}
+    for service in SHARED_MODULES[module]:
+        with open(os.path.join(SERVICES_DIR, service, module), "rb") as copy:
+            contents[service] = copy.read()
+
+    reference = SHARED_MODULES[module][0]
+    differing = [service for service, content in contents.items() if content != contents[reference]]
+    assert not differing, f"{module} 사본이 {reference}와 다름: {', '.join(differing)}"
@@ -0,0 +1,43 @@
+"""파티션 라우팅 테스트 (파티션 지정, indexed_at 범위 기반 시간 파티션 축소)"""
+
+from datetime import datetime
+
+from partition_routing import resolve_search_indices, time_partition_keys
+
+def test_without_partitions_searches_read_alias():
+    assert resolve_search_indices("rag", None) == ["rag"]
+
+def test_explicit_partitions_are_sanitized():
+    assert resolve_search_indices("rag", ["HR", "hr", "Legal Team"]) == ["rag-p-hr", "rag-p-legal-team"]
+
+def test_date_range_narrows_month_partitions():
+    indices = resolve_search_indices(
+        "rag", None, "2024-03-15T00:00:00Z", "2024-05-02T00:00:00Z", time_granularity="month"
+    )
+    assert indices == ["rag-p-2024-03", "rag-p-2024-04", "rag-p-2024-05"]
+
+def test_range_starting_on_a_boundary_includes_previous_period():
+    # 경계 직전에 파티션 키가 계산되고 경계 직후에 indexed_at이 기록된 문서
+    assert time_partition_keys("2024-06-01T00:00:00", "2024-06-10T00:00:00", "day") == [
+        "2024-05-31", "2024-06-01", "2024-06-02", "2024-06-03", "2024-06-04",
+        "2024-06-05", "2024-06-06", "2024-06-07", "2024-06-08", "2024-06-09"
+    ]
+
+def test_open_ended_range_runs_until_now():
+    keys = time_partition_keys("2024-11-20T00:00:00", None, "month", now=datetime(2025, 1, 5))
+    assert keys == ["2024-11", "2024-12", "2025-01"]
+
+def test_unbounded_or_wide_ranges_use_read_alias():
+    assert resolve_search_indices("rag", None, None, "2024-05-01", time_granularity="month") == ["rag"]
+    assert resolve_search_indices("rag", None, "not a date", None, time_granularity="month") == ["rag"]
+    assert resolve_search_indices(
+        "rag", None, "2020-01-01", "2024-01-01", time_granularity="month", max_time_partitions=12
+    ) == ["rag"]
+
+def test_time_routing_disabled_ignores_date_range():
+    assert resolve_search_indices("rag", None, "2024-03-15", "2024-04-15") == ["rag"]
+
+def test_explicit_partitions_take_precedence_over_date_range():
+    assert resolve_search_indices(
+        "rag", ["2024-01"], "2024-03-15", "2024-04-15", time_granularity="month"
+    ) == ["rag-p-2024-01"]
@@ -0,0 +1,31 @@
+"""질의 벡터 인코딩 테스트 (인덱스 _meta.normalized / vector_encoding에 따른 변환)"""
+
+import asyncio
+
+import pytest
+
+import app
+
+@pytest.fixture
+def index_meta(monkeypatch):
+    encoding = {"vector_encoding": "float32", "normalized": True, "byte_scale": 127.0}
+
+    async def get_index_vector_encoding():
+        return encoding
+
+    monkeypatch.setattr(app, "get_index_vector_encoding", get_index_vector_encoding)
+    return encoding
+
+def encode(vector):
+    return asyncio.run(app.encode_query_vector(vector))
+
+def test_normalized_float_index_gets_unit_query(index_meta):
+    assert encode([3.0, 4.0]) == pytest.approx([0.6, 0.8])
+
+def test_unnormalized_float_index_keeps_raw_query(index_meta):
+    index_meta["normalized"] = False
+    assert encode([3.0, 4.0]) == [3.0, 4.0]
+
+def test_byte_index_always_normalizes_before_quantizing(index_meta):
+    index_meta.update(vector_encoding="byte", normalized=False)
+    assert encode([3.0, 4.0]) == [76, 102]
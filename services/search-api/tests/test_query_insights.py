@@ -0,0 +1,59 @@
+"""자동완성 / 인기 검색어 엔드포인트 테스트 (Redis 조회는 서킷 브레이커를 거쳐 스레드에서 실행)"""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+import app
+from circuit_breaker import OPEN, CircuitBreaker
+
+class RecordingIndex:
+    """호출 스레드를 기록하는 자동완성 인덱스 / 인기 검색어 집계"""
+
+    def __init__(self):
+        self.threads = []
+
+    def suggest(self, prefix, limit):
+        self.threads.append(threading.get_ident())
+        return [prefix + " policy"]
+
+    def top(self, window, limit):
+        self.threads.append(threading.get_ident())
+        return [{"query": "vacation policy", "count": 3}]
+
+@pytest.fixture
+def index(monkeypatch):
+    recording = RecordingIndex()
+    monkeypatch.setattr(app, "suggestion_index", recording)
+    monkeypatch.setattr(app, "popular_queries", recording)
+    monkeypatch.setattr(app, "redis_breaker", CircuitBreaker("redis", open_seconds=60))
+    return recording
+
+async def call(handler, **params):
+    return await handler(**params), threading.get_ident()
+
+def test_suggestions_are_looked_up_off_the_event_loop(index):
+    response, loop_thread = asyncio.run(call(app.get_search_suggestions, prefix="vacation", limit=5))
+    assert response["suggestions"] == ["vacation policy"]
+    assert index.threads and loop_thread not in index.threads
+
+def test_popular_queries_are_looked_up_off_the_event_loop(index):
+    response, loop_thread = asyncio.run(call(app.get_popular_queries, window="hour", limit=5))
+    assert response["popular_queries"] == [{"query": "vacation policy", "count": 3}]
+    assert index.threads and loop_thread not in index.threads
+
+def test_open_redis_circuit_skips_lookups(index):
+    app.redis_breaker._transition(OPEN)
+    suggestions, _ = asyncio.run(call(app.get_search_suggestions, prefix="vacation", limit=5))
+    popular, _ = asyncio.run(call(app.get_popular_queries, window="day", limit=5))
+    assert suggestions["suggestions"] == []
+    assert popular["popular_queries"] == []
+    assert index.threads == []
+
+def test_unknown_popular_window_is_rejected(index):
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(call(app.get_popular_queries, window="week", limit=5))
+    assert error.value.status_code == 400
+    assert app.redis_breaker.stats["rejected"] == 0
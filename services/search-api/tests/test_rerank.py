@@ -0,0 +1,73 @@
+"""재순위화 배치 처리 테스트 (FakeReranker 사용)"""
+
+import asyncio
+import gc
+import time
+
+from rerank import FakeReranker, RerankBatcher, create_reranker
+
+def candidates(*texts):
+    return [{"chunk_text": text, "score": 1.0 - index * 0.1} for index, text in enumerate(texts)]
+
+def test_rerank_orders_by_score():
+    batcher = RerankBatcher(FakeReranker())
+    results, reranked = asyncio.run(batcher.rerank(
+        "vacation policy", candidates("parking rules", "vacation policy details", "policy index"), 1.0
+    ))
+    assert reranked
+    assert [result["chunk_text"] for result in results] == [
+        "vacation policy details", "policy index", "parking rules"
+    ]
+    assert results[0]["rerank_score"] == 2.0
+
+def test_concurrent_requests_share_a_batch():
+    reranker = FakeReranker()
+    batcher = RerankBatcher(reranker, max_wait_seconds=0.01)
+
+    async def run():
+        return await asyncio.gather(*[
+            batcher.rerank(f"query {i}", candidates("a", f"query {i}"), 1.0) for i in range(5)
+        ])
+
+    results = asyncio.run(run())
+    assert all(reranked for _, reranked in results)
+    assert reranker.calls == 1
+    assert batcher.stats["batches"] == 1
+
+def test_budget_exceeded_keeps_ann_order():
+    batcher = RerankBatcher(FakeReranker(delay_seconds=0.2))
+    original = candidates("parking rules", "vacation policy")
+    results, reranked = asyncio.run(batcher.rerank("vacation policy", original, 0.02))
+    assert not reranked
+    assert results == original
+    assert batcher.stats["timeouts"] == 1
+
+def test_create_reranker_fake():
+    assert isinstance(create_reranker("fake"), FakeReranker)
+
+def test_single_candidate_counts_as_reranked():
+    batcher = RerankBatcher(FakeReranker())
+    original = candidates("vacation policy")
+    results, reranked = asyncio.run(batcher.rerank("vacation policy", original, 1.0))
+    assert reranked
+    assert results == original
+    assert batcher.stats["requests"] == 0
+
+def test_abandoned_scoring_failure_is_retrieved():
+    class FailingReranker(FakeReranker):
+        def score_batch(self, requests):
+            time.sleep(0.05)
+            raise RuntimeError("model unavailable")
+
+    batcher = RerankBatcher(FailingReranker())
+    unretrieved = []
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unretrieved.append(context))
+        _, reranked = await batcher.rerank("vacation policy", candidates("a", "b"), 0.01)
+        await asyncio.sleep(0.1)
+        return reranked
+
+    assert not asyncio.run(run())
+    gc.collect()
+    assert unretrieved == []
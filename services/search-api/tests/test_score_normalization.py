@@ -0,0 +1,52 @@
+"""점수 정규화 테스트 (공간 유형별 원시 점수 <-> 코사인 유사도)"""
+
+import math
+import random
+
+import pytest
+
+from score_normalization import cosine_to_raw_score, raw_score_to_cosine
+
+ENCODINGS = [
+    {"space_type": "l2", "knn_engine": "faiss"},
+    {"space_type": "innerproduct", "knn_engine": "faiss"},
+    {"space_type": "cosinesimil", "knn_engine": "nmslib"},
+    {"space_type": "cosinesimil", "knn_engine": "lucene"},
+    {"space_type": "l2", "knn_engine": "lucene", "vector_encoding": "byte", "byte_scale": 127.0},
+]
+
+def unit(vector):
+    norm = math.sqrt(sum(value * value for value in vector))
+    return [value / norm for value in vector]
+
+def opensearch_score(a, b, encoding):
+    """OpenSearch k-NN 점수 산식 (단위 벡터 기준, byte 인코딩은 byte_scale 배)"""
+    scale = encoding.get("byte_scale", 1.0) if encoding.get("vector_encoding") == "byte" else 1.0
+    a = [value * scale for value in a]
+    b = [value * scale for value in b]
+    inner_product = sum(x * y for x, y in zip(a, b))
+    if encoding["space_type"] == "l2":
+        return 1 / (1 + sum((x - y) ** 2 for x, y in zip(a, b)))
+    if encoding["space_type"] == "innerproduct":
+        return inner_product + 1 if inner_product >= 0 else 1 / (1 - inner_product)
+    cosine = inner_product / (scale * scale)
+    return (2 - (1 - cosine)) / 2 if encoding["knn_engine"] == "lucene" else 2 - (1 - cosine)
+
+@pytest.mark.parametrize("encoding", ENCODINGS, ids=lambda e: f"{e['space_type']}-{e['knn_engine']}")
+def test_raw_score_converts_to_cosine(encoding):
+    rng = random.Random(7)
+    for _ in range(20):
+        a = unit([rng.uniform(-1, 1) for _ in range(64)])
+        b = unit([x + rng.uniform(-1, 1) for x in a])
+        cosine = sum(x * y for x, y in zip(a, b))
+        assert raw_score_to_cosine(opensearch_score(a, b, encoding), encoding) == pytest.approx(cosine, abs=1e-6)
+
+@pytest.mark.parametrize("encoding", ENCODINGS, ids=lambda e: f"{e['space_type']}-{e['knn_engine']}")
+@pytest.mark.parametrize("cosine", [-0.9, -0.2, 0.0, 0.5, 0.95])
+def test_threshold_round_trip(encoding, cosine):
+    assert raw_score_to_cosine(cosine_to_raw_score(cosine, encoding), encoding) == pytest.approx(cosine, abs=1e-6)
+
+def test_threshold_is_monotonic():
+    encoding = {"space_type": "l2"}
+    thresholds = [cosine_to_raw_score(c / 10, encoding) for c in range(-10, 11)]
+    assert thresholds == sorted(thresholds)
@@ -0,0 +1,79 @@
+"""요청 기한 + 요청 병합 통합 테스트 (실제 search_documents 경로, OpenSearch는 가짜 클라이언트)"""
+
+import asyncio
+
+import pytest
+
+import app
+import deadline
+from circuit_breaker import OPEN, CircuitBreaker
+
+class SlowOpenSearch:
+    """지정한 지연 후 히트 한 건을 반환하는 OpenSearch 클라이언트"""
+
+    def __init__(self, delay_seconds: float):
+        self.delay_seconds = delay_seconds
+        self.calls = 0
+        self.cancelled = 0
+        self.request_timeouts = []
+
+    async def search(self, index, body, request_timeout=None, **kwargs):
+        self.calls += 1
+        self.request_timeouts.append(request_timeout)
+        try:
+            await asyncio.sleep(self.delay_seconds)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return {"hits": {"hits": [{"_score": 3.0, "_source": {
+            "doc_id": "doc-1", "chunk_index": 0, "chunk_text": "vacation policy"
+        }}]}}
+
+@pytest.fixture
+def opensearch(monkeypatch):
+    client = SlowOpenSearch(delay_seconds=0.2)
+    monkeypatch.setattr(app, "opensearch_client", client)
+    monkeypatch.setattr(app, "search_flight", app.SingleFlight())
+    monkeypatch.setattr(app, "semantic_cache", None)
+    monkeypatch.setattr(app, "rerank_batcher", None)
+    # 캐시 없이 검색 단계만 확인 (Redis 서킷을 열어 캐시 조회/저장을 건너뜀)
+    redis_breaker = CircuitBreaker("redis", open_seconds=60)
+    redis_breaker._transition(OPEN)
+    monkeypatch.setattr(app, "redis_breaker", redis_breaker)
+    return client
+
+async def search(budget_seconds: float, delay_seconds: float = 0.0):
+    await asyncio.sleep(delay_seconds)
+    token = deadline.start(budget_seconds)
+    try:
+        return await app.search_documents(app.SearchRequest(query="vacation policy", mode="keyword"))
+    finally:
+        deadline.reset(token)
+
+def test_slow_stage_is_bounded_by_the_request_deadline(opensearch):
+    response = asyncio.run(search(0.05))
+    assert response.degraded == "deadline_exceeded"
+    assert response.results == []
+    # 단계 타임아웃은 남은 시간으로 제한되고, 공유 작업도 기한에 맞춰 취소됨
+    assert opensearch.request_timeouts[0] <= 0.05
+    assert opensearch.cancelled == 1
+
+def test_follower_with_longer_budget_gets_full_results(opensearch):
+    async def run():
+        return await asyncio.gather(search(0.05), search(1.0, delay_seconds=0.01))
+
+    leader, follower = asyncio.run(run())
+    assert leader.degraded == "deadline_exceeded"
+    assert follower.degraded is None
+    assert [result.doc_id for result in follower.results] == ["doc-1"]
+    assert opensearch.calls == 2
+    assert app.search_flight.stats["retries"] == 1
+
+def test_followers_within_budget_share_one_search(opensearch):
+    async def run():
+        return await asyncio.gather(*[search(1.0) for _ in range(4)])
+
+    responses = asyncio.run(run())
+    assert opensearch.calls == 1
+    assert sorted(response.coalesced for response in responses) == [False, True, True, True]
+    assert all(response.total_results == 1 for response in responses)
@@ -0,0 +1,142 @@
+"""요청 병합(single-flight) 테스트"""
+
+import asyncio
+import threading
+
+import pytest
+
+import deadline
+from singleflight import RedisLease, SingleFlight
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def run():
+        return await asyncio.gather(*[flight.do("key", compute) for _ in range(5)])
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert [result for result, _ in results] == ["result"] * 5
+    assert sorted(coalesced for _, coalesced in results) == [False] + [True] * 4
+    assert flight.snapshot() == {"leaders": 1, "followers": 4, "retries": 0, "in_flight": 0}
+
+def test_error_is_shared_and_key_is_released():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("backend down")
+
+    async def run():
+        return await asyncio.gather(*[flight.do("key", fail) for _ in range(3)], return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in asyncio.run(run()))
+    assert not flight.in_flight
+
+def test_leader_cancellation_does_not_cancel_followers():
+    flight = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def run():
+        leader = asyncio.create_task(flight.do("key", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()) == ("result", True)
+
+def test_shared_call_runs_with_the_leader_deadline():
+    flight = SingleFlight()
+
+    async def compute():
+        return deadline.remaining()
+
+    async def run():
+        token = deadline.start(0.5)
+        try:
+            return await flight.do("key", compute)
+        finally:
+            deadline.reset(token)
+
+    remaining, coalesced = asyncio.run(run())
+    assert 0 < remaining <= 0.5
+    assert not coalesced
+
+def test_follower_retries_when_leader_result_is_not_reusable():
+    """리더가 자신의 기한 초과로 실패하면 팔로워는 자신의 기한으로 다시 실행"""
+    flight = SingleFlight()
+
+    async def compute():
+        await deadline.bounded(asyncio.sleep(0.05), "stage")
+        return "result"
+
+    async def call(budget_seconds):
+        token = deadline.start(budget_seconds)
+        try:
+            return await flight.do("key", compute, retry_on=(deadline.DeadlineExceeded,))
+        finally:
+            deadline.reset(token)
+
+    async def run():
+        leader = asyncio.create_task(call(0.01))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(call(1.0))
+        with pytest.raises(deadline.DeadlineExceeded):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()) == ("result", False)
+    assert flight.stats == {"leaders": 2, "followers": 1, "retries": 1}
+
+def test_partial_result_is_not_shared():
+    flight = SingleFlight()
+    results = iter(["partial", "full"])
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        return next(results)
+
+    async def run():
+        return await asyncio.gather(*[
+            flight.do("key", compute, reusable=lambda result: result != "partial") for _ in range(3)
+        ])
+
+    leader, *followers = asyncio.run(run())
+    assert leader == ("partial", False)
+    assert sorted(followers) == [("full", False), ("full", True)]
+
+def test_lease_wait_polls_redis_off_the_event_loop():
+    class HeldLock:
+        def __init__(self):
+            self.threads = set()
+
+        def exists(self, key):
+            self.threads.add(threading.get_ident())
+            return 1
+
+    redis_client = HeldLock()
+    lease = RedisLease(redis_client)
+    fetch_threads = []
+
+    def fetch():
+        fetch_threads.append(threading.get_ident())
+        return "cached" if len(fetch_threads) == 2 else None
+
+    async def run():
+        return await lease.wait_for("key", fetch, 1.0, poll_seconds=0.01), threading.get_ident()
+
+    value, loop_thread = asyncio.run(run())
+    assert value == "cached"
+    assert loop_thread not in fetch_threads
+    assert redis_client.threads and loop_thread not in redis_client.threads
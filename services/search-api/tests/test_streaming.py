@@ -0,0 +1,24 @@
+"""스트리밍 응답 테스트 (하이라이트 스니펫, 본문 축약)"""
+
+from streaming import highlight_snippet, truncate_text
+
+def test_highlight_wraps_query_terms():
+    assert highlight_snippet("Vacation policy for employees", "vacation") == "<em>Vacation</em> policy for employees"
+
+def test_highlight_escapes_markup_in_source_text():
+    text = 'policy <script>alert("x")</script> & <b>policy</b>'
+    snippet = highlight_snippet(text, "policy")
+    assert "<script>" not in snippet and "<b>" not in snippet
+    assert snippet == (
+        "<em>policy</em> &lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt; &amp; "
+        "&lt;b&gt;<em>policy</em>&lt;/b&gt;"
+    )
+
+def test_highlight_does_not_tag_inside_entities():
+    assert highlight_snippet("R&D amp budget", "amp") == "R&amp;D <em>amp</em> budget"
+
+def test_highlight_without_match_returns_none():
+    assert highlight_snippet("Vacation policy", "salary") is None
+
+def test_truncate_prefers_word_boundary():
+    assert truncate_text("annual leave policy details", 22) == "annual leave policy…"
@@ -0,0 +1,68 @@
+"""트레이싱 테스트 (메모리 내보내기, Kafka 헤더 전파, 내보내기 파일 정리)"""
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.util._once import Once
+
+import tracing
+
+@pytest.fixture
+def enabled(monkeypatch):
+    """트레이싱 활성화 (전역 트레이서 프로바이더는 테스트마다 초기화)"""
+    monkeypatch.setattr(tracing, "JAEGER_ENABLED", True)
+    monkeypatch.setattr(tracing, "JAEGER_ENDPOINT", None)
+    monkeypatch.setattr(tracing, "TRACE_EXPORT_FILE", None)
+    monkeypatch.setattr(trace, "_TRACER_PROVIDER_SET_ONCE", Once())
+    monkeypatch.setattr(trace, "_TRACER_PROVIDER", None)
+    yield
+    tracing.shutdown_tracing()
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.setattr(tracing, "JAEGER_ENABLED", False)
+    assert not tracing.init_tracing("test-service", "1.0.0")
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+def test_disabled_without_export_target(enabled):
+    assert not tracing.init_tracing("test-service", "1.0.0")
+    assert not trace.get_tracer_provider().get_tracer("test").start_span("search").is_recording()
+
+def test_spans_are_exported_to_memory(enabled, exporter):
+    assert tracing.init_tracing("test-service", "1.0.0", exporter=exporter)
+    with tracing.start_span("search", kind="server", query="policy", ignored=None) as span:
+        tracing.set_attributes(span, results=3)
+
+    spans = exporter.get_finished_spans()
+    assert [span.name for span in spans] == ["search"]
+    assert spans[0].kind == trace.SpanKind.SERVER
+    assert dict(spans[0].attributes) == {"query": "policy", "results": 3}
+    assert spans[0].resource.attributes["service.name"] == "test-service"
+
+def test_kafka_headers_continue_the_trace(enabled, exporter):
+    tracing.init_tracing("test-service", "1.0.0", exporter=exporter)
+    with tracing.start_span("produce", kind="producer"):
+        headers = tracing.kafka_headers()
+        trace_id = tracing.current_trace_id()
+
+    assert [key for key, _ in headers] == ["traceparent"]
+    with tracing.start_span("consume", parent=tracing.context_from_kafka(headers), kind="consumer"):
+        assert tracing.current_trace_id() == trace_id
+
+    producer, consumer = exporter.get_finished_spans()
+    assert consumer.parent.span_id == producer.context.span_id
+
+def test_export_file_is_closed_on_shutdown(enabled, monkeypatch, tmp_path):
+    export_file = tmp_path / "spans.jsonl"
+    monkeypatch.setattr(tracing, "TRACE_EXPORT_FILE", str(export_file))
+    tracing.init_tracing("test-service", "1.0.0")
+    with tracing.start_span("index"):
+        pass
+    trace_file = tracing._trace_file
+
+    tracing.shutdown_tracing()
+    assert trace_file.closed
+    assert tracing._trace_file is None
+    assert '"name": "index"' in export_file.read_text(encoding="utf-8")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+캐시 예열 모듈
+배포 직후나 인덱스 변경 직후 캐시가 비어 지연 시간이 튀지 않도록
+최근 인기 검색어를 제한된 속도로 검색 경로에 재생하는 기능 제공
+
+- 시작 시 예열이 끝나기 전까지 ready=False (준비 상태 확인에 사용)
+- 실행은 한 번에 하나씩 (이미 실행 중이면 대기 후 실행)
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+
+class CacheWarmer:
+    """인기 검색어 재생 기반 캐시 예열기"""
+
+    def __init__(self, warm_query: Callable[[str], Awaitable[Any]], rate_per_second: float = 5.0):
+        self.warm_query = warm_query
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self.ready = False
+        self.generation: Optional[str] = None
+        self.lock = asyncio.Lock()
+        self.stats: Dict[str, Any] = {
+            "runs": 0,
+            "queries": 0,
+            "errors": 0,
+            "last_reason": None,
+            "last_run_at": None,
+            "last_duration_ms": None
+        }
+
+    async def run(self, queries: List[str], reason: str, timeout_seconds: Optional[float] = None) -> Dict[str, int]:
+        """검색어를 순서대로 재생 (timeout_seconds 초과 시 남은 검색어는 건너뜀)"""
+        async with self.lock:
+            started = time.monotonic()
+            deadline = started + timeout_seconds if timeout_seconds else None
+            result = {"queries": 0, "errors": 0, "skipped": 0}
+
+            for position, query in enumerate(queries):
+                if deadline and time.monotonic() >= deadline:
+                    result["skipped"] = len(queries) - position
+                    break
+                try:
+                    await self.warm_query(query)
+                    result["queries"] += 1
+                except Exception as e:
+                    result["errors"] += 1
+                    logger.warning(f"캐시 예열 실패: '{query}' - {e}")
+                if self.interval:
+                    await asyncio.sleep(self.interval)
+
+            duration_ms = int((time.monotonic() - started) * 1000)
+            self.stats["runs"] += 1
+            self.stats["queries"] += result["queries"]
+            self.stats["errors"] += result["errors"]
+            self.stats.update(last_reason=reason, last_run_at=time.time(), last_duration_ms=duration_ms)
+            logger.info(f"캐시 예열 완료 ({reason}): {result}, {duration_ms}ms")
+            return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """예열 상태"""
+        return dict(self.stats, ready=self.ready, generation=self.generation, running=self.lock.locked())
@@ -17,6 +17,9 @@ from pydantic import BaseModel
 from confluent_kafka import Producer, Consumer, KafkaError
 from loguru import logger
 
+from pipeline_metrics import PipelineStats, message_timestamp
+import tracing
+
 # 기존 bedrock-test의 텍스트 추출 로직을 마이크로서비스로 재구성
 from text_extractors import (
     extract_from_txt,
@@ -29,6 +32,7 @@ from text_extractors import (
 # 설정
 KAFKA_BOOTSTRAP_SERVERS = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
+KAFKA_STATS_INTERVAL_MS = int(os.getenv("KAFKA_STATS_INTERVAL_MS", "5000"))
 SERVICE_NAME = "text-extraction-service"
 SERVICE_VERSION = "1.0.0"
 
@@ -48,6 +52,9 @@ kafka_producer = Producer({
     'client.id': f'{SERVICE_NAME}-producer'
 })
 
+# 컨슈머 랙, 처리 중 문서, 대기/처리 시간 통계
+pipeline_stats = PipelineStats()
+
 # 데이터 모델
 class DocumentProcessRequest(BaseModel):
     s3_bucket: str
@@ -82,12 +89,11 @@ async def health_check():
 # 메트릭 엔드포인트
 @app.get("/metrics")
 async def get_metrics():
-    """서비스 메트릭 (Prometheus 형식)"""
-    # TODO: 실제 메트릭 구현
+    """서비스 메트릭 (컨슈머 랙, 처리 중 문서, 대기/처리 시간)"""
     return {
-        "processed_documents_total": 0,
-        "processing_time_seconds": 0.0,
-        "errors_total": 0
+        "processed_documents_total": pipeline_stats.handled,
+        "errors_total": pipeline_stats.failed,
+        "pipeline": pipeline_stats.snapshot()
     }
 
 # 메인 텍스트 추출 엔드포인트
@@ -137,84 +143,96 @@ async def process_document_async(
     s3_bucket: str,
     s3_key: str, 
     doc_id: str,
-    metadata: Dict
+    metadata: Dict,
+    ingested_at: Optional[str] = None
 ):
-    """비동기 문서 처리"""
-    try:
-        # 1. S3에서 문서 다운로드
-        logger.info(f"S3에서 문서 다운로드: {s3_bucket}/{s3_key}")
-        
-        response = s3_client.get_object(Bucket=s3_bucket, Key=s3_key)
-        file_content = response['Body'].read()
-        
-        # 2. 파일 확장자에 따른 텍스트 추출
-        file_extension = s3_key.lower().split('.')[-1]
-        
-        if file_extension == 'txt':
-            text = extract_from_txt(file_content)
-        elif file_extension == 'md':
-            text = extract_from_md(file_content)
-        elif file_extension == 'pdf':
-            text = extract_from_pdf(file_content)
-        elif file_extension in ['docx', 'doc']:
-            text = extract_from_docx(file_content)
-        else:
-            raise ValueError(f"지원하지 않는 파일 형식: {file_extension}")
-        
-        if not text.strip():
-            raise ValueError("추출된 텍스트가 비어있습니다")
-        
-        # 3. 텍스트 청킹
-        chunks = chunk_text(text, chunk_size=1000, overlap=100)
-        
-        logger.info(f"텍스트 추출 완료: {doc_id}, 청크 수: {len(chunks)}")
-        
-        # 4. Kafka로 결과 전송
-        kafka_message = {
-            "doc_id": doc_id,
-            "s3_bucket": s3_bucket,
-            "s3_key": s3_key,
-            "original_text": text,
-            "chunks": chunks,
-            "chunks_count": len(chunks),
-            "metadata": metadata,
-            "extracted_at": datetime.utcnow().isoformat(),
-            "service": SERVICE_NAME,
-            "service_version": SERVICE_VERSION
-        }
-        
-        # text-extracted 토픽으로 전송
-        kafka_producer.produce(
-            topic='text-extracted',
-            key=doc_id,
-            value=json.dumps(kafka_message, ensure_ascii=False)
-        )
-        
-        kafka_producer.flush()  # 즉시 전송 보장
-        
-        logger.info(f"Kafka 전송 완료: {doc_id}")
-        
-    except Exception as e:
-        logger.error(f"문서 처리 실패: {doc_id} - {str(e)}")
-        
-        # 에러를 Kafka 에러 토픽으로 전송
-        error_message = {
-            "doc_id": doc_id,
-            "s3_bucket": s3_bucket,
-            "s3_key": s3_key,
-            "error": str(e),
-            "error_at": datetime.utcnow().isoformat(),
-            "service": SERVICE_NAME,
-            "service_version": SERVICE_VERSION
-        }
-        
-        kafka_producer.produce(
-            topic='processing-errors',
-            key=doc_id,
-            value=json.dumps(error_message, ensure_ascii=False)
-        )
-        
-        kafka_producer.flush()
+    """비동기 문서 처리 (ingested_at: 업로드 이벤트 시각, 없으면 처리 시작 시각)"""
+    ingested_at = ingested_at or datetime.utcnow().isoformat()
+    with tracing.start_span("text_extraction.process", doc_id=doc_id, s3_key=s3_key), pipeline_stats.track():
+        try:
+            # 1. S3에서 문서 다운로드
+            logger.info(f"S3에서 문서 다운로드: {s3_bucket}/{s3_key}")
+            
+            with tracing.start_span("s3.get_object", kind="client") as span:
+                response = s3_client.get_object(Bucket=s3_bucket, Key=s3_key)
+                file_content = response['Body'].read()
+                tracing.set_attributes(span, size_bytes=len(file_content))
+            
+            # 2. 파일 확장자에 따른 텍스트 추출
+            file_extension = s3_key.lower().split('.')[-1]
+            
+            with tracing.start_span("text_extraction.extract", file_extension=file_extension):
+                if file_extension == 'txt':
+                    text = extract_from_txt(file_content)
+                elif file_extension == 'md':
+                    text = extract_from_md(file_content)
+                elif file_extension == 'pdf':
+                    text = extract_from_pdf(file_content)
+                elif file_extension in ['docx', 'doc']:
+                    text = extract_from_docx(file_content)
+                else:
+                    raise ValueError(f"지원하지 않는 파일 형식: {file_extension}")
+            
+            if not text.strip():
+                raise ValueError("추출된 텍스트가 비어있습니다")
+            
+            # 3. 텍스트 청킹
+            with tracing.start_span("text_extraction.chunk", text_length=len(text)) as span:
+                chunks = chunk_text(text, chunk_size=1000, overlap=100)
+                tracing.set_attributes(span, chunks_count=len(chunks))
+            
+            logger.info(f"텍스트 추출 완료: {doc_id}, 청크 수: {len(chunks)}")
+            
+            # 4. Kafka로 결과 전송
+            kafka_message = {
+                "doc_id": doc_id,
+                "s3_bucket": s3_bucket,
+                "s3_key": s3_key,
+                "original_text": text,
+                "chunks": chunks,
+                "chunks_count": len(chunks),
+                "metadata": metadata,
+                "ingested_at": ingested_at,
+                "extracted_at": datetime.utcnow().isoformat(),
+                "service": SERVICE_NAME,
+                "service_version": SERVICE_VERSION
+            }
+            
+            # text-extracted 토픽으로 전송 (트레이스 컨텍스트는 메시지 헤더로 전파)
+            kafka_producer.produce(
+                topic='text-extracted',
+                key=doc_id,
+                value=json.dumps(kafka_message, ensure_ascii=False),
+                headers=tracing.kafka_headers()
+            )
+            
+            kafka_producer.flush()  # 즉시 전송 보장
+            
+            logger.info(f"Kafka 전송 완료: {doc_id}")
+            
+        except Exception as e:
+            logger.error(f"문서 처리 실패: {doc_id} - {str(e)}")
+            pipeline_stats.record_failure()
+            
+            # 에러를 Kafka 에러 토픽으로 전송
+            error_message = {
+                "doc_id": doc_id,
+                "s3_bucket": s3_bucket,
+                "s3_key": s3_key,
+                "error": str(e),
+                "error_at": datetime.utcnow().isoformat(),
+                "service": SERVICE_NAME,
+                "service_version": SERVICE_VERSION
+            }
+            
+            kafka_producer.produce(
+                topic='processing-errors',
+                key=doc_id,
+                value=json.dumps(error_message, ensure_ascii=False),
+                headers=tracing.kafka_headers()
+            )
+            
+            kafka_producer.flush()
 
 # Kafka 이벤트 리스너 (S3 업로드 이벤트 수신)
 async def kafka_consumer_task():
@@ -222,7 +240,9 @@ async def kafka_consumer_task():
     consumer = Consumer({
         'bootstrap.servers': KAFKA_BOOTSTRAP_SERVERS,
         'group.id': 'text-extraction-service-group',
-        'auto.offset.reset': 'latest'
+        'auto.offset.reset': 'latest',
+        'statistics.interval.ms': KAFKA_STATS_INTERVAL_MS,
+        'stats_cb': pipeline_stats.on_kafka_stats
     })
     
     consumer.subscribe(['doc-ingestion'])
@@ -249,11 +269,19 @@ async def kafka_consumer_task():
                 s3_bucket = event_data.get('s3_bucket')
                 s3_key = event_data.get('s3_key')
                 metadata = event_data.get('metadata', {})
+                ingested_at = event_data.get('ingested_at') or message_timestamp(msg)
+                pipeline_stats.record_queue_wait(msg)
                 
                 logger.info(f"새 문서 처리 요청 수신: {doc_id}")
                 
-                # 비동기 처리
-                await process_document_async(s3_bucket, s3_key, doc_id, metadata)
+                # 비동기 처리 (업로드 이벤트의 트레이스에 이어서 기록)
+                with tracing.start_span(
+                    "kafka.consume doc-ingestion",
+                    parent=tracing.context_from_kafka(msg.headers()),
+                    kind="consumer",
+                    doc_id=doc_id
+                ):
+                    await process_document_async(s3_bucket, s3_key, doc_id, metadata, ingested_at)
                 
             except Exception as e:
                 logger.error(f"Kafka 메시지 처리 오류: {str(e)}")
@@ -266,6 +294,7 @@ async def kafka_consumer_task():
 async def startup_event():
     """애플리케이션 시작 시 실행"""
     logger.info(f"{SERVICE_NAME} v{SERVICE_VERSION} 시작")
+    tracing.init_tracing(SERVICE_NAME, SERVICE_VERSION)
     
     # Kafka 컨슈머를 백그라운드 태스크로 실행
     asyncio.create_task(kafka_consumer_task())
@@ -275,6 +304,7 @@ async def shutdown_event():
     """애플리케이션 종료 시 실행"""
     logger.info(f"{SERVICE_NAME} 종료")
     kafka_producer.close()
+    tracing.shutdown_tracing()
 
 if __name__ == "__main__":
     uvicorn.run(
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+분산 트레이싱 모듈
+OpenTelemetry 스팬 생성과 Kafka 메시지 헤더를 통한 트레이스 컨텍스트 전파 기능 제공
+
+- JAEGER_ENABLED=true일 때만 스팬을 기록 (그 외에는 컨텍스트 전파만 하는 no-op 스팬)
+- 내보내기 대상: JAEGER_ENDPOINT(OTLP/HTTP) > TRACE_EXPORT_FILE(JSON lines)
+  (둘 다 없으면 경고 후 비활성화, 테스트는 init_tracing의 exporter 인자로 내보내기를 지정)
+- opentelemetry 미설치 시 트레이싱 없이 동작
+- 서비스마다 같은 파일을 둠 (서비스별 Docker 빌드 컨텍스트, 수정 시 모든 사본을 함께 변경해야 하며 search-api/tests/test_module_copies.py에서 검사)
+"""
+
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from loguru import logger
+
+try:
+    from opentelemetry import propagate, trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SimpleSpanProcessor
+    from opentelemetry.trace import SpanKind
+    OTEL_AVAILABLE = True
+except ImportError:
+    OTEL_AVAILABLE = False
+
+JAEGER_ENABLED = os.getenv("JAEGER_ENABLED", "false").lower() == "true"
+JAEGER_ENDPOINT = os.getenv("JAEGER_ENDPOINT")
+TRACE_EXPORT_FILE = os.getenv("TRACE_EXPORT_FILE")
+
+# TRACE_EXPORT_FILE 파일 핸들 (shutdown_tracing에서 닫음)
+_trace_file = None
+
+_tracer_name = "enterprise-rag"
+
+def init_tracing(service_name: str, service_version: str, exporter: Optional[Any] = None) -> bool:
+    """트레이서 프로바이더 초기화 (활성화된 경우 True)
+
+    exporter: 테스트용 내보내기 (예: InMemorySpanExporter, 지정 시 스팬을 즉시 동기 내보내기)
+    """
+    global _trace_file, _tracer_name
+    _tracer_name = service_name
+    if not JAEGER_ENABLED:
+        return False
+    if not OTEL_AVAILABLE:
+        logger.warning("opentelemetry가 설치되지 않아 트레이싱을 사용할 수 없습니다")
+        return False
+    if exporter is None and not JAEGER_ENDPOINT and not TRACE_EXPORT_FILE:
+        logger.warning("JAEGER_ENDPOINT/TRACE_EXPORT_FILE이 설정되지 않아 트레이스를 내보내지 않습니다")
+        return False
+
+    provider = TracerProvider(resource=Resource.create({
+        "service.name": service_name,
+        "service.version": service_version
+    }))
+
+    if exporter is not None:
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+    elif JAEGER_ENDPOINT:
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=JAEGER_ENDPOINT)))
+            logger.info(f"트레이스 내보내기: {JAEGER_ENDPOINT}")
+        except ImportError:
+            logger.warning("OTLP 내보내기 패키지가 없어 트레이스를 내보내지 않습니다")
+    elif TRACE_EXPORT_FILE:
+        _trace_file = open(TRACE_EXPORT_FILE, "a", encoding="utf-8")
+        provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter(
+            out=_trace_file,
+            formatter=lambda span: span.to_json(indent=None) + "\n"
+        )))
+        logger.info(f"트레이스 내보내기: {TRACE_EXPORT_FILE}")
+
+    trace.set_tracer_provider(provider)
+    return True
+
+def shutdown_tracing():
+    """남은 스팬 내보내기 및 내보내기 파일 닫기"""
+    global _trace_file
+    if OTEL_AVAILABLE:
+        provider = trace.get_tracer_provider()
+        if hasattr(provider, "shutdown"):
+            provider.shutdown()
+    if _trace_file is not None:
+        _trace_file.close()
+        _trace_file = None
+
+@contextmanager
+def start_span(
+    name: str,
+    parent: Optional[Any] = None,
+    kind: Optional[str] = None,
+    **attributes
+) -> Iterator[Optional[Any]]:
+    """현재 컨텍스트(또는 parent 컨텍스트)의 자식 스팬 시작
+
+    kind: "consumer", "producer", "server", "client" (기본 internal)
+    예외는 스팬에 기록된 뒤 그대로 전파됨
+    """
+    if not OTEL_AVAILABLE:
+        yield None
+        return
+
+    span_kind = getattr(SpanKind, kind.upper()) if kind else SpanKind.INTERNAL
+    with trace.get_tracer(_tracer_name).start_as_current_span(
+        name,
+        context=parent,
+        kind=span_kind,
+        attributes={key: value for key, value in attributes.items() if value is not None}
+    ) as span:
+        yield span
+
+def set_attributes(span: Optional[Any], **attributes):
+    """스팬 속성 추가 (트레이싱 비활성화 시 무시)"""
+    if span is not None and span.is_recording():
+        span.set_attributes({key: value for key, value in attributes.items() if value is not None})
+
+def kafka_headers() -> List[Tuple[str, bytes]]:
+    """현재 트레이스 컨텍스트를 Kafka 메시지 헤더로 변환 (W3C traceparent)"""
+    if not OTEL_AVAILABLE:
+        return []
+    carrier: Dict[str, str] = {}
+    propagate.inject(carrier)
+    return [(key, value.encode("utf-8")) for key, value in carrier.items()]
+
+def context_from_kafka(headers: Optional[List[Tuple[str, bytes]]]) -> Optional[Any]:
+    """Kafka 메시지 헤더에서 상위 트레이스 컨텍스트 추출 (헤더가 없으면 None)"""
+    if not headers:
+        return None
+    return context_from_headers({
+        key: value.decode("utf-8") if isinstance(value, bytes) else value
+        for key, value in headers
+        if value is not None
+    })
+
+def context_from_headers(headers: Mapping[str, str]) -> Optional[Any]:
+    """HTTP 요청 헤더(traceparent)에서 상위 트레이스 컨텍스트 추출"""
+    if not OTEL_AVAILABLE:
+        return None
+    return propagate.extract(headers)
+
+def current_trace_id() -> Optional[str]:
+    """현재 스팬의 트레이스 ID (16진수, 없으면 None)"""
+    if not OTEL_AVAILABLE:
+        return None
+    span_context = trace.get_current_span().get_span_context()
+    if not span_context.is_valid:
+        return None
+    return format(span_context.trace_id, "032x")
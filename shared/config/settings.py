@@ -17,6 +17,7 @@ class KafkaSettings(BaseSettings):
     text_extracted_topic: str = "text-extracted"
     embeddings_generated_topic: str = "embeddings-generated"
     index_ready_topic: str = "index-ready"
+    doc_deleted_topic: str = "doc-deleted"
     search_queries_topic: str = "search-queries"
     search_results_topic: str = "search-results"
     processing_errors_topic: str = "processing-errors"